@@ -0,0 +1,156 @@
+#!/usr/bin/env python3
+# SPDX-FileCopyrightText: 2024-present Adam Fourney <adamfo@microsoft.com>
+#
+# SPDX-License-Identifier: MIT
+"""
+Micro-benchmark of the converter dispatch overhead in MarkItDown._convert.
+
+For every file in tests/test_files, this measures the time spent outside the
+converter that finally accepts the file (rejected attempts, option copies, etc.),
+once with the legacy dispatch (every candidate extension, duplicates included,
+times every registered converter) and once with the extension-indexed dispatch.
+Candidate discovery (puremagic) is excluded, as it is the same for both.
+
+Usage:
+    python benchmarks/bench_dispatch.py [--repeat N]
+"""
+import argparse
+import copy
+import os
+import re
+import sys
+import time
+
+from markitdown import MarkItDown
+from markitdown._markitdown import DocumentConverter
+
+TEST_FILES_DIR = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), "..", "tests", "test_files"
+)
+
+
+class _TimedConverter(DocumentConverter):
+    """Wraps a converter, recording the time spent in accepted and rejected attempts."""
+
+    def __init__(self, converter):
+        self._converter = converter
+        self.supported_extensions = converter.supported_extensions
+        self.supported_mimetypes = converter.supported_mimetypes
+        self.attempts = 0
+        self.accepted_time = 0.0
+
+    def convert(self, local_path, **kwargs):
+        self.attempts += 1
+        start = time.perf_counter()
+        res = self._converter.convert(local_path, **kwargs)
+        if res is not None:
+            self.accepted_time += time.perf_counter() - start
+        return res
+
+
+class _LegacyDispatchMarkItDown(MarkItDown):
+    """Reproduces the dispatch that predates the extension index."""
+
+    def _append_ext(self, extensions, ext):
+        if ext is None:
+            return
+        ext = ext.strip()
+        if ext == "":
+            return
+        extensions.append(ext)
+
+    def _get_converters_for_extension(self, ext):
+        return self._page_converters
+
+    def _convert(self, local_path, extensions, **kwargs):
+        # Emulate the per-attempt deep copy of the options
+        for ext in extensions + [None]:
+            for converter in self._page_converters:
+                _kwargs = copy.deepcopy(kwargs)
+                if ext is not None:
+                    _kwargs["file_extension"] = ext
+                _kwargs["_parent_converters"] = self._page_converters
+                try:
+                    res = converter.convert(local_path, **_kwargs)
+                except Exception:
+                    res = None
+                if res is not None:
+                    res.text_content = "\n".join(
+                        [line.rstrip() for line in re.split(r"\r?\n", res.text_content)]
+                    )
+                    res.text_content = re.sub(r"\n{3,}", "\n\n", res.text_content)
+                    return res
+        return None
+
+
+def _instrument(markitdown):
+    timed = [_TimedConverter(c) for c in markitdown._page_converters]
+    markitdown._page_converters[:] = timed
+    markitdown._converter_index.clear()
+    return timed
+
+
+def _candidates(markitdown, path):
+    """The candidate extensions, as MarkItDown.convert_local would compute them."""
+    extensions = []
+    markitdown._append_ext(extensions, os.path.splitext(path)[1])
+    for g in markitdown._guess_ext_magic(path):
+        markitdown._append_ext(extensions, g)
+    return extensions
+
+
+def _measure(markitdown_class, path, repeat):
+    """Returns (attempts per conversion, mean dispatch overhead in seconds)."""
+    markitdown = markitdown_class()
+    timed = _instrument(markitdown)
+    extensions = _candidates(markitdown, path)
+
+    def _run():
+        try:
+            markitdown._convert(path, list(extensions))
+        except BaseException:
+            pass
+
+    _run()  # Warm up (imports, caches, the converter index)
+    for t in timed:
+        t.attempts = 0
+        t.accepted_time = 0.0
+
+    total = 0.0
+    for _ in range(repeat):
+        start = time.perf_counter()
+        _run()
+        total += time.perf_counter() - start
+    accepted = sum(t.accepted_time for t in timed)
+    attempts = sum(t.attempts for t in timed)
+    return attempts // repeat, (total - accepted) / repeat
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    print(
+        f"{'file':<28} {'attempts':>15} {'legacy ms':>10} {'indexed ms':>10} {'speedup':>8}"
+    )
+    legacy_sum = indexed_sum = 0.0
+    for name in sorted(os.listdir(TEST_FILES_DIR)):
+        path = os.path.join(TEST_FILES_DIR, name)
+        legacy_attempts, legacy = _measure(_LegacyDispatchMarkItDown, path, args.repeat)
+        indexed_attempts, indexed = _measure(MarkItDown, path, args.repeat)
+        legacy_sum += legacy
+        indexed_sum += indexed
+        speedup = legacy / indexed if indexed > 0 else float("inf")
+        print(
+            f"{name:<28} {legacy_attempts:>7} -> {indexed_attempts:<5} "
+            f"{legacy * 1000:>10.3f} {indexed * 1000:>10.3f} {speedup:>7.1f}x"
+        )
+    print(
+        f"{'total':<28} {'':>15} {legacy_sum * 1000:>10.3f} {indexed_sum * 1000:>10.3f}"
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
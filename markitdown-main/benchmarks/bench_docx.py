@@ -0,0 +1,220 @@
+#!/usr/bin/env python3
+# SPDX-FileCopyrightText: 2024-present Adam Fourney <adamfo@microsoft.com>
+#
+# SPDX-License-Identifier: MIT
+"""
+Comparison of DocxConverter's streaming path with the mammoth/HTML path.
+
+Generates a large .docx (headings, formatted paragraphs, links, nested lists and tables
+with merged cells), then converts it with both paths, each in a fresh process, and
+reports the time and the peak RSS of each, and whether the outputs are identical.
+
+Usage:
+    python benchmarks/bench_docx.py [--sections 2000]
+"""
+import argparse
+import json
+import os
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+import zipfile
+from xml.sax.saxutils import escape
+
+from markitdown import MarkItDown
+
+_NAMESPACES = (
+    'xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main" '
+    'xmlns:r="http://schemas.openxmlformats.org/officeDocument/2006/relationships"'
+)
+
+_CONTENT_TYPES = """<?xml version="1.0" encoding="UTF-8" standalone="yes"?>
+<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">
+<Default Extension="rels" ContentType="application/vnd.openxmlformats-package.relationships+xml"/>
+<Default Extension="xml" ContentType="application/xml"/>
+<Override PartName="/word/document.xml" ContentType="application/vnd.openxmlformats-officedocument.wordprocessingml.document.main+xml"/>
+<Override PartName="/word/styles.xml" ContentType="application/vnd.openxmlformats-officedocument.wordprocessingml.styles+xml"/>
+<Override PartName="/word/numbering.xml" ContentType="application/vnd.openxmlformats-officedocument.wordprocessingml.numbering+xml"/>
+</Types>"""
+
+_PACKAGE_RELATIONSHIPS = """<?xml version="1.0" encoding="UTF-8" standalone="yes"?>
+<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">
+<Relationship Id="rId1" Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/officeDocument" Target="word/document.xml"/>
+</Relationships>"""
+
+_DOCUMENT_RELATIONSHIPS = """<?xml version="1.0" encoding="UTF-8" standalone="yes"?>
+<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">
+<Relationship Id="rId1" Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/styles" Target="styles.xml"/>
+<Relationship Id="rId2" Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/numbering" Target="numbering.xml"/>
+<Relationship Id="rId3" Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/hyperlink" Target="https://example.com/docs/page_1.html" TargetMode="External"/>
+</Relationships>"""
+
+_STYLES = f"""<?xml version="1.0" encoding="UTF-8" standalone="yes"?>
+<w:styles {_NAMESPACES}>
+<w:style w:type="paragraph" w:styleId="Normal"><w:name w:val="Normal"/></w:style>
+<w:style w:type="paragraph" w:styleId="Heading1"><w:name w:val="heading 1"/></w:style>
+<w:style w:type="paragraph" w:styleId="Heading2"><w:name w:val="heading 2"/></w:style>
+<w:style w:type="character" w:styleId="Strong"><w:name w:val="Strong"/></w:style>
+</w:styles>"""
+
+_NUMBERING = f"""<?xml version="1.0" encoding="UTF-8" standalone="yes"?>
+<w:numbering {_NAMESPACES}>
+<w:abstractNum w:abstractNumId="0">
+<w:lvl w:ilvl="0"><w:numFmt w:val="bullet"/></w:lvl>
+<w:lvl w:ilvl="1"><w:numFmt w:val="bullet"/></w:lvl>
+<w:lvl w:ilvl="2"><w:numFmt w:val="decimal"/></w:lvl>
+</w:abstractNum>
+<w:abstractNum w:abstractNumId="1"><w:lvl w:ilvl="0"><w:numFmt w:val="decimal"/></w:lvl></w:abstractNum>
+<w:num w:numId="1"><w:abstractNumId w:val="0"/></w:num>
+<w:num w:numId="2"><w:abstractNumId w:val="1"/></w:num>
+</w:numbering>"""
+
+
+def _run(text, properties=""):
+    rpr = f"<w:rPr>{properties}</w:rPr>" if properties else ""
+    return f'<w:r>{rpr}<w:t xml:space="preserve">{escape(text)}</w:t></w:r>'
+
+
+def _paragraph(content, style=None, numbering=None):
+    ppr = ""
+    if style is not None:
+        ppr += f'<w:pStyle w:val="{style}"/>'
+    if numbering is not None:
+        ppr += f'<w:numPr><w:ilvl w:val="{numbering[1]}"/><w:numId w:val="{numbering[0]}"/></w:numPr>'
+    return f"<w:p>{'<w:pPr>' + ppr + '</w:pPr>' if ppr else ''}{content}</w:p>"
+
+
+def _cell(text, properties=""):
+    tcpr = f"<w:tcPr>{properties}</w:tcPr>" if properties else ""
+    return f"<w:tc>{tcpr}{_paragraph(_run(text))}</w:tc>"
+
+
+def _section(i):
+    """The body XML of one section of the generated document."""
+    parts = [
+        _paragraph(_run(f"Section {i}: results_{i} & notes"), style="Heading1"),
+        _paragraph(
+            _run(f"Paragraph {i} has ")
+            + _run("bold", "<w:b/>")
+            + _run(" and ")
+            + _run("italic text", "<w:i/>")
+            + _run(", a ")
+            + f'<w:hyperlink r:id="rId3">{_run("link")}</w:hyperlink>'
+            + _run(" and some *special* characters: 1. [x] <y> #")
+            + _run("\tafter a tab")
+            + "<w:r><w:br/></w:r>"
+            + _run("strong words", '<w:rStyle w:val="Strong"/>')
+            + _run(" struck", "<w:strike/>")
+        ),
+        _paragraph(_run(f"Details {i}"), style="Heading2"),
+        _paragraph(_run("First point"), numbering=(1, 0)),
+        _paragraph(_run("Nested point"), numbering=(1, 1)),
+        _paragraph(_run("Numbered detail"), numbering=(1, 2)),
+        _paragraph(_run("Second point"), numbering=(1, 0)),
+        _paragraph(_run("Step one"), numbering=(2, 0)),
+        _paragraph(_run("Step two"), numbering=(2, 0)),
+        "<w:tbl><w:tblPr/><w:tblGrid/>"
+        + "<w:tr>"
+        + _cell("Name")
+        + _cell("Value", '<w:gridSpan w:val="2"/>')
+        + "</w:tr>"
+        + "<w:tr>"
+        + _cell(f"row_{i}", '<w:vMerge w:val="restart"/>')
+        + _cell(str(i))
+        + _cell(f"{i}.5")
+        + "</w:tr>"
+        + "<w:tr>"
+        + _cell("", "<w:vMerge/>")
+        + _cell("a|b")
+        + _cell("")
+        + "</w:tr>"
+        + "</w:tbl>",
+        _paragraph(_run(f"Closing paragraph {i}.")),
+    ]
+    return "".join(parts)
+
+
+def make_docx(path, sections):
+    """Write a generated .docx of the given number of sections."""
+    with zipfile.ZipFile(path, "w", zipfile.ZIP_DEFLATED) as docx:
+        docx.writestr("[Content_Types].xml", _CONTENT_TYPES)
+        docx.writestr("_rels/.rels", _PACKAGE_RELATIONSHIPS)
+        docx.writestr("word/_rels/document.xml.rels", _DOCUMENT_RELATIONSHIPS)
+        docx.writestr("word/styles.xml", _STYLES)
+        docx.writestr("word/numbering.xml", _NUMBERING)
+        with docx.open("word/document.xml", "w") as fh:
+            fh.write(
+                f'<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+                f"<w:document {_NAMESPACES}><w:body>".encode("utf-8")
+            )
+            for i in range(sections):
+                fh.write(_section(i).encode("utf-8"))
+            fh.write(b"<w:sectPr/></w:body></w:document>")
+
+
+def _convert(path, docx_streaming, output_path):
+    """Convert in this (fresh) process, and print the time and peak RSS as JSON."""
+    start = time.perf_counter()
+    result = MarkItDown().convert(path, docx_streaming=docx_streaming)
+    elapsed = time.perf_counter() - start
+    with open(output_path, "wt", encoding="utf-8") as fh:
+        fh.write(result.text_content)
+    peak_kb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    print(json.dumps({"seconds": elapsed, "peak_rss": peak_kb * 1024}))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--sections", type=int, default=2000)
+    parser.add_argument("--convert", nargs=3, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.convert:
+        path, docx_streaming, output_path = args.convert
+        _convert(path, docx_streaming == "True", output_path)
+        return 0
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        path = os.path.join(tmpdir, "bench.docx")
+        make_docx(path, args.sections)
+        with zipfile.ZipFile(path) as docx:
+            xml_size = docx.getinfo("word/document.xml").file_size
+        print(
+            f"{args.sections} sections, {os.path.getsize(path) / 1024**2:.1f} MiB "
+            f"({xml_size / 1024**2:.1f} MiB of document.xml)"
+        )
+
+        print(f"{'path':<12} {'seconds':>8} {'peak RSS MiB':>13}")
+        outputs = {}
+        for name, docx_streaming in [("mammoth", False), ("streaming", True)]:
+            output_path = os.path.join(tmpdir, f"{name}.md")
+            measurement = json.loads(
+                subprocess.run(
+                    [
+                        sys.executable,
+                        __file__,
+                        "--convert",
+                        path,
+                        str(docx_streaming),
+                        output_path,
+                    ],
+                    check=True,
+                    capture_output=True,
+                    text=True,
+                ).stdout
+            )
+            print(
+                f"{name:<12} {measurement['seconds']:>8.2f} "
+                f"{measurement['peak_rss'] / 1024**2:>13.1f}"
+            )
+            with open(output_path, "rt", encoding="utf-8") as fh:
+                outputs[name] = fh.read()
+
+    print("Identical output:", outputs["mammoth"] == outputs["streaming"])
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,126 @@
+#!/usr/bin/env python3
+# SPDX-FileCopyrightText: 2024-present Adam Fourney <adamfo@microsoft.com>
+#
+# SPDX-License-Identifier: MIT
+"""
+Comparison of the HTML parsers, and of body-only and shared parsing, on the test pages.
+
+For each page (test_wikipedia.html, test_blog.html and test_serp.html), reports the time to:
+
+- parse the whole document with html.parser (as every HTML converter used to), and only its
+  title and body, with each installed parser;
+- convert the page with MarkItDown, with the "quality" and "fast" html_parser profiles, and
+  whether the outputs are identical;
+- try WikipediaConverter, then HtmlConverter, on the page (as MarkItDown does when the first
+  fails), with and without sharing the parsed document.
+
+Each time is the best of REPEAT runs.
+
+Usage:
+    python benchmarks/bench_html.py [--repeat 5]
+"""
+import argparse
+import os
+import sys
+import time
+
+from markitdown import MarkItDown
+from markitdown._markitdown import (
+    HtmlConverter,
+    WikipediaConverter,
+    _HTML_PARSERS,
+    _HtmlDocuments,
+    _get_html_parser,
+    _parse_html,
+)
+
+TEST_FILES_DIR = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), "..", "tests", "test_files"
+)
+
+PAGES = [
+    ("test_wikipedia.html", "https://en.wikipedia.org/wiki/Microsoft"),
+    ("test_blog.html", None),
+    ("test_serp.html", "https://www.bing.com/search?q=microsoft+wikipedia"),
+]
+
+
+def _best_time(repeat, function):
+    """The best time of repeat calls, and the result of the last one."""
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = function()
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best, result
+
+
+def _try_converters(path, shared):
+    """Convert a page with WikipediaConverter then HtmlConverter, like a fallback would."""
+    kwargs = {
+        "file_extension": ".html",
+        "url": "https://en.wikipedia.org/wiki/Microsoft",
+    }
+    if shared:
+        kwargs["_html_documents"] = _HtmlDocuments()
+    WikipediaConverter().convert(path, **kwargs)
+    return HtmlConverter().convert(path, **kwargs)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    parsers = []
+    for name in _HTML_PARSERS:
+        try:
+            parsers.append(_get_html_parser(name))
+        except ValueError:
+            print(f"{name} is not installed, skipped")
+    print(f"The fast profile uses {_get_html_parser('fast')}\n")
+
+    markitdown = MarkItDown()
+    for name, url in PAGES:
+        path = os.path.join(TEST_FILES_DIR, name)
+        with open(path, "rt", encoding="utf-8") as fh:
+            html_content = fh.read()
+        print(f"{name} ({len(html_content) / 1024:.0f} KiB)")
+
+        elapsed, _ = _best_time(
+            args.repeat, lambda: _parse_html(html_content, {"html_parser": "quality"})
+        )
+        print(f"  {'parse, whole document, html.parser':<44} {elapsed * 1000:>8.1f} ms")
+        for html_parser in parsers:
+            elapsed, _ = _best_time(
+                args.repeat,
+                lambda: _parse_html(
+                    html_content, {"html_parser": html_parser}, body_only=True
+                ),
+            )
+            label = f"parse, title and body, {html_parser}"
+            print(f"  {label:<44} {elapsed * 1000:>8.1f} ms")
+
+        texts = {}
+        for profile in ["quality", "fast"]:
+            kwargs = {"html_parser": profile}
+            if url is not None:
+                kwargs["url"] = url
+            elapsed, result = _best_time(
+                args.repeat, lambda: markitdown.convert(path, **kwargs)
+            )
+            texts[profile] = result.text_content
+            label = f"convert, {profile}"
+            print(f"  {label:<44} {elapsed * 1000:>8.1f} ms")
+        print(f"  Same output: {texts['quality'] == texts['fast']}")
+
+        for shared in [False, True]:
+            elapsed, _ = _best_time(args.repeat, lambda: _try_converters(path, shared))
+            label = "Wikipedia, then HTML, " + ("shared" if shared else "not shared")
+            print(f"  {label:<44} {elapsed * 1000:>8.1f} ms")
+        print()
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+# SPDX-FileCopyrightText: 2024-present Adam Fourney <adamfo@microsoft.com>
+#
+# SPDX-License-Identifier: MIT
+"""
+Conversion of a large synthetic notebook, whose outputs are mostly base64 images.
+
+Writes a notebook of CELLS code cells, each with an image output of IMAGE_KIB KiB (and a line of
+stdout), to a temporary file, and reports the time and peak (Python) memory of:
+
+- parsing it with json.load (which IpynbConverter used to do before converting anything);
+- converting it with MarkItDown, with and without ipynb_text_outputs;
+- reading up to the first converted cell with convert_iter.
+
+Usage:
+    python benchmarks/bench_ipynb.py [--cells 200] [--image-kib 512]
+"""
+import argparse
+import base64
+import json
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+
+from markitdown import MarkItDown
+
+
+def write_notebook(path, cells, image_kib):
+    """Write a synthetic notebook, one cell at a time."""
+    image = base64.b64encode(os.urandom(image_kib * 768)).decode("ascii")
+    with open(path, "wt", encoding="utf-8") as fh:
+        fh.write('{"cells": [\n')
+        for i in range(cells):
+            cell = {
+                "cell_type": "code" if i % 4 else "markdown",
+                "metadata": {},
+                "source": [f"# Cell {i}\n", f"plot(data[{i}])"],
+            }
+            if i % 4:
+                cell["execution_count"] = i
+                cell["outputs"] = [
+                    {"output_type": "stream", "name": "stdout", "text": [f"{i}\n"]},
+                    {
+                        "output_type": "display_data",
+                        "data": {"image/png": image, "text/plain": ["<Figure>"]},
+                        "metadata": {},
+                    },
+                ]
+            fh.write(("," if i else "") + json.dumps(cell) + "\n")
+        fh.write('], "metadata": {}, "nbformat": 4, "nbformat_minor": 5}\n')
+
+
+def measure(function):
+    """The time, and the peak memory allocated by Python, of a call."""
+    tracemalloc.start()
+    start = time.perf_counter()
+    result = function()
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return elapsed, peak, result
+
+
+def _json_load(path):
+    with open(path, "rt", encoding="utf-8") as fh:
+        return json.load(fh)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--cells", type=int, default=200)
+    parser.add_argument("--image-kib", type=int, default=512)
+    args = parser.parse_args()
+
+    markitdown = MarkItDown()
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        path = os.path.join(tmp_dir, "notebook.ipynb")
+        write_notebook(path, args.cells, args.image_kib)
+        print(f"{args.cells} cells, {os.path.getsize(path) / 1024**2:.1f} MiB\n")
+
+        rows = [
+            ("json.load (the old first step)", lambda: _json_load(path)),
+            ("convert", lambda: markitdown.convert(path)),
+            (
+                "convert, ipynb_text_outputs=1000",
+                lambda: markitdown.convert(path, ipynb_text_outputs=1000),
+            ),
+            ("convert_iter, first cell", lambda: next(markitdown.convert_iter(path))),
+        ]
+        for label, function in rows:
+            elapsed, peak, _ = measure(function)
+            print(f"  {label:<36} {elapsed:>8.2f} s {peak / 1024**2:>10.1f} MiB")
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+# SPDX-FileCopyrightText: 2024-present Adam Fourney <adamfo@microsoft.com>
+#
+# SPDX-License-Identifier: MIT
+"""
+Comparison of the PDF engines of PdfConverter: throughput and text similarity.
+
+Converts every PDF in extracted_pdfs/ with each installed engine, and reports the
+throughput (pages per second), the speedup over pdfminer (the default engine), and
+the similarity of the text to pdfminer's. The similarity is the Dice coefficient
+of the character bigrams, ignoring whitespace, so it is insensitive to line breaks
+and spacing, but not to missing, garbled or reordered text.
+
+Usage:
+    python benchmarks/bench_pdf_engines.py [--engines pdfminer pdfium pypdf] [--pdf-dir DIR]
+"""
+import argparse
+import collections
+import os
+import re
+import sys
+import time
+
+from markitdown import MarkItDown
+from markitdown._markitdown import PdfConverter
+
+PDF_DIR = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), "..", "extracted_pdfs"
+)
+
+
+def _similarity(text, reference):
+    """The Dice coefficient of the character bigrams of two texts, ignoring whitespace."""
+    bigrams = []
+    for t in (text, reference):
+        t = re.sub(r"\s+", "", t)
+        bigrams.append(collections.Counter(t[i : i + 2] for i in range(len(t) - 1)))
+    total = sum(bigrams[0].values()) + sum(bigrams[1].values())
+    if total == 0:
+        return 1.0
+    return 2 * sum((bigrams[0] & bigrams[1]).values()) / total
+
+
+def _time_conversions(markitdown, paths, engine):
+    """Returns (seconds, outputs) for converting all paths."""
+    outputs = []
+    start = time.perf_counter()
+    for path in paths:
+        outputs.append(markitdown.convert(path, pdf_engine=engine).text_content)
+    return time.perf_counter() - start, outputs
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--engines", nargs="+", default=list(PdfConverter.engines))
+    parser.add_argument("--pdf-dir", default=PDF_DIR)
+    args = parser.parse_args()
+
+    paths = sorted(
+        os.path.join(args.pdf_dir, name)
+        for name in os.listdir(args.pdf_dir)
+        if name.lower().endswith(".pdf")
+    )
+    page_count = sum(PdfConverter.engines["pdfminer"].count_pages(p) for p in paths)
+    print(f"{len(paths)} PDFs, {page_count} pages")
+
+    markitdown = MarkItDown()
+    reference_time, reference_outputs = _time_conversions(markitdown, paths, "pdfminer")
+
+    print(
+        f"{'engine':<10} {'seconds':>8} {'pages/s':>8} {'speedup':>8} {'similarity':>11} {'min':>6}"
+    )
+    for engine in args.engines:
+        if not PdfConverter.engines[engine].is_available():
+            print(f"{engine:<10} (not installed)")
+            continue
+        if engine == "pdfminer":
+            elapsed, outputs = reference_time, reference_outputs
+        else:
+            elapsed, outputs = _time_conversions(markitdown, paths, engine)
+        similarities = [
+            _similarity(output, reference)
+            for output, reference in zip(outputs, reference_outputs)
+        ]
+        print(
+            f"{engine:<10} {elapsed:>8.2f} {page_count / elapsed:>8.1f} "
+            f"{reference_time / elapsed:>7.2f}x {sum(similarities) / len(similarities):>11.3f} "
+            f"{min(similarities):>6.3f}"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+# SPDX-FileCopyrightText: 2024-present Adam Fourney <adamfo@microsoft.com>
+#
+# SPDX-License-Identifier: MIT
+"""
+Benchmark of page-parallel PDF extraction in PdfConverter.
+
+Converts every PDF in extracted_pdfs/ with an increasing number of worker
+processes, checks that the output matches the serial path, and reports the
+speedup over the serial path. Run it on a multi-core machine: the
+page slices of one document are extracted in separate processes.
+
+Usage:
+    python benchmarks/bench_pdf_parallel.py [--workers 1 2 4 8] [--pdf-dir DIR]
+"""
+import argparse
+import os
+import sys
+import time
+
+from markitdown import MarkItDown
+
+PDF_DIR = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), "..", "extracted_pdfs"
+)
+
+
+def _time_conversions(markitdown, paths, max_workers):
+    """Returns (seconds, outputs) for converting all paths."""
+    outputs = []
+    start = time.perf_counter()
+    for path in paths:
+        outputs.append(markitdown.convert(path, max_workers=max_workers).text_content)
+    return time.perf_counter() - start, outputs
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4, 8])
+    parser.add_argument("--pdf-dir", default=PDF_DIR)
+    args = parser.parse_args()
+
+    paths = sorted(
+        os.path.join(args.pdf_dir, name)
+        for name in os.listdir(args.pdf_dir)
+        if name.lower().endswith(".pdf")
+    )
+    print(f"{len(paths)} PDFs, {os.cpu_count()} CPUs")
+
+    markitdown = MarkItDown()
+    serial_time, serial_outputs = _time_conversions(markitdown, paths, None)
+
+    # pdfminer's layout analysis is not fully deterministic on some documents (even
+    # serially, the order of a few text boxes can change between runs), so outputs
+    # that only differ in the order of their lines are counted separately
+    print(
+        f"{'workers':>8} {'seconds':>10} {'speedup':>8} {'identical':>10} {'reordered':>10}"
+    )
+    print(f"{'serial':>8} {serial_time:>10.2f} {1.0:>7.2f}x {len(paths):>10} {0:>10}")
+
+    for workers in args.workers:
+        elapsed, outputs = _time_conversions(markitdown, paths, workers)
+        identical = reordered = 0
+        for output, serial_output in zip(outputs, serial_outputs):
+            if output == serial_output:
+                identical += 1
+            elif sorted(output.splitlines()) == sorted(serial_output.splitlines()):
+                reordered += 1
+        print(
+            f"{workers:>8} {elapsed:>10.2f} {serial_time / elapsed:>7.2f}x {identical:>10} {reordered:>10}"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+# SPDX-FileCopyrightText: 2024-present Adam Fourney <adamfo@microsoft.com>
+#
+# SPDX-License-Identifier: MIT
+"""
+Benchmark of slide-parallel conversion in PptxConverter.
+
+Generates presentations of several sizes (see generators.make_pptx), converts each serially and
+with an increasing number of worker processes (max_workers), checks that the outputs match, and
+reports the best time of each and its speedup over the serial path. Decks of fewer than
+_PPTX_PARALLEL_MIN_SLIDES slides are converted serially whatever max_workers is (pass
+--min-slides 2 to measure the pool on them anyway), and no more workers than CPUs are started.
+Run it on a multi-core machine: every worker loads the whole presentation, and converts one
+slice of its slides.
+
+Usage:
+    python benchmarks/bench_pptx.py [--slides 50 200 600 2000] [--workers 2 4 8] [--repeat 3]
+        [--min-slides N]
+"""
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+from generators import make_pptx
+
+from markitdown import MarkItDown
+from markitdown import _markitdown
+
+
+def _best_time(repeat, function):
+    """The best time of repeat calls, and the result of the last one."""
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = function()
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--slides", type=int, nargs="+", default=[50, 200, 600, 2000])
+    parser.add_argument("--workers", type=int, nargs="+", default=[2, 4, 8])
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--min-slides", type=int)
+    args = parser.parse_args()
+
+    if args.min_slides is not None:
+        _markitdown._PPTX_PARALLEL_MIN_SLIDES = args.min_slides
+    print(
+        f"{_markitdown._cpu_count()} CPUs, parallel from "
+        f"{_markitdown._PPTX_PARALLEL_MIN_SLIDES} slides\n"
+    )
+    print(
+        f"{'slides':>8} {'workers':>8} {'seconds':>10} {'speedup':>8} {'identical':>10}"
+    )
+
+    markitdown = MarkItDown()
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        for slides in args.slides:
+            path = os.path.join(tmp_dir, f"deck_{slides}.pptx")
+            make_pptx(path, slides)
+
+            serial_time, serial = _best_time(
+                args.repeat, lambda: markitdown.convert(path)
+            )
+            print(f"{slides:>8} {'serial':>8} {serial_time:>10.2f} {1.0:>7.2f}x")
+            for workers in args.workers:
+                elapsed, result = _best_time(
+                    args.repeat, lambda: markitdown.convert(path, max_workers=workers)
+                )
+                identical = result.text_content == serial.text_content
+                print(
+                    f"{slides:>8} {workers:>8} {elapsed:>10.2f} "
+                    f"{serial_time / elapsed:>7.2f}x {str(identical):>10}"
+                )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+# SPDX-FileCopyrightText: 2024-present Adam Fourney <adamfo@microsoft.com>
+#
+# SPDX-License-Identifier: MIT
+"""
+Conversion of a large synthetic RSS or Atom feed, streamed one item at a time.
+
+Writes a feed of ENTRIES items (plain text, HTML in CDATA, and escaped HTML descriptions) to a
+temporary file, and reports the time and peak (Python) memory of:
+
+- parsing it with xml.dom.minidom (which RSSConverter used to do before converting anything);
+- converting it with MarkItDown;
+- reading up to the first converted item with convert_iter.
+
+Usage:
+    python benchmarks/bench_rss.py [--entries 50000] [--format rss|atom]
+"""
+import argparse
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+from xml.dom import minidom
+
+from markitdown import MarkItDown
+
+
+def write_feed(path, entries, feed_format):
+    """Write a synthetic feed, with a mix of plain text and HTML item content."""
+    with open(path, "wt", encoding="utf-8") as fh:
+        if feed_format == "rss":
+            fh.write(
+                '<?xml version="1.0" encoding="utf-8"?>\n'
+                '<rss version="2.0" xmlns:content="http://purl.org/rss/1.0/modules/content/">'
+                "<channel><title>Synthetic feed</title><description>Benchmark</description>\n"
+            )
+        else:
+            fh.write(
+                '<?xml version="1.0" encoding="utf-8"?>\n'
+                '<feed xmlns="http://www.w3.org/2005/Atom">'
+                "<title>Synthetic feed</title><subtitle>Benchmark</subtitle>\n"
+            )
+
+        for i in range(entries):
+            if i % 3 == 0:
+                content = f"Plain text summary of item {i}, with no markup at all."
+            elif i % 3 == 1:
+                content = (
+                    f"<![CDATA[<p>Item <b>{i}</b> links to "
+                    f"<a href='https://example.com/{i}'>a page</a>.</p>]]>"
+                )
+            else:
+                content = f"&lt;p&gt;Escaped &lt;em&gt;HTML&lt;/em&gt; {i}&lt;/p&gt;"
+
+            if feed_format == "rss":
+                fh.write(
+                    f"<item><title>Item {i}</title>"
+                    f"<pubDate>Mon, 09 Dec 2024 20:26:59 +0000</pubDate>"
+                    f"<description>{content}</description></item>\n"
+                )
+            else:
+                fh.write(
+                    f"<entry><title>Item {i}</title><updated>2024-12-09T20:26:59Z</updated>"
+                    f"<summary>{content}</summary></entry>\n"
+                )
+
+        fh.write("</channel></rss>\n" if feed_format == "rss" else "</feed>\n")
+
+
+def measure(function):
+    """The time, and the peak memory allocated by Python, of a call."""
+    tracemalloc.start()
+    start = time.perf_counter()
+    result = function()
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return elapsed, peak, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--entries", type=int, default=50000)
+    parser.add_argument("--format", choices=["rss", "atom"], default="rss")
+    args = parser.parse_args()
+
+    markitdown = MarkItDown()
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        path = os.path.join(tmp_dir, "feed." + args.format)
+        write_feed(path, args.entries, args.format)
+        print(
+            f"{args.entries} entries, {os.path.getsize(path) / 1024**2:.1f} MiB "
+            f"({args.format})\n"
+        )
+
+        rows = [
+            ("minidom.parse (the old first step)", lambda: minidom.parse(path)),
+            ("convert", lambda: markitdown.convert(path)),
+            ("convert_iter, first item", lambda: next(markitdown.convert_iter(path))),
+        ]
+        for label, function in rows:
+            elapsed, peak, _ = measure(function)
+            print(f"  {label:<36} {elapsed:>8.2f} s {peak / 1024**2:>10.1f} MiB")
+
+
+if __name__ == "__main__":
+    sys.exit(main())
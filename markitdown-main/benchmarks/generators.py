@@ -0,0 +1,213 @@
+# SPDX-FileCopyrightText: 2024-present Adam Fourney <adamfo@microsoft.com>
+#
+# SPDX-License-Identifier: MIT
+"""
+Synthetic inputs for the benchmarks, generated offline and deterministically.
+
+Each generator writes a file of a given scale (pages, sections, rows, slides, ...) to a path.
+GENERATORS maps a format to its file extension, generator, and the scale of each size
+("small", "medium" and "large").
+"""
+import io
+import json
+import random
+import zipfile
+from xml.sax.saxutils import escape
+
+from bench_docx import make_docx
+from bench_ipynb import write_notebook
+from bench_rss import write_feed
+from bench_xlsx import make_workbook
+
+_WORDS = (
+    "markdown converter document page section table figure result analysis value "
+    "report summary method data model test sample output input stream memory time"
+).split()
+
+
+def _sentence(rng, words=12):
+    text = " ".join(rng.choice(_WORDS) for _ in range(words))
+    return text[0].upper() + text[1:] + "."
+
+
+def make_pdf(path, pages, lines_per_page=45):
+    """Write a PDF of the given number of pages of text (Helvetica, one line per text object)."""
+    rng = random.Random(pages)
+    objects = [
+        b"<< /Type /Catalog /Pages 2 0 R >>",
+        None,  # The page tree, once the pages are known
+        b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>",
+    ]
+    kids = []
+    for page in range(pages):
+        lines = [f"Page {page + 1}"] + [
+            _sentence(rng) for _ in range(lines_per_page - 1)
+        ]
+        content = "BT /F1 11 Tf 14 TL 56 780 Td\n"
+        for line in lines:
+            line = line.replace("\\", "\\\\").replace("(", "\\(").replace(")", "\\)")
+            content += f"({line}) Tj T*\n"
+        content += "ET"
+        stream = content.encode("latin-1")
+        objects.append(
+            b"<< /Length %d >>\nstream\n%s\nendstream" % (len(stream), stream)
+        )
+        objects.append(
+            b"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 842] "
+            b"/Resources << /Font << /F1 3 0 R >> >> /Contents %d 0 R >>" % len(objects)
+        )
+        kids.append(len(objects))
+    objects[1] = b"<< /Type /Pages /Kids [%s] /Count %d >>" % (
+        b" ".join(b"%d 0 R" % kid for kid in kids),
+        len(kids),
+    )
+
+    with open(path, "wb") as fh:
+        fh.write(b"%PDF-1.4\n")
+        offsets = []
+        for number, body in enumerate(objects, start=1):
+            offsets.append(fh.tell())
+            fh.write(b"%d 0 obj\n%s\nendobj\n" % (number, body))
+        xref = fh.tell()
+        fh.write(b"xref\n0 %d\n0000000000 65535 f \n" % (len(objects) + 1))
+        for offset in offsets:
+            fh.write(b"%010d 00000 n \n" % offset)
+        fh.write(
+            b"trailer\n<< /Size %d /Root 1 0 R >>\nstartxref\n%d\n%%%%EOF\n"
+            % (len(objects) + 1, xref)
+        )
+
+
+def make_pptx(path, slides):
+    """Write a presentation of the given number of slides, each with a title, bullets and a
+    small table."""
+    import pptx
+    from pptx.util import Inches
+
+    rng = random.Random(slides)
+    presentation = pptx.Presentation()
+    layout = presentation.slide_layouts[1]  # Title and content
+    for i in range(slides):
+        slide = presentation.slides.add_slide(layout)
+        slide.shapes.title.text = f"Slide {i}"
+        body = slide.placeholders[1].text_frame
+        body.text = _sentence(rng)
+        for _ in range(3):
+            body.add_paragraph().text = _sentence(rng, 8)
+        table = slide.shapes.add_table(
+            4, 3, Inches(1), Inches(5), Inches(6), Inches(1.5)
+        ).table
+        for r in range(4):
+            for c in range(3):
+                table.cell(r, c).text = f"Column {c}" if r == 0 else str(r * 3 + c)
+        slide.notes_slide.notes_text_frame.text = _sentence(rng)
+    presentation.save(path)
+
+
+def make_html(path, sections):
+    """Write an article of the given number of sections (headings, paragraphs with links and
+    emphasis, lists and tables), with some navigation and scripts around it."""
+    rng = random.Random(sections)
+    with open(path, "wt", encoding="utf-8") as fh:
+        fh.write(
+            "<!DOCTYPE html><html><head><title>Synthetic article</title>"
+            "<script>var tracking = {};</script><style>body { margin: 0 }</style>"
+            "</head><body><nav><a href='/'>Home</a> | <a href='/about'>About</a></nav>"
+            "<article><h1>Synthetic article</h1>\n"
+        )
+        for i in range(sections):
+            fh.write(
+                f"<h2>Section {i}</h2><p>{escape(_sentence(rng))} "
+                f"<a href='https://example.com/{i}'>A link</a>, <b>bold</b> and "
+                f"<em>emphasis</em>. {escape(_sentence(rng, 20))}</p>"
+                f"<ul><li>{_sentence(rng, 5)}</li><li>{_sentence(rng, 5)}"
+                f"<ol><li>Nested {i}</li></ol></li></ul>"
+                "<table><tr><th>Name</th><th>Value</th></tr>"
+                + "".join(
+                    f"<tr><td>row {r}</td><td>{r * i}</td></tr>" for r in range(5)
+                )
+                + "</table>\n"
+            )
+        fh.write("</article><footer>Footer</footer></body></html>\n")
+
+
+def make_text(path, lines):
+    """Write a CSV-like log of the given number of lines (UTF-8, with some non-ASCII text)."""
+    rng = random.Random(lines)
+    with open(path, "wt", encoding="utf-8") as fh:
+        fh.write("timestamp,level,message\n")
+        for i in range(lines):
+            level = rng.choice(["INFO", "WARN", "ERROR"])
+            fh.write(
+                f"2024-12-09T20:{i // 60 % 60:02d}:{i % 60:02d},{level},{_sentence(rng, 8)} café\n"
+            )
+
+
+def make_zip(path, members):
+    """Write a ZIP of the given number of members, cycling through HTML, CSV, notebook and DOCX
+    files (each of a small scale)."""
+    rng = random.Random(members)
+    with zipfile.ZipFile(path, "w", zipfile.ZIP_DEFLATED) as archive:
+        for i in range(members):
+            kind = i % 4
+            if kind == 0:
+                paragraphs = "".join(f"<p>{_sentence(rng)}</p>" for _ in range(20))
+                archive.writestr(
+                    f"pages/page_{i}.html",
+                    f"<html><head><title>Page {i}</title></head><body><h1>Page {i}</h1>"
+                    f"{paragraphs}</body></html>",
+                )
+            elif kind == 1:
+                rows = "".join(f"{r},{_sentence(rng, 4)}\n" for r in range(50))
+                archive.writestr(f"data/table_{i}.csv", "id,text\n" + rows)
+            elif kind == 2:
+                notebook = {
+                    "cells": [
+                        {
+                            "cell_type": "markdown",
+                            "metadata": {},
+                            "source": [f"# Notebook {i}"],
+                        },
+                        {
+                            "cell_type": "code",
+                            "execution_count": 1,
+                            "metadata": {},
+                            "outputs": [],
+                            "source": ["print(42)"],
+                        },
+                    ],
+                    "metadata": {},
+                    "nbformat": 4,
+                    "nbformat_minor": 5,
+                }
+                archive.writestr(f"notebooks/nb_{i}.ipynb", json.dumps(notebook))
+            else:
+                buffer = io.BytesIO()
+                make_docx(buffer, 5)
+                archive.writestr(f"docs/doc_{i}.docx", buffer.getvalue())
+
+
+def make_ipynb(path, cells):
+    write_notebook(path, cells, image_kib=64)
+
+
+def make_rss(path, entries):
+    write_feed(path, entries, "rss")
+
+
+def make_xlsx(path, rows):
+    make_workbook(path, rows, 10)
+
+
+# format: (extension, generator, {size: scale})
+GENERATORS = {
+    "pdf": (".pdf", make_pdf, {"small": 5, "medium": 50, "large": 250}),
+    "docx": (".docx", make_docx, {"small": 20, "medium": 200, "large": 2000}),
+    "xlsx": (".xlsx", make_xlsx, {"small": 200, "medium": 5000, "large": 50000}),
+    "pptx": (".pptx", make_pptx, {"small": 5, "medium": 50, "large": 250}),
+    "html": (".html", make_html, {"small": 20, "medium": 500, "large": 5000}),
+    "zip": (".zip", make_zip, {"small": 8, "medium": 100, "large": 1000}),
+    "ipynb": (".ipynb", make_ipynb, {"small": 20, "medium": 200, "large": 1000}),
+    "rss": (".rss", make_rss, {"small": 100, "medium": 5000, "large": 50000}),
+    "csv": (".csv", make_text, {"small": 1000, "medium": 50000, "large": 500000}),
+}
@@ -0,0 +1,283 @@
+#!/usr/bin/env python3
+# SPDX-FileCopyrightText: 2024-present Adam Fourney <adamfo@microsoft.com>
+#
+# SPDX-License-Identifier: MIT
+"""
+Benchmark suite of the converters: throughput, peak memory and startup time, on synthetic inputs.
+
+For each format (see generators.py) and size (small, medium, large), generates an input, then,
+in a fresh process:
+
+- converts it once with the format's converter (the first, cold, conversion includes the
+  imports of the converter's dependencies);
+- converts it REPEAT times with the converter called directly, and with MarkItDown.convert
+  (which adds the dispatch: extension guessing, converters that decline, normalization);
+- converts it once more with MarkItDown.convert, tracing the memory allocated by Python.
+
+It reports the best times, the throughput (input MiB per second), the dispatch overhead, the
+peak memory allocated by Python, and the peak RSS of the process. The startup time (importing
+markitdown, and creating a MarkItDown instance) is the best of REPEAT fresh processes.
+
+Results can be saved as JSON (--save), and compared with saved results (--baseline): times and
+peaks larger than the baseline's by more than THRESHOLD times are reported as regressions, and
+the exit code is then 1. Everything runs offline.
+
+Usage:
+    python benchmarks/run_suite.py [--formats pdf docx ...] [--sizes small medium large]
+        [--repeat 3] [--save results.json] [--baseline baseline.json] [--threshold 1.25]
+"""
+import argparse
+import datetime
+import json
+import os
+import platform
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+
+from generators import GENERATORS
+
+# The converter each format is dispatched to
+CONVERTERS = {
+    "pdf": "PdfConverter",
+    "docx": "DocxConverter",
+    "xlsx": "XlsxConverter",
+    "pptx": "PptxConverter",
+    "html": "HtmlConverter",
+    "zip": "ZipConverter",
+    "ipynb": "IpynbConverter",
+    "rss": "RSSConverter",
+    "csv": "PlainTextConverter",
+}
+
+SIZES = ["small", "medium", "large"]
+
+# The measurements compared with a baseline (lower is better)
+COMPARED = [
+    "converter_seconds",
+    "convert_seconds",
+    "python_peak",
+    "peak_rss",
+    "import_seconds",
+    "instance_seconds",
+]
+
+_STARTUP = """
+import json, time
+start = time.perf_counter()
+import markitdown
+imported = time.perf_counter()
+markitdown.MarkItDown()
+print(json.dumps({"import_seconds": imported - start,
+                  "instance_seconds": time.perf_counter() - imported}))
+"""
+
+
+def _best_time(repeat, function):
+    """The best time of repeat calls, and the result of the last one."""
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = function()
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best, result
+
+
+def _peak_rss():
+    """The peak RSS of this process, in bytes."""
+    # On Linux, ru_maxrss is kept across exec (it would include the parent's peak)
+    try:
+        with open("/proc/self/status", "rt") as fh:
+            for line in fh:
+                if line.startswith("VmHWM:"):
+                    return int(line.split()[1]) * 1024
+    except OSError:
+        pass
+    # Kilobytes on Linux, bytes on macOS
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak * (1 if sys.platform == "darwin" else 1024)
+
+
+def _run_case(format_name, path, repeat):
+    """Measure the conversions of one input in this (fresh) process, and print them as JSON."""
+    from markitdown import MarkItDown
+
+    extension = GENERATORS[format_name][0]
+    markitdown = MarkItDown()
+    converter = next(
+        c
+        for c in markitdown._page_converters
+        if type(c).__name__ == CONVERTERS[format_name]
+    )
+
+    def convert_directly():
+        kwargs = markitdown._get_converter_kwargs(file_extension=extension)
+        return converter.convert(path, **kwargs)
+
+    first_seconds, _ = _best_time(1, convert_directly)
+    converter_seconds, _ = _best_time(repeat, convert_directly)
+    convert_seconds, result = _best_time(repeat, lambda: markitdown.convert(path))
+
+    tracemalloc.start()
+    markitdown.convert(path)
+    _, python_peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    print(
+        json.dumps(
+            {
+                "input_size": os.path.getsize(path),
+                "output_size": len(result.text_content),
+                "first_seconds": first_seconds,
+                "converter_seconds": converter_seconds,
+                "convert_seconds": convert_seconds,
+                "python_peak": python_peak,
+                "peak_rss": _peak_rss(),
+            }
+        )
+    )
+
+
+def _measure_startup(repeat):
+    """The best import and MarkItDown() times of repeat fresh processes."""
+    best = {}
+    for _ in range(repeat):
+        measurement = json.loads(
+            subprocess.run(
+                [sys.executable, "-c", _STARTUP],
+                capture_output=True,
+                text=True,
+                check=True,
+            ).stdout
+        )
+        for key, value in measurement.items():
+            best[key] = min(best.get(key, value), value)
+    return best
+
+
+def _measure_case(tmp_dir, format_name, size, repeat):
+    """Generate the input of a case, and measure it in a fresh process."""
+    extension, generate, scales = GENERATORS[format_name]
+    path = os.path.join(tmp_dir, f"{format_name}_{size}{extension}")
+    generate(path, scales[size])
+    completed = subprocess.run(
+        [sys.executable, __file__, "--run", format_name, path, str(repeat)],
+        capture_output=True,
+        text=True,
+    )
+    os.remove(path)
+    if completed.returncode != 0:
+        return {"error": completed.stderr.strip().splitlines()[-1]}
+    measurement = json.loads(completed.stdout.strip().splitlines()[-1])
+    measurement["scale"] = scales[size]
+    return measurement
+
+
+def _print_case(name, measurement):
+    if "error" in measurement:
+        print(f"  {name:<14} FAILED: {measurement['error']}")
+        return
+    input_mib = measurement["input_size"] / 1024**2
+    print(
+        f"  {name:<14} {input_mib:>9.2f} {measurement['first_seconds']:>9.3f} "
+        f"{measurement['converter_seconds']:>9.3f} {measurement['convert_seconds']:>9.3f} "
+        f"{(measurement['convert_seconds'] - measurement['converter_seconds']) * 1000:>9.1f} "
+        f"{input_mib / max(measurement['convert_seconds'], 1e-9):>8.1f} "
+        f"{measurement['python_peak'] / 1024**2:>9.1f} {measurement['peak_rss'] / 1024**2:>8.1f}"
+    )
+
+
+def _compare(results, baseline, threshold):
+    """Print the measurements that regressed from the baseline's, and return their number."""
+    current = dict(results["cases"], startup=results["startup"])
+    previous = dict(baseline.get("cases", {}), startup=baseline.get("startup", {}))
+    regressions = 0
+    print(
+        f"\nCompared with {baseline['environment']['date']} (threshold {threshold}x):"
+    )
+    for name, measurement in current.items():
+        for key in COMPARED:
+            if key not in measurement or key not in previous.get(name, {}):
+                continue
+            before = previous[name][key]
+            ratio = measurement[key] / before if before else 1.0
+            if ratio > threshold:
+                regressions += 1
+                print(
+                    f"  REGRESSION {name} {key}: {before:.4g} -> {measurement[key]:.4g} "
+                    f"({ratio:.2f}x)"
+                )
+            elif ratio < 1 / threshold:
+                print(
+                    f"  improvement {name} {key}: {before:.4g} -> {measurement[key]:.4g} "
+                    f"({ratio:.2f}x)"
+                )
+    print(f"  {regressions} regressions")
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--formats", nargs="+", choices=list(GENERATORS))
+    parser.add_argument("--sizes", nargs="+", choices=SIZES, default=SIZES)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--save", help="write the results to this JSON file")
+    parser.add_argument("--baseline", help="compare the results with this JSON file")
+    parser.add_argument("--threshold", type=float, default=1.25)
+    parser.add_argument("--run", nargs=3, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.run:
+        format_name, path, repeat = args.run
+        _run_case(format_name, path, int(repeat))
+        return 0
+
+    from markitdown.__about__ import __version__
+
+    results = {
+        "environment": {
+            "date": datetime.datetime.now().isoformat(timespec="seconds"),
+            "markitdown": __version__,
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "cpus": os.cpu_count(),
+            "repeat": args.repeat,
+        },
+        "startup": _measure_startup(args.repeat),
+        "cases": {},
+    }
+    print(
+        f"Startup: import {results['startup']['import_seconds']:.3f}s, "
+        f"MarkItDown() {results['startup']['instance_seconds']:.3f}s\n"
+    )
+
+    print(
+        f"  {'case':<14} {'input MiB':>9} {'cold s':>9} {'direct s':>9} {'convert s':>9} "
+        f"{'dispatch':>9} {'MiB/s':>8} {'py peak':>9} {'RSS MiB':>8}"
+    )
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        for format_name in args.formats or list(GENERATORS):
+            for size in args.sizes:
+                name = f"{format_name}/{size}"
+                measurement = _measure_case(tmp_dir, format_name, size, args.repeat)
+                results["cases"][name] = measurement
+                _print_case(name, measurement)
+
+    if args.save:
+        with open(args.save, "wt", encoding="utf-8") as fh:
+            json.dump(results, fh, indent=2)
+
+    failures = sum("error" in m for m in results["cases"].values())
+    regressions = 0
+    if args.baseline:
+        with open(args.baseline, "rt", encoding="utf-8") as fh:
+            regressions = _compare(results, json.load(fh), args.threshold)
+    return 1 if failures or regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -2,10 +2,30 @@
 #
 # SPDX-License-Identifier: MIT
 
-from ._markitdown import MarkItDown, FileConversionException, UnsupportedFormatException
+from ._markitdown import (
+    MarkItDown,
+    AudioRecognizer,
+    CaptionCache,
+    ConversionCache,
+    ConversionMetrics,
+    ConversionTrace,
+    ExifTool,
+    HttpCache,
+    FileConversionException,
+    GoogleRecognizer,
+    UnsupportedFormatException,
+)
 
 __all__ = [
     "MarkItDown",
+    "AudioRecognizer",
+    "CaptionCache",
+    "ConversionCache",
+    "ConversionMetrics",
+    "ConversionTrace",
+    "ExifTool",
+    "HttpCache",
     "FileConversionException",
+    "GoogleRecognizer",
     "UnsupportedFormatException",
 ]
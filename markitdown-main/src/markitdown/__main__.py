@@ -3,7 +3,24 @@
 # SPDX-License-Identifier: MIT
 import sys
 import argparse
-from ._markitdown import MarkItDown
+import concurrent.futures
+import glob
+import os
+import time
+import traceback
+from typing import Any, Dict, List, Optional, Tuple
+from ._markitdown import (
+    MarkItDown,
+    ConversionMetrics,
+    ConversionTrace,
+    FileConversionException,
+    UnsupportedFormatException,
+)
+
+# The MarkItDown instance of a batch worker process (or of this process, when not using a pool),
+# and the recorder of its traces
+_worker_markitdown: Optional[MarkItDown] = None
+_worker_recorder: Optional["_TraceRecorder"] = None
 
 
 def main():
@@ -11,36 +28,315 @@ def main():
         description="Convert various file formats to markdown.",
         formatter_class=argparse.RawDescriptionHelpFormatter,
         usage="""
-SYNTAX: 
-    
+SYNTAX:
+
     markitdown <OPTIONAL: FILENAME>
     If FILENAME is empty, markitdown reads from stdin.
 
+    markitdown [-j JOBS] [-o OUTPUT_DIR] PATH [PATH ...]
+    Batch mode: each PATH can be a file, a directory (converted recursively) or a glob.
+
+    markitdown --serve [--host HOST] [--port PORT | --socket PATH] [--workers N] [--max-queue N]
+    Run a conversion server with a pool of warm workers (see the server options below).
+
 EXAMPLE:
-    
+
     markitdown example.pdf
-    
+
     OR
 
     cat example.pdf | markitdown
 
-    OR 
+    OR
 
     markitdown < example.pdf
+
+    OR
+
+    markitdown -j 4 -o markdown/ docs/ "slides/*.pptx"
+
+    OR
+
+    markitdown --profile -o markdown/ docs/
 """.strip(),
     )
 
-    parser.add_argument("filename", nargs="?")
+    parser.add_argument("paths", nargs="*")
+    parser.add_argument(
+        "-o",
+        "--output-dir",
+        help="write each result to OUTPUT_DIR, mirroring the input names with a .md extension",
+    )
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        default=1,
+        help="number of worker processes to convert files with (default: 1)",
+    )
+    parser.add_argument(
+        "--profile",
+        action="store_true",
+        help="print the converters attempted, and the time spent in each, to stderr",
+    )
+
+    server_options = parser.add_argument_group(
+        "server options",
+        "With --serve, run a local conversion server with a pool of warm MarkItDown workers. "
+        'POST a file\'s bytes (or a JSON object {"path": ...}) to /convert, and read back the Markdown.',
+    )
+    server_options.add_argument(
+        "--serve", action="store_true", help="run a conversion server"
+    )
+    server_options.add_argument("--host", default="127.0.0.1")
+    server_options.add_argument("--port", type=int, default=8000)
+    server_options.add_argument(
+        "--socket", help="listen on this Unix socket instead of HOST:PORT"
+    )
+    server_options.add_argument(
+        "--workers",
+        type=int,
+        default=os.cpu_count() or 1,
+        help="number of worker processes, i.e., of concurrent conversions (default: the number of CPUs)",
+    )
+    server_options.add_argument(
+        "--max-queue",
+        type=int,
+        default=16,
+        help="number of requests that can wait for a worker before the server answers 503 (default: 16)",
+    )
+    server_options.add_argument(
+        "--max-body-size",
+        type=int,
+        help="largest request body (uploaded file) in bytes, beyond which the server answers 413 (default: 256 MiB)",
+    )
     args = parser.parse_args()
 
-    if args.filename is None:
+    if args.serve:
+        if args.paths:
+            parser.error("--serve does not take paths")
+        _serve(args, parser)
+    elif len(args.paths) == 0:
         markitdown = MarkItDown()
-        result = markitdown.convert_stream(sys.stdin.buffer)
-        print(result.text_content)
-    else:
+        try:
+            result = markitdown.convert_stream(sys.stdin.buffer)
+            print(result.text_content)
+        finally:
+            if args.profile:
+                _print_profile(markitdown.stats())
+    elif (
+        len(args.paths) == 1
+        and args.output_dir is None
+        and not os.path.isdir(args.paths[0])
+        and not glob.has_magic(args.paths[0])
+    ):
         markitdown = MarkItDown()
-        result = markitdown.convert(args.filename)
-        print(result.text_content)
+        try:
+            result = markitdown.convert(args.paths[0])
+            print(result.text_content)
+        finally:
+            if args.profile:
+                _print_profile(markitdown.stats())
+    else:
+        sys.exit(_batch_convert(args.paths, args.output_dir, args.jobs, args.profile))
+
+
+def _serve(args: argparse.Namespace, parser: argparse.ArgumentParser) -> None:
+    """Run the conversion server with the server options, until interrupted."""
+    from ._server import serve
+
+    kwargs = {}
+    if args.max_body_size is not None:
+        kwargs["max_body_size"] = args.max_body_size
+    try:
+        serve(
+            host=args.host,
+            port=args.port,
+            socket_path=args.socket,
+            workers=args.workers,
+            max_queue=args.max_queue,
+            **kwargs,
+        )
+    except ValueError as e:
+        parser.error(str(e))
+
+
+def _batch_convert(
+    paths: List[str], output_dir: Optional[str], jobs: int, profile: bool = False
+) -> int:
+    """Convert many files, optionally with a pool of processes, and print a summary to stderr
+    (and with profile, the aggregated traces of the conversions, see _print_profile).
+    Returns the exit code: 0 if every file was converted, 1 otherwise."""
+    tasks = _expand_paths(paths, output_dir)
+    if len(tasks) == 0:
+        print("No files to convert.", file=sys.stderr)
+        return 1
+
+    metrics = ConversionMetrics()
+    start = time.perf_counter()
+    if jobs > 1:
+        with concurrent.futures.ProcessPoolExecutor(
+            max_workers=jobs, initializer=_init_worker
+        ) as executor:
+            results = executor.map(_convert_file, tasks)
+            outcomes = _collect(results, output_dir, metrics)
+    else:
+        _init_worker()
+        outcomes = _collect(map(_convert_file, tasks), output_dir, metrics)
+    elapsed = time.perf_counter() - start
+
+    # Summary
+    failures = [o for o in outcomes if o[2] is not None]
+    print("\nSummary:", file=sys.stderr)
+    for path, seconds, error in outcomes:
+        status = "ok" if error is None else "FAILED"
+        print(f"  {seconds:8.3f}s  {status:<6}  {path}", file=sys.stderr)
+    print(
+        f"Converted {len(outcomes) - len(failures)} of {len(outcomes)} files in {elapsed:.3f}s",
+        file=sys.stderr,
+    )
+    for path, _, error in failures:
+        print(f"\nFailed to convert {path}:\n{error}", file=sys.stderr)
+    if profile:
+        _print_profile(metrics.stats())
+
+    return 1 if failures else 0
+
+
+def _collect(
+    results, output_dir: Optional[str], metrics: ConversionMetrics
+) -> List[Tuple[str, float, Optional[str]]]:
+    """Print the results (in input order) if they were not written to files, record their traces,
+    and return the outcomes."""
+    outcomes = []
+    for path, text_content, seconds, error, traces in results:
+        if output_dir is None and error is None:
+            print(text_content)
+        for trace in traces:
+            metrics.record(trace)
+        outcomes.append((path, seconds, error))
+    return outcomes
+
+
+def _print_profile(stats: Dict[str, Any]) -> None:
+    """Print the aggregated traces of conversions (see MarkItDown.stats) to stderr."""
+    print("\nProfile:", file=sys.stderr)
+    print(
+        f"  {stats['conversions']} conversions ({stats['failures']} failed, "
+        f"{stats['cache_hits']} from the cache), {stats['input_size'] / 1024**2:.1f} MiB in, "
+        f"{stats['output_size']} characters out",
+        file=sys.stderr,
+    )
+    print(
+        f"  {stats['total_time']:.3f}s converting, of which {stats['normalize_time']:.3f}s "
+        "normalizing",
+        file=sys.stderr,
+    )
+    print(
+        f"  {'converter':<24} {'attempts':>8} {'accepted':>8} {'declined':>8} "
+        f"{'errors':>8} {'time':>10}",
+        file=sys.stderr,
+    )
+    converters = sorted(stats["converters"].items(), key=lambda item: -item[1]["time"])
+    for name, converter in converters:
+        print(
+            f"  {name:<24} {converter['attempts']:>8} {converter['accepted']:>8} "
+            f"{converter['declined']:>8} {converter['errors']:>8} "
+            f"{converter['time']:>9.3f}s",
+            file=sys.stderr,
+        )
+
+
+def _expand_paths(
+    paths: List[str], output_dir: Optional[str]
+) -> List[Tuple[str, Optional[str]]]:
+    """Expand files, directories and globs into (input path, output path) pairs.
+    Output paths mirror the input names (relative to a directory argument) with a .md extension.
+    When two inputs would share an output (e.g., report.pdf and report.docx), the extension
+    is kept (report.docx.md), and if that is taken too (e.g., by inputs of the same name from
+    different directories), a number is added (report.docx-1.md, report.docx-2.md, ...).
+    """
+    tasks = []
+    seen = set()
+    outputs = set()
+
+    def _add(path, relative_path):
+        if path in seen:
+            return
+        seen.add(path)
+        output_path = None
+        if output_dir is not None:
+            output_path = os.path.join(
+                output_dir, os.path.splitext(relative_path)[0] + ".md"
+            )
+            if output_path in outputs:
+                output_path = os.path.join(output_dir, relative_path + ".md")
+            number = 0
+            while output_path in outputs:
+                number += 1
+                output_path = os.path.join(output_dir, f"{relative_path}-{number}.md")
+            outputs.add(output_path)
+        tasks.append((path, output_path))
+
+    for arg in paths:
+        if os.path.isdir(arg):
+            for root, dirs, files in os.walk(arg):
+                dirs.sort()
+                for name in sorted(files):
+                    path = os.path.join(root, name)
+                    _add(path, os.path.relpath(path, arg))
+        elif glob.has_magic(arg) and not os.path.exists(arg):
+            for path in sorted(glob.glob(arg, recursive=True)):
+                if os.path.isfile(path):
+                    _add(path, os.path.basename(path))
+        else:
+            _add(arg, os.path.basename(arg))
+
+    return tasks
+
+
+class _TraceRecorder(ConversionMetrics):
+    """Keeps the traces of a worker's conversions, until they are sent back with their result."""
+
+    def __init__(self):
+        super().__init__()
+        self.traces: List[ConversionTrace] = []
+
+    def record(self, trace: ConversionTrace) -> None:
+        self.traces.append(trace)
+
+    def take_traces(self) -> List[ConversionTrace]:
+        """Return the traces recorded so far, and forget them."""
+        traces, self.traces = self.traces, []
+        return traces
+
+
+def _init_worker() -> None:
+    """Create the MarkItDown instance reused for every file converted by this process."""
+    global _worker_markitdown, _worker_recorder
+    _worker_recorder = _TraceRecorder()
+    _worker_markitdown = MarkItDown(metrics=_worker_recorder)
+
+
+def _convert_file(
+    task: Tuple[str, Optional[str]]
+) -> Tuple[str, Optional[str], float, Optional[str], List[ConversionTrace]]:
+    """Convert one file, writing it to its output path if there is one.
+    Returns (path, text_content or None, seconds, error or None, traces)."""
+    path, output_path = task
+    start = time.perf_counter()
+    text_content, error = None, None
+    try:
+        text_content = _worker_markitdown.convert(path).text_content
+        if output_path is not None:
+            os.makedirs(os.path.dirname(output_path) or ".", exist_ok=True)
+            with open(output_path, "wt", encoding="utf-8") as fh:
+                fh.write(text_content)
+            text_content = None
+    except (Exception, FileConversionException, UnsupportedFormatException):
+        text_content, error = None, traceback.format_exc().strip()
+    seconds = time.perf_counter() - start
+    return path, text_content, seconds, error, _worker_recorder.take_traces()
 
 
 if __name__ == "__main__":
@@ -1,142 +1,823 @@
 # type: ignore
+import atexit
 import base64
 import binascii
+import codecs
+import collections
+import concurrent.futures
+import contextlib
 import copy
-import html
+import functools
+import hashlib
+import importlib.util
+import io
+import itertools
 import json
 import mimetypes
+import mmap
 import os
 import re
 import shutil
+import sqlite3
 import subprocess
 import sys
 import tempfile
+import threading
+import time
 import traceback
 import zipfile
-from xml.dom import minidom
-from typing import Any, Dict, List, Optional, Union
-from urllib.parse import parse_qs, quote, unquote, urlparse, urlunparse
-from warnings import warn, resetwarnings, catch_warnings
-
-import mammoth
-import markdownify
-import pandas as pd
-import pdfminer
-import pdfminer.high_level
-import pptx
-
-# File-format detection
-import puremagic
-import requests
-from bs4 import BeautifulSoup
-from charset_normalizer import from_path
-
-# Optional Transcription support
-try:
-    # Using warnings' catch_warnings to catch
-    # pydub's warning of ffmpeg or avconv missing
-    with catch_warnings(record=True) as w:
-        import pydub
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    BinaryIO,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    Union,
+)
+from urllib.parse import (
+    parse_qs,
+    quote,
+    unquote,
+    unquote_to_bytes,
+    urlparse,
+    urlunparse,
+)
+from warnings import warn, catch_warnings
+
+from .__about__ import __version__
+
+# The converters' backends (pdfminer, pandas, mammoth, python-pptx, BeautifulSoup, markdownify,
+# puremagic, requests, etc.) are heavy to import, so they are imported when first needed,
+# rather than here. This keeps `import markitdown` (and the CLI's startup) fast.
+if TYPE_CHECKING:
+    import requests
+
+
+@functools.lru_cache(maxsize=None)
+def _is_audio_transcription_capable() -> bool:
+    """Optional Transcription support (checked on first use)"""
+    try:
+        # Using warnings' catch_warnings to catch
+        # pydub's warning of ffmpeg or avconv missing
+        with catch_warnings(record=True) as w:
+            import pydub
+
+            if w:
+                raise ModuleNotFoundError
+        import speech_recognition
+
+        return True
+    except ModuleNotFoundError:
+        return False
 
-        if w:
-            raise ModuleNotFoundError
-    import speech_recognition as sr
 
-    IS_AUDIO_TRANSCRIPTION_CAPABLE = True
-except ModuleNotFoundError:
-    pass
-finally:
-    resetwarnings()
+@functools.lru_cache(maxsize=None)
+def _is_youtube_transcript_capable() -> bool:
+    """Optional YouTube transcription support (checked on first use)"""
+    try:
+        import youtube_transcript_api
+
+        return True
+    except ModuleNotFoundError:
+        return False
 
-# Optional YouTube transcription support
-try:
-    from youtube_transcript_api import YouTubeTranscriptApi
 
-    IS_YOUTUBE_TRANSCRIPT_CAPABLE = True
-except ModuleNotFoundError:
-    pass
+def __getattr__(name: str) -> Any:
+    """Lazily provide the module attributes that require importing optional dependencies."""
+    if name == "IS_AUDIO_TRANSCRIPTION_CAPABLE":
+        return _is_audio_transcription_capable()
+    if name == "IS_YOUTUBE_TRANSCRIPT_CAPABLE":
+        return _is_youtube_transcript_capable()
+    if name == "_CustomMarkdownify":
+        return _get_custom_markdownify_class()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
-class _CustomMarkdownify(markdownify.MarkdownConverter):
-    """
-    A custom version of markdownify's MarkdownConverter. Changes include:
+def _markdown_serializer(**options: Any) -> "_MarkdownSerializer":
+    """Return a new _MarkdownSerializer."""
+    return _MarkdownSerializer(**options)
+
+
+@functools.lru_cache(maxsize=None)
+def _get_custom_markdownify_class() -> type:
+    """Define _CustomMarkdownify on first use, as it subclasses markdownify's MarkdownConverter.
+    _MarkdownSerializer, which gives the same output, is used in its place."""
+    import markdownify
+
+    class _CustomMarkdownify(markdownify.MarkdownConverter):
+        """
+        A custom version of markdownify's MarkdownConverter. Changes include:
+
+        - Altering the default heading style to use '#', '##', etc.
+        - Removing javascript hyperlinks.
+        - Truncating images with large data:uri sources (or applying the image_policy option).
+        - Ensuring URIs are properly escaped, and do not conflict with Markdown syntax
+        """
+
+        def __init__(self, **options: Any):
+            options["heading_style"] = options.get("heading_style", markdownify.ATX)
+            # Explicitly cast options to the expected type if necessary
+            super().__init__(**options)
+
+        def convert_hn(
+            self, n: int, el: Any, text: str, convert_as_inline: bool
+        ) -> str:
+            """Same as usual, but be sure to start with a new line"""
+            if not convert_as_inline:
+                if not re.search(r"^\n", text):
+                    return "\n" + super().convert_hn(n, el, text, convert_as_inline)  # type: ignore
+
+            return super().convert_hn(n, el, text, convert_as_inline)  # type: ignore
+
+        def convert_a(self, el: Any, text: str, convert_as_inline: bool):
+            """Same as usual converter, but removes Javascript links and escapes URIs."""
+            return _markdown_link(
+                el, text, self.options["autolinks"], self.options["default_title"]
+            )
+
+        def convert_img(self, el: Any, text: str, convert_as_inline: bool) -> str:
+            """Same as usual converter, but removes data URIs"""
+            if (
+                convert_as_inline
+                and el.parent.name not in self.options["keep_inline_images_in"]
+            ):
+                return el.attrs.get("alt", None) or ""
+            return _markdown_image(el, self.options.get("image_policy"))
+
+        def convert_soup(self, soup: Any) -> str:
+            return super().convert_soup(soup)  # type: ignore
+
+    return _CustomMarkdownify
+
+
+def _chomp(text: str) -> Tuple[str, str, str]:
+    """Split the leading and trailing space of an inline element's text, like markdownify's chomp."""
+    prefix = " " if text and text[0] == " " else ""
+    suffix = " " if text and text[-1] == " " else ""
+    return prefix, suffix, text.strip()
+
+
+def _markdown_link(
+    el: Any, text: str, autolinks: bool = True, default_title: bool = False
+) -> str:
+    """The Markdown of a link (el is the <a> tag, or its attributes), given its converted text.
+    Javascript (and other non-http or file) links are removed, and URIs are escaped."""
+    prefix, suffix, text = _chomp(text)
+    if not text:
+        return ""
+    href = el.get("href")
+    title = el.get("title")
 
-    - Altering the default heading style to use '#', '##', etc.
-    - Removing javascript hyperlinks.
-    - Truncating images with large data:uri sources.
-    - Ensuring URIs are properly escaped, and do not conflict with Markdown syntax
+    # Escape URIs and skip non-http or file schemes
+    if href:
+        try:
+            parsed_url = urlparse(href)  # type: ignore
+            if parsed_url.scheme and parsed_url.scheme.lower() not in ["http", "https", "file"]:  # type: ignore
+                return "%s%s%s" % (prefix, text, suffix)
+            href = urlunparse(parsed_url._replace(path=quote(unquote(parsed_url.path))))  # type: ignore
+        except ValueError:  # It's not clear if this ever gets thrown
+            return "%s%s%s" % (prefix, text, suffix)
+
+    # For the replacement see #29: text nodes underscores are escaped
+    if (
+        autolinks
+        and text.replace(r"\_", "_") == href
+        and not title
+        and not default_title
+    ):
+        # Shortcut syntax
+        return "<%s>" % href
+    if default_title and not title:
+        title = href
+    title_part = ' "%s"' % title.replace('"', r"\"") if title else ""
+    return "%s[%s](%s%s)%s" % (prefix, text, href, title_part, suffix) if href else text
+
+
+def _markdown_image(el: Any, image_policy: Optional["_ImagePolicy"] = None) -> str:
+    """The Markdown of an <img> tag (outside of inline content). Data URIs are truncated, or
+    handled by the image policy."""
+    alt = el.attrs.get("alt", None) or ""
+    src = el.attrs.get("src", None) or ""
+    title = el.attrs.get("title", None) or ""
+    title_part = ' "%s"' % title.replace('"', r"\"") if title else ""
+
+    # Remove dataURIs, or apply the image policy
+    if image_policy is not None:
+        src = image_policy.html_src(src)
+        if src is None:
+            return ""
+    if src.startswith("data:"):
+        src = src.split(",")[0] + "..."
+
+    return "![%s](%s%s)" % (alt, src, title_part)
+
+
+# Tags whose whitespace-only text children markdownify drops, when first, last, or next to such a tag
+_MARKDOWN_NESTED_TAGS = frozenset(
+    ["ol", "ul", "li", "table", "thead", "tbody", "tfoot", "tr", "td", "th"]
+)
+
+# Inline tags, and the marker written around their text
+_MARKDOWN_INLINE_MARKERS = {
+    "b": "**",
+    "strong": "**",
+    "em": "*",
+    "i": "*",
+    "del": "~~",
+    "s": "~~",
+    "sub": "",
+    "sup": "",
+    "code": "`",
+    "kbd": "`",
+    "samp": "`",
+}
+
+# Tags in which text is not escaped, and inline tags are not converted
+_MARKDOWN_CODE_TAGS = frozenset(["pre", "code", "kbd", "samp"])
+
+# Headings' content is converted inline
+_MARKDOWN_HEADING_RE = re.compile(r"h[1-6]")
+
+_MARKDOWN_WHITESPACE_RE = re.compile(r"[\t ]+")
+
+
+class _MarkdownFrame:
+    """A tag being converted by _MarkdownSerializer, with what markdownify would look up in its
+    ancestors and siblings."""
+
+    __slots__ = [
+        "tag",
+        "name",
+        "inline",
+        "children_inline",
+        "children",
+        "index",
+        "position",
+        "start",
+        "previous",
+        "next",
+        "parent",
+        "pre",
+        "code",
+        "li",
+        "ul_depth",
+        "suffix",
+    ]
+
+
+class _MarkdownSerializer:
     """
+    Converts HTML (a BeautifulSoup tree) to Markdown, with the same output as _CustomMarkdownify,
+    i.e., markdownify with the changes described there. Rather than converting each node
+    recursively, and concatenating the strings of its children, the tree is walked with an explicit
+    stack (so that deeply nested HTML does not reach the recursion limit), and the Markdown is
+    appended to a single list of parts. The parts of a tag are only joined when its conversion
+    needs their text (e.g., to strip it). Unlike markdownify, the tree is not modified.
+
+    Options: image_policy, see _ImagePolicy.
+    """
+
+    bullets = "*+-"
 
     def __init__(self, **options: Any):
-        options["heading_style"] = options.get("heading_style", markdownify.ATX)
-        # Explicitly cast options to the expected type if necessary
-        super().__init__(**options)
+        self.options = options
+
+    def convert_soup(self, soup: Any) -> str:
+        from bs4 import Comment, Doctype, NavigableString
+
+        parts: List[str] = []
+
+        # The root's own children are converted, but not the root itself
+        root = self._push(soup, None, None, None, parts)
+        root.children_inline = False
+        tag = soup
+        while tag is not None:
+            root.pre = root.pre or tag.name == "pre"
+            root.code = root.code or tag.name in _MARKDOWN_CODE_TAGS
+            root.li = root.li or tag.name == "li"
+            root.ul_depth += tag.name == "ul"
+            tag = tag.parent
+
+        stack = [root]
+        while stack:
+            frame = stack[-1]
+            children = frame.children
+            if frame.index == len(children):
+                stack.pop()
+                if frame is not root:
+                    self._close(frame, parts)
+                continue
+
+            child = children[frame.index]
+            frame.index += 1
+            if isinstance(child, NavigableString):
+                if isinstance(child, (Comment, Doctype)):
+                    continue
+                text = str(child)
+                if not frame.pre:
+                    text = _MARKDOWN_WHITESPACE_RE.sub(" ", text)
+                if not frame.code and text:
+                    text = _escape_markdown(text)
+
+                # Text at the end of a list item, or before a nested list, is stripped
+                if frame.name == "li":
+                    following = (
+                        children[frame.index] if frame.index < len(children) else None
+                    )
+                    if not following or following.name in ["ul", "ol"]:
+                        text = text.rstrip()
+                parts.append(text)
+                continue
+
+            # Tags that ignore their content
+            name = child.name
+            if name in ["script", "style"]:
+                continue
+            if name == "br":
+                if not frame.children_inline:
+                    parts.append("  \n")
+                continue
+            if name == "hr":
+                parts.append("\n\n---\n\n")
+                continue
+            if name == "img":
+                if frame.children_inline:
+                    parts.append(child.attrs.get("alt", None) or "")
+                else:
+                    parts.append(
+                        _markdown_image(child, self.options.get("image_policy"))
+                    )
+                continue
+
+            previous = children[frame.index - 2] if frame.index >= 2 else None
+            following = children[frame.index] if frame.index < len(children) else None
+            stack.append(self._push(child, frame, previous, following, parts))
+        return "".join(parts)
+
+    def _push(
+        self,
+        tag: Any,
+        parent: Optional[_MarkdownFrame],
+        previous: Any,
+        following: Any,
+        parts: List[str],
+    ) -> _MarkdownFrame:
+        """Start converting a tag (the child of parent before its next index, or the root): set up its
+        frame, and write what comes before its content."""
+        from bs4 import NavigableString
+
+        name = tag.name
+        frame = _MarkdownFrame()
+        frame.tag = tag
+        frame.name = name
+        frame.inline = parent is not None and parent.children_inline
+        frame.children_inline = (
+            frame.inline
+            or name in ["td", "th"]
+            or _MARKDOWN_HEADING_RE.match(name) is not None
+        )
+        frame.index = 0
+        frame.position = None if parent is None else parent.index - 1
+        frame.start = len(parts)
+        frame.parent = parent
+        if parent is None:
+            frame.previous = tag.previous_sibling
+            frame.next = tag.next_sibling
+            frame.pre = frame.code = frame.li = False
+            frame.ul_depth = 0
+        else:
+            frame.previous = previous
+            frame.next = following
+            frame.pre = parent.pre or name == "pre"
+            frame.code = parent.code or name in _MARKDOWN_CODE_TAGS
+            frame.li = parent.li or name == "li"
+            frame.ul_depth = parent.ul_depth + (name == "ul")
+        frame.suffix = ""
+
+        # Drop whitespace-only text first or last in a nested tag, or next to one, as markdownify
+        # does while iterating over the children (so that the text after a dropped one is skipped)
+        children = tag.contents
+        if name in _MARKDOWN_NESTED_TAGS:
+            children = list(children)
+            i = 0
+            while i < len(children):
+                child = children[i]
+                if isinstance(child, NavigableString) and child.strip() == "":
+                    before = children[i - 1] if i > 0 else None
+                    after = children[i + 1] if i + 1 < len(children) else None
+                    if (
+                        not before
+                        or not after
+                        or before.name in _MARKDOWN_NESTED_TAGS
+                        or after.name in _MARKDOWN_NESTED_TAGS
+                    ):
+                        del children[i]
+                i += 1
+        frame.children = children
+
+        if parent is None:
+            return frame
+
+        if name in ["table", "figcaption"]:
+            parts.append("\n\n")
+        elif name == "tr":
+            cells = tag.find_all(["td", "th"])
+            grandparent = parent.tag.parent
+            is_headrow = (
+                all(cell.name == "th" for cell in cells)
+                or (not previous and parent.name != "tbody")
+                or (
+                    not previous
+                    and parent.name == "tbody"
+                    and grandparent is not None
+                    and grandparent.find("thead") is None
+                )
+            )
+            if is_headrow and not previous:
+                colspan = sum(
+                    int(cell["colspan"])
+                    if "colspan" in cell.attrs and cell["colspan"].isdigit()
+                    else 1
+                    for cell in cells
+                )
+                frame.suffix = "| " + " | ".join(["---"] * colspan) + " |\n"
+            elif not previous and (
+                parent.name == "table"
+                or (parent.name == "tbody" and not parent.previous)
+            ):
+                parts.append("| " + " | ".join([""] * len(cells)) + " |\n")
+                parts.append("| " + " | ".join(["---"] * len(cells)) + " |\n")
+            parts.append("|")
+        return frame
+
+    def _close(self, frame: _MarkdownFrame, parts: List[str]) -> None:
+        """Finish converting a tag, whose content was written from parts[frame.start]."""
+        name = frame.name
+        start = frame.start
+
+        if name in _MARKDOWN_INLINE_MARKERS:
+            if frame.parent.code:
+                return
+            prefix, suffix, text = _chomp(self._pop(parts, start))
+            if text:
+                marker = _MARKDOWN_INLINE_MARKERS[name]
+                parts.append(prefix + marker + text + marker + suffix)
+        elif name == "a":
+            parts.append(_markdown_link(frame.tag, self._pop(parts, start)))
+        elif name == "p":
+            if not frame.inline and any(parts[start:]):
+                parts.append("\n\n")
+        elif name in ["td", "th"]:
+            text = self._pop(parts, start)
+            colspan = frame.tag.get("colspan")
+            colspan = int(colspan) if colspan and colspan.isdigit() else 1
+            parts.append(" " + text.strip().replace("\n", " ") + " |" * colspan)
+        elif name == "tr":
+            parts.append("\n" + frame.suffix)
+        elif name == "li":
+            text = self._pop(parts, start)
+            parent = frame.tag.parent
+            if parent is not None and parent.name == "ol":
+                first = parent.get("start")
+                first = int(first) if first and str(first).isnumeric() else 1
+                bullet = "%s." % (first + frame.position)
+            else:
+                bullet = self.bullets[(frame.ul_depth - 1) % len(self.bullets)]
+            parts.append("%s %s\n" % (bullet, text.strip()))
+        elif name in ["ul", "ol", "list"]:
+            if frame.li:
+                text = self._pop(parts, start)
+                if text:
+                    parts.append(
+                        "\n" + re.sub(r"^", "\t", text, flags=re.MULTILINE).rstrip()
+                    )
+                else:
+                    parts.append("\n")
+            elif frame.next and frame.next.name not in ["ul", "ol"]:
+                parts.append("\n")
+        elif name in ["table", "caption"]:
+            parts.append("\n")
+        elif name == "figcaption":
+            parts.append("\n\n")
+        elif name == "pre":
+            if any(parts[start:]):
+                parts.insert(start, "\n```\n")
+                parts.append("\n```\n")
+        elif name == "blockquote":
+            if not frame.inline:
+                text = self._pop(parts, start)
+                if text:
+                    parts.append(
+                        "\n"
+                        + re.sub(r"^", "> ", text.strip(), flags=re.MULTILINE)
+                        + "\n\n"
+                    )
+        else:
+            heading = re.match(r"h(\d+)", name)
+            if heading is not None and not frame.inline:
+                text = self._pop(parts, start)
+                prefix = "" if text.startswith("\n") else "\n"
+                parts.append(
+                    prefix + "#" * int(heading.group(1)) + " " + text.strip() + "\n\n"
+                )
 
-    def convert_hn(self, n: int, el: Any, text: str, convert_as_inline: bool) -> str:
-        """Same as usual, but be sure to start with a new line"""
-        if not convert_as_inline:
-            if not re.search(r"^\n", text):
-                return "\n" + super().convert_hn(n, el, text, convert_as_inline)  # type: ignore
+    def _pop(self, parts: List[str], start: int) -> str:
+        """Remove and join the parts from start."""
+        text = "".join(parts[start:])
+        del parts[start:]
+        return text
 
-        return super().convert_hn(n, el, text, convert_as_inline)  # type: ignore
 
-    def convert_a(self, el: Any, text: str, convert_as_inline: bool):
-        """Same as usual converter, but removes Javascript links and escapes URIs."""
-        prefix, suffix, text = markdownify.chomp(text)  # type: ignore
-        if not text:
-            return ""
-        href = el.get("href")
-        title = el.get("title")
+# The ways of writing the images embedded in documents, see _ImagePolicy
+_IMAGE_POLICIES = ["truncate", "drop", "placeholder", "assets"]
+
+
+class _ImagePolicy:
+    """
+    How the images embedded in a document (e.g., in a DOCX, or as data URIs in HTML) are written,
+    chosen with the image_policy option:
+
+    - "truncate" (the default): a link to the image's truncated data URI, e.g., "data:image/png;base64...".
+    - "drop": nothing.
+    - "placeholder": a link to a file named after the SHA-256 of the image (e.g., "<sha256>.png"),
+      which is not written.
+    - "assets": a link to the image, written to the image_dir directory under the same name.
 
-        # Escape URIs and skip non-http or file schemes
-        if href:
+    DOCX images are never encoded to base64, and are only read for the last two policies.
+    """
+
+    def __init__(self, policy: Optional[str] = None, image_dir: Optional[str] = None):
+        policy = policy or "truncate"
+        if policy not in _IMAGE_POLICIES:
+            raise ValueError(
+                f"Unknown image policy '{policy}'. Use one of {_IMAGE_POLICIES}."
+            )
+        if policy == "assets" and not image_dir:
+            raise ValueError("The 'assets' image policy requires an image_dir.")
+        self.policy = policy
+        self.image_dir = image_dir
+
+    @classmethod
+    def from_kwargs(cls, kwargs: Dict[str, Any]) -> "_ImagePolicy":
+        return cls(kwargs.get("image_policy"), kwargs.get("image_dir"))
+
+    def src(
+        self, content_type: Optional[str], read: Callable[[], bytes]
+    ) -> Optional[str]:
+        """The source to link an image to (None to drop it), given its content type and a function
+        returning its bytes."""
+        if self.policy == "drop":
+            return None
+        if self.policy == "truncate":
+            # Truncated to "data:<content type>;base64..." when rendered
+            return f"data:{content_type};base64,"
+
+        data = read()
+        name = hashlib.sha256(data).hexdigest()
+        if content_type:
+            name += mimetypes.guess_extension(content_type) or ""
+        if self.policy == "placeholder":
+            return name
+
+        path = os.path.join(self.image_dir, name)
+        if not os.path.exists(path):
+            os.makedirs(self.image_dir, exist_ok=True)
+            # Written under a temporary name first, so that concurrent conversions never link
+            # to a partially written image
+            fd, temp_path = tempfile.mkstemp(dir=self.image_dir, suffix=".tmp")
             try:
-                parsed_url = urlparse(href)  # type: ignore
-                if parsed_url.scheme and parsed_url.scheme.lower() not in ["http", "https", "file"]:  # type: ignore
-                    return "%s%s%s" % (prefix, text, suffix)
-                href = urlunparse(parsed_url._replace(path=quote(unquote(parsed_url.path))))  # type: ignore
-            except ValueError:  # It's not clear if this ever gets thrown
-                return "%s%s%s" % (prefix, text, suffix)
+                with os.fdopen(fd, "wb") as fh:
+                    fh.write(data)
+                os.replace(temp_path, path)
+            except BaseException:
+                os.unlink(temp_path)
+                raise
+        return path.replace(os.sep, "/")
 
-        # For the replacement see #29: text nodes underscores are escaped
-        if (
-            self.options["autolinks"]
-            and text.replace(r"\_", "_") == href
-            and not title
-            and not self.options["default_title"]
-        ):
-            # Shortcut syntax
-            return "<%s>" % href
-        if self.options["default_title"] and not title:
-            title = href
-        title_part = ' "%s"' % title.replace('"', r"\"") if title else ""
-        return (
-            "%s[%s](%s%s)%s" % (prefix, text, href, title_part, suffix)
-            if href
-            else text
+    def html_src(self, src: str) -> Optional[str]:
+        """The source to link an HTML image to (None to drop it). Only data URIs are rewritten."""
+        if self.policy == "drop":
+            return None
+        if self.policy == "truncate" or not src.startswith("data:"):
+            return src
+        header, _, payload = src.partition(",")
+        content_type = header[len("data:") :].split(";")[0]
+        try:
+            if header.endswith(";base64"):
+                data = base64.b64decode(payload)
+            else:
+                data = unquote_to_bytes(payload)
+        except (binascii.Error, ValueError):
+            return src  # Not a valid data URI: truncated like any other
+        return self.src(content_type or "text/plain", lambda: data)
+
+
+def _is_stream(source: Any) -> bool:
+    """Check if a converter's source is a binary file-like object, rather than a local path."""
+    return hasattr(source, "read")
+
+
+def _source_name(source: Union[str, BinaryIO]) -> str:
+    """A name for a converter's source in messages: its path, or "<stream>"."""
+    return "<stream>" if _is_stream(source) else source
+
+
+@contextlib.contextmanager
+def _open_binary(source: Union[str, BinaryIO]) -> Iterator[BinaryIO]:
+    """Open a converter's source (a local path, or a seekable binary stream) for reading from the
+    start. Streams are rewound, and left open."""
+    if _is_stream(source):
+        source.seek(0)
+        yield source
+    else:
+        with open(source, "rb") as fh:
+            yield fh
+
+
+def _read_text(source: Union[str, BinaryIO], encoding: str = "utf-8") -> str:
+    """Read the text of a converter's source, with universal newlines (like open(path, "rt"))."""
+    if not _is_stream(source):
+        with open(source, "rt", encoding=encoding) as fh:
+            return fh.read()
+    source.seek(0)
+    text = source.read().decode(encoding)
+    return text.replace("\r\n", "\n").replace("\r", "\n")
+
+
+# Byte order marks, checked before anything else (longest first: UTF-32 LE starts like UTF-16 LE)
+_BOMS = [
+    (codecs.BOM_UTF32_LE, "utf-32-le"),
+    (codecs.BOM_UTF32_BE, "utf-32-be"),
+    (codecs.BOM_UTF8, "utf-8"),
+    (codecs.BOM_UTF16_LE, "utf-16-le"),
+    (codecs.BOM_UTF16_BE, "utf-16-be"),
+]
+
+# Text that is not UTF-8 is detected on a sample of this many bytes, around the first invalid byte
+_CHARSET_SAMPLE_SIZE = 64 * 1024
+
+# Files larger than this are memory-mapped, rather than read, to be decoded
+_MMAP_THRESHOLD = 16 * 1024**2
+
+
+@contextlib.contextmanager
+def _map_binary(source: Union[str, BinaryIO]) -> Iterator[Union[bytes, mmap.mmap]]:
+    """The content of a converter's source: a read-only memory map for files larger than
+    _MMAP_THRESHOLD, and bytes otherwise (and for streams)."""
+    with _open_binary(source) as fh:
+        size = None
+        if not _is_stream(source):
+            size = os.fstat(fh.fileno()).st_size
+        if size is None or size <= _MMAP_THRESHOLD:
+            yield fh.read()
+            return
+        with mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ) as content:
+            yield content
+
+
+def _decode_text(content: Union[bytes, mmap.mmap]) -> str:
+    """Decode text of an unknown encoding, in tiers: a byte order mark, then strict UTF-8, then the
+    encoding charset_normalizer detects on a sample (around the first byte that is not UTF-8),
+    and only if that fails to decode the whole text, charset_normalizer on the whole text.
+    """
+    for bom, encoding in _BOMS:
+        if content[: len(bom)] == bom:
+            return str(memoryview(content)[len(bom) :], encoding, "replace")
+
+    try:
+        return str(content, "utf-8")
+    except UnicodeDecodeError as e:
+        start = max(e.start - _CHARSET_SAMPLE_SIZE // 2, 0)
+        if start > 0:
+            # Start the sample at a line break, so that it does not start mid-character
+            line_start = content.find(b"\n", start, e.start)
+            start = line_start + 1 if line_start >= 0 else start
+        sample = bytes(content[start : start + _CHARSET_SAMPLE_SIZE])
+
+    from charset_normalizer import from_bytes
+
+    match = from_bytes(sample).best()
+    if match is not None:
+        try:
+            return str(content, match.encoding)
+        except (UnicodeDecodeError, LookupError):
+            pass
+    return str(from_bytes(bytes(content)).best())
+
+
+# The BeautifulSoup parsers of the html_parser option, with the module each requires
+_HTML_PARSERS: Dict[str, Optional[str]] = {
+    "html.parser": None,
+    "lxml": "lxml",
+    "html5-parser": "html5_parser",
+}
+
+# The parsers of each html_parser profile, in order of preference
+_HTML_PARSER_PROFILES: Dict[str, List[str]] = {
+    "quality": ["html.parser"],
+    "fast": ["html5-parser", "lxml", "html.parser"],
+}
+
+
+def _get_html_parser(html_parser: Optional[str]) -> str:
+    """Resolve the html_parser option (a parser or profile name, "quality" by default) to an
+    installed parser."""
+    html_parser = html_parser or "quality"
+    if html_parser in _HTML_PARSER_PROFILES:
+        for name in _HTML_PARSER_PROFILES[html_parser]:
+            if _HTML_PARSERS[name] is None or importlib.util.find_spec(
+                _HTML_PARSERS[name]
+            ):
+                return name
+    if html_parser not in _HTML_PARSERS:
+        raise ValueError(
+            f"Unknown HTML parser '{html_parser}'. Use one of {list(_HTML_PARSERS) + list(_HTML_PARSER_PROFILES)}."
+        )
+    requirement = _HTML_PARSERS[html_parser]
+    if requirement is not None and importlib.util.find_spec(requirement) is None:
+        raise ValueError(
+            f"The HTML parser '{html_parser}' requires {requirement}, which is not installed."
         )
+    return html_parser
 
-    def convert_img(self, el: Any, text: str, convert_as_inline: bool) -> str:
-        """Same as usual converter, but removes data URIs"""
 
-        alt = el.attrs.get("alt", None) or ""
-        src = el.attrs.get("src", None) or ""
-        title = el.attrs.get("title", None) or ""
-        title_part = ' "%s"' % title.replace('"', r"\"") if title else ""
-        if (
-            convert_as_inline
-            and el.parent.name not in self.options["keep_inline_images_in"]
-        ):
-            return alt
+# Skips the comments, scripts and styles of a document's head, while looking for its title and body
+_HTML_HEAD_RE = re.compile(
+    r"<!--.*?-->|<(script|style)\b[^>]*>.*?</\1\s*>|(<title\b[^>]*>.*?</title\s*>)|(<body\b)",
+    re.IGNORECASE | re.DOTALL,
+)
 
-        # Remove dataURIs
-        if src.startswith("data:"):
-            src = src.split(",")[0] + "..."
 
-        return "![%s](%s%s)" % (alt, src, title_part)
+def _html_body(html_content: str) -> Optional[str]:
+    """The part of an HTML document to parse for its body and title: its <title> element, followed
+    by everything from the <body> tag on. None if the body cannot be found safely (e.g., the head
+    has an unterminated comment or script), and the whole document must be parsed."""
+    title = ""
+    position = 0
+    for match in _HTML_HEAD_RE.finditer(html_content):
+        skipped = html_content[position : match.start()]
+        if re.search(r"<!--|<script\b|<style\b|<body\b", skipped, re.IGNORECASE):
+            return None
+        position = match.end()
+        if match.group(2) is not None and title == "":
+            title = match.group(2)
+        elif match.group(3) is not None:
+            return title + html_content[match.start() :]
+    return None
+
 
-    def convert_soup(self, soup: Any) -> str:
-        return super().convert_soup(soup)  # type: ignore
+class _HtmlDocuments:
+    """
+    The HTML documents parsed during one conversion (passed to converters as the _html_documents
+    option), so that the converters tried on a file (e.g., WikipediaConverter, then HtmlConverter)
+    parse it only once. The documents are shared: converters must not modify them, except to
+    remove script and style elements.
+    """
+
+    def __init__(self):
+        self._documents: Dict[Tuple[str, bool], Tuple[str, Any]] = {}
+
+    def get(self, html_content: str, parser: str, body_only: bool) -> Optional[Any]:
+        document = self._documents.get((parser, body_only))
+        if document is not None and document[0] == html_content:
+            return document[1]
+        return None
+
+    def put(self, html_content: str, parser: str, body_only: bool, soup: Any) -> None:
+        self._documents[(parser, body_only)] = (html_content, soup)
+
+
+def _parse_html(html_content: str, kwargs: Dict[str, Any], body_only: bool = False):
+    """Parse an HTML document with BeautifulSoup, using the parser chosen with the html_parser
+    option. With body_only, only the <title> and <body> elements are parsed, when they can be found.
+    Documents are reused from the _html_documents option, if any."""
+    parser = _get_html_parser(kwargs.get("html_parser"))
+    documents = kwargs.get("_html_documents")
+    if documents is not None:
+        soup = documents.get(html_content, parser, body_only)
+        if soup is not None:
+            return soup
+
+    markup = html_content
+    if body_only:
+        markup = _html_body(html_content) or html_content
+    if parser == "html5-parser":
+        import html5_parser
+
+        soup = html5_parser.parse(markup, treebuilder="soup")
+    else:
+        from bs4 import BeautifulSoup
+
+        soup = BeautifulSoup(markup, parser)
+
+    if documents is not None:
+        documents.put(html_content, parser, body_only, soup)
+    return soup
 
 
 class DocumentConverterResult:
@@ -150,14 +831,47 @@ class DocumentConverterResult:
 class DocumentConverter:
     """Abstract superclass of all DocumentConverters."""
 
+    # File extensions (lower case, with the leading dot) that this converter can accept.
+    # MarkItDown uses these to index converters, so that it only tries a converter with
+    # extensions it may accept. None means the converter is tried with every candidate.
+    supported_extensions: Union[None, List[str]] = None
+
+    # MIME type prefixes (e.g., "text/") that this converter can accept. An extension
+    # matches if mimetypes guesses a type starting with one of these prefixes.
+    supported_mimetypes: Union[None, List[str]] = None
+
+    # Bump this when a change to the converter alters its output, to invalidate cached results.
+    version: str = "1"
+
+    # True if convert (and convert_iter) also accept a seekable binary file-like object in place
+    # of local_path, e.g., the in-memory content given to convert_stream. Otherwise, MarkItDown
+    # spills such content to a temporary file before calling this converter.
+    accepts_streams: bool = False
+
     def convert(
         self, local_path: str, **kwargs: Any
     ) -> Union[None, DocumentConverterResult]:
         raise NotImplementedError()
 
+    def convert_iter(
+        self, local_path: str, **kwargs: Any
+    ) -> Union[None, Iterator[str]]:
+        """Like convert, but returns an iterator over the Markdown of each page or section (or None
+        if the file is not accepted). Joining the sections gives the text of convert's result.
+        By default, the whole document is a single section."""
+        res = self.convert(local_path, **kwargs)
+        if res is None:
+            return None
+        return iter([res.text_content])
+
 
 class PlainTextConverter(DocumentConverter):
-    """Anything with content type text/plain"""
+    """Anything with content type text/plain. The encoding is detected with _decode_text (UTF-8,
+    by far the most common, is decoded without running charset detection)."""
+
+    supported_extensions = []
+    supported_mimetypes = ["text/"]
+    accepts_streams = True
 
     def convert(
         self, local_path: str, **kwargs: Any
@@ -173,7 +887,8 @@ class PlainTextConverter(DocumentConverter):
         elif "text/" not in content_type.lower():
             return None
 
-        text_content = str(from_path(local_path).best())
+        with _map_binary(local_path) as content:
+            text_content = _decode_text(content)
         return DocumentConverterResult(
             title=None,
             text_content=text_content,
@@ -183,6 +898,11 @@ class PlainTextConverter(DocumentConverter):
 class HtmlConverter(DocumentConverter):
     """Anything with content type text/html"""
 
+    # 2: rendered by _MarkdownSerializer
+    version = "2"
+    supported_extensions = [".html", ".htm"]
+    accepts_streams = True
+
     def convert(
         self, local_path: str, **kwargs: Any
     ) -> Union[None, DocumentConverterResult]:
@@ -191,17 +911,14 @@ class HtmlConverter(DocumentConverter):
         if extension.lower() not in [".html", ".htm"]:
             return None
 
-        result = None
-        with open(local_path, "rt", encoding="utf-8") as fh:
-            result = self._convert(fh.read())
-
-        return result
-
-    def _convert(self, html_content: str) -> Union[None, DocumentConverterResult]:
-        """Helper function that converts and HTML string."""
+        return self._convert(_read_text(local_path), **kwargs)
 
-        # Parse the string
-        soup = BeautifulSoup(html_content, "html.parser")
+    def _convert(
+        self, html_content: str, **kwargs: Any
+    ) -> Union[None, DocumentConverterResult]:
+        """Helper function that converts and HTML string. Images follow the image_policy option."""
+        # Parse the string (only the title and body are used)
+        soup = _parse_html(html_content, kwargs, body_only=True)
 
         # Remove javascript and style blocks
         for script in soup(["script", "style"]):
@@ -210,10 +927,13 @@ class HtmlConverter(DocumentConverter):
         # Print only the main content
         body_elm = soup.find("body")
         webpage_text = ""
+        _markdownify = _markdown_serializer(
+            image_policy=_ImagePolicy.from_kwargs(kwargs)
+        )
         if body_elm:
-            webpage_text = _CustomMarkdownify().convert_soup(body_elm)
+            webpage_text = _markdownify.convert_soup(body_elm)
         else:
-            webpage_text = _CustomMarkdownify().convert_soup(soup)
+            webpage_text = _markdownify.convert_soup(soup)
 
         assert isinstance(webpage_text, str)
 
@@ -223,146 +943,244 @@ class HtmlConverter(DocumentConverter):
         )
 
 
-class RSSConverter(DocumentConverter):
-    """Convert RSS / Atom type to markdown"""
+# The namespace of RSS's content:encoded element
+_RSS_CONTENT_NS = "{http://purl.org/rss/1.0/modules/content/}"
 
-    def convert(
-        self, local_path: str, **kwargs
-    ) -> Union[None, DocumentConverterResult]:
-        # Bail if not RSS type
-        extension = kwargs.get("file_extension", "")
-        if extension.lower() not in [".xml", ".rss", ".atom"]:
-            return None
-        try:
-            doc = minidom.parse(local_path)
-        except BaseException as _:
-            return None
-        result = None
-        if doc.getElementsByTagName("rss"):
-            # A RSS feed must have a root element of <rss>
-            result = self._parse_rss_type(doc)
-        elif doc.getElementsByTagName("feed"):
-            root = doc.getElementsByTagName("feed")[0]
-            if root.getElementsByTagName("entry"):
-                # An Atom feed must have a root element of <feed> and at least one <entry>
-                result = self._parse_atom_type(doc)
-            else:
-                return None
-        else:
-            # not rss or atom
-            return None
+# Item content without markup (or characters html.parser rewrites) is escaped directly, rather
+# than parsed with BeautifulSoup, with the same result
+_RSS_MARKUP_RE = re.compile(r"[<&\r\x0c]")
 
-        return result
 
-    def _parse_atom_type(
-        self, doc: minidom.Document
-    ) -> Union[None, DocumentConverterResult]:
-        """Parse the type of an Atom feed.
+def _xml_local_name(tag: str) -> str:
+    """The name of an ElementTree tag without its namespace."""
+    return tag.rsplit("}", 1)[-1]
+
+
+class _FeedReader:
+    """
+    Reads a RSS or Atom feed (a local path, or a seekable binary stream) incrementally with
+    ElementTree.iterparse, and yields its Markdown one item (or entry) at a time. Each item is
+    removed from the tree once converted, so memory use does not grow with the feed.
+
+    read_header reads the feed up to its first item, and tells whether it is a feed at all. The
+    channel's title and description are usually found before the items, but are also read after
+    them, so header() is only complete once the items have been read.
+    """
+
+    def __init__(self, local_path: Union[str, BinaryIO]):
+        from xml.etree import ElementTree
 
-        Returns None if the feed type is not recognized or something goes wrong.
+        if _is_stream(local_path):
+            local_path.seek(0)
+            self._fh = local_path
+            self._owns_fh = False
+        else:
+            self._fh = open(local_path, "rb")
+            self._owns_fh = True
+        self._events = ElementTree.iterparse(self._fh, events=("start", "end"))
+        self._serializer = _markdown_serializer()
+        self._depth = 0
+        self._channel = None
+        self._channel_depth = None
+        self._first_item = None
+        self.kind = None
+        self.title = None
+        self.description = None
+
+    def close(self) -> None:
+        if self._owns_fh:
+            self._fh.close()
+
+    def read_header(self) -> bool:
+        """Read the feed's type, title and description. Returns False if it is not a RSS feed (a
+        <rss> root, with a <channel>) or an Atom feed (a <feed> root, with at least one <entry>).
         """
+        for event, element in self._events:
+            if event == "start":
+                self._depth += 1
+                name = _xml_local_name(element.tag)
+                if self._depth == 1:
+                    # A RSS feed must have a root element of <rss>, and an Atom feed of <feed>
+                    if element.tag == "rss":
+                        self.kind = "rss"
+                    elif name == "feed":
+                        self.kind = "atom"
+                        self._channel = element
+                        self._channel_depth = 1
+                    else:
+                        return False
+                elif self.kind == "rss" and self._depth == 2 and name == "channel":
+                    self._channel = element
+                    self._channel_depth = 2
+                elif (
+                    self._channel is not None and self._depth == self._channel_depth + 1
+                ):
+                    if name == ("item" if self.kind == "rss" else "entry"):
+                        self._first_item = element
+                        return True
+                continue
+
+            self._depth -= 1
+            if self._channel is None:
+                continue
+            if self._depth == self._channel_depth:
+                self._read_channel_field(element)
+            elif self._depth < self._channel_depth:
+                break
+
+        # A channel without items (an Atom feed must have at least one entry)
+        return self.kind == "rss" and self._channel is not None
+
+    def _read_channel_field(self, element: Any) -> None:
+        """Read a direct child of the channel (or of the Atom feed) other than an item."""
+        name = _xml_local_name(element.tag)
+        if name == "title" and self.title is None:
+            self.title = element.text
+        elif name == ("description" if self.kind == "rss" else "subtitle"):
+            if self.description is None:
+                self.description = element.text
+
+    def header(self) -> str:
+        """The Markdown of the channel's title and description."""
+        header = ""
+        if self.title:
+            header += f"# {self.title}\n"
+        if self.description:
+            header += f"{self.description}\n"
+        return header
+
+    def __iter__(self) -> Iterator[str]:
+        """Yield the Markdown of each item (without the header)."""
+        if self._first_item is None:
+            return
+        for event, element in self._events:
+            if event == "start":
+                self._depth += 1
+                continue
+            self._depth -= 1
+            if self._depth != self._channel_depth:
+                continue
+            if element.tag == self._first_item.tag:
+                yield self._convert_item(element)
+                self._channel.remove(element)
+            else:
+                self._read_channel_field(element)
+
+    def _convert_item(self, item: Any) -> str:
+        fields = {}
+        for child in item:
+            tag = child.tag
+            if tag.startswith(_RSS_CONTENT_NS):
+                name = "content:encoded" if tag == _RSS_CONTENT_NS + "encoded" else tag
+            else:
+                name = _xml_local_name(tag)
+            fields.setdefault(name, child.text)
+
+        md_text = ""
+        if self.kind == "rss":
+            if fields.get("title"):
+                md_text += f"\n## {fields['title']}\n"
+            if fields.get("pubDate"):
+                md_text += f"Published on: {fields['pubDate']}\n"
+            for name in ["description", "content:encoded"]:
+                if fields.get(name):
+                    md_text += self._convert_content(fields[name])
+        else:
+            if fields.get("title"):
+                md_text += f"\n## {fields['title']}\n"
+            if fields.get("updated"):
+                md_text += f"Updated on: {fields['updated']}\n"
+            for name in ["summary", "content"]:
+                if fields.get(name):
+                    md_text += self._convert_content(fields[name])
+        return md_text
+
+    def _convert_content(self, content: str) -> str:
+        """Convert the (often HTML) content of an item to Markdown."""
+        if content.strip() and not _RSS_MARKUP_RE.search(content):
+            return _escape_markdown(_MARKDOWN_WHITESPACE_RE.sub(" ", content))
         try:
-            root = doc.getElementsByTagName("feed")[0]
-            title = self._get_data_by_tag_name(root, "title")
-            subtitle = self._get_data_by_tag_name(root, "subtitle")
-            entries = root.getElementsByTagName("entry")
-            md_text = f"# {title}\n"
-            if subtitle:
-                md_text += f"{subtitle}\n"
-            for entry in entries:
-                entry_title = self._get_data_by_tag_name(entry, "title")
-                entry_summary = self._get_data_by_tag_name(entry, "summary")
-                entry_updated = self._get_data_by_tag_name(entry, "updated")
-                entry_content = self._get_data_by_tag_name(entry, "content")
-
-                if entry_title:
-                    md_text += f"\n## {entry_title}\n"
-                if entry_updated:
-                    md_text += f"Updated on: {entry_updated}\n"
-                if entry_summary:
-                    md_text += self._parse_content(entry_summary)
-                if entry_content:
-                    md_text += self._parse_content(entry_content)
+            # using bs4 because many RSS feeds have HTML-styled content
+            from bs4 import BeautifulSoup
 
-            return DocumentConverterResult(
-                title=title,
-                text_content=md_text,
-            )
+            soup = BeautifulSoup(content, "html.parser")
+            return self._serializer.convert_soup(soup)
         except BaseException as _:
-            return None
+            return content
+
+
+class RSSConverter(DocumentConverter):
+    """Convert RSS / Atom type to markdown
+
+    The feed is parsed incrementally (see _FeedReader), and converted one item at a time.
+    """
+
+    # 2: items' content:encoded bodies are converted too
+    # 3: the channel's title and description are also read after the items
+    version = "3"
+    supported_extensions = [".xml", ".rss", ".atom"]
+    accepts_streams = True
 
-    def _parse_rss_type(
-        self, doc: minidom.Document
+    def convert(
+        self, local_path: str, **kwargs
     ) -> Union[None, DocumentConverterResult]:
-        """Parse the type of an RSS feed.
+        reader = self._read_feed(local_path, **kwargs)
+        if reader is None:
+            return None
+
+        from xml.etree import ElementTree
 
-        Returns None if the feed type is not recognized or something goes wrong.
-        """
         try:
-            root = doc.getElementsByTagName("rss")[0]
-            channel = root.getElementsByTagName("channel")
-            if not channel:
-                return None
-            channel = channel[0]
-            channel_title = self._get_data_by_tag_name(channel, "title")
-            channel_description = self._get_data_by_tag_name(channel, "description")
-            items = channel.getElementsByTagName("item")
-            if channel_title:
-                md_text = f"# {channel_title}\n"
-            if channel_description:
-                md_text += f"{channel_description}\n"
-            if not items:
-                items = []
-            for item in items:
-                title = self._get_data_by_tag_name(item, "title")
-                description = self._get_data_by_tag_name(item, "description")
-                pubDate = self._get_data_by_tag_name(item, "pubDate")
-                content = self._get_data_by_tag_name(item, "content:encoded")
-
-                if title:
-                    md_text += f"\n## {title}\n"
-                if pubDate:
-                    md_text += f"Published on: {pubDate}\n"
-                if description:
-                    md_text += self._parse_content(description)
-                if content:
-                    md_text += self._parse_content(content)
+            text_content = "".join(reader)
+        except ElementTree.ParseError:
+            # Like a feed that cannot be parsed at all, a malformed feed is left to other converters
+            return None
+        finally:
+            reader.close()
+        return DocumentConverterResult(
+            title=reader.title, text_content=reader.header() + text_content
+        )
 
-            return DocumentConverterResult(
-                title=channel_title,
-                text_content=md_text,
-            )
-        except BaseException as _:
-            print(traceback.format_exc())
+    def convert_iter(self, local_path: str, **kwargs) -> Union[None, Iterator[str]]:
+        reader = self._read_feed(local_path, **kwargs)
+        if reader is None:
             return None
+        return self._iter_feed(reader)
 
-    def _parse_content(self, content: str) -> str:
-        """Parse the content of an RSS feed item"""
+    def _iter_feed(self, reader: _FeedReader) -> Iterator[str]:
+        # The header is streamed as read before the first item: a title or description that
+        # only follows the items (which is rare) is missing from it, unlike with convert
         try:
-            # using bs4 because many RSS feeds have HTML-styled content
-            soup = BeautifulSoup(content, "html.parser")
-            return _CustomMarkdownify().convert_soup(soup)
-        except BaseException as _:
-            return content
+            yield reader.header()
+            yield from reader
+        finally:
+            reader.close()
 
-    def _get_data_by_tag_name(
-        self, element: minidom.Element, tag_name: str
-    ) -> Union[str, None]:
-        """Get data from first child element with the given tag name.
-        Returns None when no such element is found.
-        """
-        nodes = element.getElementsByTagName(tag_name)
-        if not nodes:
+    def _read_feed(self, local_path: str, **kwargs) -> Union[None, _FeedReader]:
+        """Open the feed and read its header, or return None if it is not a RSS or Atom feed."""
+        # Bail if not RSS type
+        extension = kwargs.get("file_extension", "")
+        if extension.lower() not in [".xml", ".rss", ".atom"]:
             return None
-        fc = nodes[0].firstChild
-        if fc:
-            return fc.data
+
+        reader = _FeedReader(local_path)
+        try:
+            if reader.read_header():
+                return reader
+        except BaseException as _:
+            pass
+        reader.close()
         return None
 
 
 class WikipediaConverter(DocumentConverter):
     """Handle Wikipedia pages separately, focusing only on the main document content."""
 
+    # 2: rendered by _MarkdownSerializer
+    version = "2"
+    supported_extensions = [".html", ".htm"]
+    accepts_streams = True
+
     def convert(
         self, local_path: str, **kwargs: Any
     ) -> Union[None, DocumentConverterResult]:
@@ -374,10 +1192,8 @@ class WikipediaConverter(DocumentConverter):
         if not re.search(r"^https?:\/\/[a-zA-Z]{2,3}\.wikipedia.org\/", url):
             return None
 
-        # Parse the file
-        soup = None
-        with open(local_path, "rt", encoding="utf-8") as fh:
-            soup = BeautifulSoup(fh.read(), "html.parser")
+        # Parse the file (the content is in the body)
+        soup = _parse_html(_read_text(local_path), kwargs, body_only=True)
 
         # Remove javascript and style blocks
         for script in soup(["script", "style"]):
@@ -397,11 +1213,11 @@ class WikipediaConverter(DocumentConverter):
                 assert isinstance(main_title, str)
 
             # Convert the page
-            webpage_text = f"# {main_title}\n\n" + _CustomMarkdownify().convert_soup(
+            webpage_text = f"# {main_title}\n\n" + _markdown_serializer().convert_soup(
                 body_elm
             )
         else:
-            webpage_text = _CustomMarkdownify().convert_soup(soup)
+            webpage_text = _markdown_serializer().convert_soup(soup)
 
         return DocumentConverterResult(
             title=main_title,
@@ -412,6 +1228,9 @@ class WikipediaConverter(DocumentConverter):
 class YouTubeConverter(DocumentConverter):
     """Handle YouTube specially, focusing on the video title, description, and transcript."""
 
+    supported_extensions = [".html", ".htm"]
+    accepts_streams = True
+
     def convert(
         self, local_path: str, **kwargs: Any
     ) -> Union[None, DocumentConverterResult]:
@@ -424,9 +1243,7 @@ class YouTubeConverter(DocumentConverter):
             return None
 
         # Parse the file
-        soup = None
-        with open(local_path, "rt", encoding="utf-8") as fh:
-            soup = BeautifulSoup(fh.read(), "html.parser")
+        soup = _parse_html(_read_text(local_path), kwargs)
 
         # Read the meta tags
         assert soup.title is not None and soup.title.string is not None
@@ -483,7 +1300,9 @@ class YouTubeConverter(DocumentConverter):
         if description:
             webpage_text += f"\n### Description\n{description}\n"
 
-        if IS_YOUTUBE_TRANSCRIPT_CAPABLE:
+        if _is_youtube_transcript_capable():
+            from youtube_transcript_api import YouTubeTranscriptApi
+
             transcript_text = ""
             parsed_url = urlparse(url)  # type: ignore
             params = parse_qs(parsed_url.query)  # type: ignore
@@ -541,8 +1360,317 @@ class YouTubeConverter(DocumentConverter):
         return None
 
 
+class _JsonStream:
+    """
+    A pull parser over JSON read in chunks from a binary file (UTF-8). Objects and arrays are
+    walked with iter_object and iter_array; each of their values must be consumed with parse (which
+    materializes it), skip (which scans past it, without building any string), or a nested walk.
+    Only the current chunk, and the value being parsed, are held in memory.
+    """
+
+    _decoder = json.JSONDecoder()
+    _whitespace_re = re.compile(r"[ \t\n\r]*")
+    _string_body_re = re.compile(r'[^"\\]*')
+    _structure_re = re.compile(r'["\[\]{}]')
+
+    def __init__(self, fh: BinaryIO, chunk_size: Optional[int] = None):
+        self._fh = fh
+        self._chunk_size = chunk_size or _SPOOL_CHUNK_SIZE
+        self._text_decoder = codecs.getincrementaldecoder("utf-8")()
+        self._buffer = ""
+        self._pos = 0
+        self._eof = False
+
+    def _fill(self, size: Optional[int] = None) -> bool:
+        """Append the next chunk to the buffer (dropping what was consumed). Returns False at EOF."""
+        if self._eof:
+            return False
+        data = self._fh.read(size or self._chunk_size)
+        text = self._text_decoder.decode(data, final=not data)
+        self._eof = not data
+        self._buffer = self._buffer[self._pos :] + text
+        self._pos = 0
+        return bool(data) or bool(text)
+
+    def _error(self, message: str) -> ValueError:
+        return json.JSONDecodeError(message, self._buffer, self._pos)
+
+    def peek(self) -> str:
+        """Skip whitespace, and return the next character ("" at the end)."""
+        while True:
+            self._pos = self._whitespace_re.match(self._buffer, self._pos).end()
+            if self._pos < len(self._buffer):
+                return self._buffer[self._pos]
+            if not self._fill():
+                return ""
+
+    def _expect(self, char: str) -> None:
+        if self.peek() != char:
+            raise self._error(f"Expected {char!r}")
+        self._pos += 1
+
+    def iter_object(self) -> Iterator[str]:
+        """Walk an object, yielding each key. The caller consumes the value of each key."""
+        self._expect("{")
+        if self.peek() == "}":
+            self._pos += 1
+            return
+        while True:
+            if self.peek() != '"':
+                raise self._error("Expected a key")
+            key = self.parse()
+            self._expect(":")
+            yield key
+            char = self.peek()
+            self._pos += 1
+            if char == "}":
+                return
+            if char != ",":
+                raise self._error("Expected ',' or '}'")
+
+    def iter_array(self) -> Iterator[None]:
+        """Walk an array, yielding once per element. The caller consumes each element."""
+        self._expect("[")
+        if self.peek() == "]":
+            self._pos += 1
+            return
+        while True:
+            yield None
+            char = self.peek()
+            self._pos += 1
+            if char == "]":
+                return
+            if char != ",":
+                raise self._error("Expected ',' or ']'")
+
+    def parse(self) -> Any:
+        """Parse and return the next value."""
+        self.peek()
+        while True:
+            try:
+                value, end = self._decoder.raw_decode(self._buffer, self._pos)
+                # A number may continue in the next chunk ("-1." parses as -1)
+                if (
+                    self._eof
+                    or self._buffer[self._pos] in '"[{'
+                    or (
+                        end < len(self._buffer)
+                        and self._buffer[end] not in "0123456789.eE+-"
+                    )
+                ):
+                    self._pos = end
+                    return value
+            except json.JSONDecodeError:
+                if self._eof:
+                    raise
+            # Read more (as much again as is buffered, so that large values parse in linear time)
+            self._fill(max(self._chunk_size, len(self._buffer) - self._pos))
+
+    def skip(self) -> None:
+        """Scan past the next value."""
+        char = self.peek()
+        if char == '"':
+            self._skip_string()
+            return
+        if char not in "[{":
+            self.parse()
+            return
+
+        depth = 0
+        while True:
+            match = self._structure_re.search(self._buffer, self._pos)
+            if match is None:
+                self._pos = len(self._buffer)
+                if not self._fill():
+                    raise self._error("Unterminated array or object")
+                continue
+            char = match.group()
+            if char == '"':
+                self._pos = match.start()
+                self._skip_string()
+                continue
+            self._pos = match.end()
+            depth += 1 if char in "[{" else -1
+            if depth == 0:
+                return
+
+    def _ensure(self, size: int) -> None:
+        """Make sure the buffer holds at least size characters from the current position."""
+        while len(self._buffer) - self._pos < size:
+            if not self._fill():
+                raise self._error("Unexpected end of data")
+
+    def _skip_string(self, keep: int = 0) -> Tuple[str, bool]:
+        """Scan past a string, returning the JSON-escaped text of (about) its first keep characters,
+        and whether the rest was dropped."""
+        self._pos += 1  # The opening quote
+        kept = []
+        kept_length = 0
+        dropped = False
+        while True:
+            end = self._string_body_re.match(self._buffer, self._pos).end()
+            take = min(end - self._pos, keep - kept_length)
+            if take > 0:
+                kept.append(self._buffer[self._pos : self._pos + take])
+                kept_length += take
+            dropped = dropped or take < end - self._pos
+            self._pos = end
+            if end == len(self._buffer):
+                self._ensure(1)
+                continue
+
+            if self._buffer[self._pos] == '"':
+                self._pos += 1
+                return "".join(kept), dropped
+
+            # An escape, kept whole
+            self._ensure(2)
+            length = 6 if self._buffer[self._pos + 1] == "u" else 2
+            self._ensure(length)
+            if kept_length < keep:
+                kept.append(self._buffer[self._pos : self._pos + length])
+                kept_length += 1
+            else:
+                dropped = True
+            self._pos += length
+
+    def parse_text(self, limit: int) -> Tuple[str, bool]:
+        """Parse a string, or an array of strings (like a notebook's multiline strings), keeping
+        only its first limit characters. Returns the text, and whether it was truncated.
+        """
+        raws = []
+        if self.peek() == '"':
+            raws.append(self._skip_string(limit))
+        else:
+            kept = 0
+            for _ in self.iter_array():
+                if self.peek() != '"':
+                    raise self._error("Expected a string")
+                raw, dropped = self._skip_string(max(limit - kept, 0))
+                raws.append((raw, dropped))
+                kept += len(json.loads(f'"{raw}"'))
+
+        text = "".join(json.loads(f'"{raw}"') for raw, _ in raws)
+        truncated = len(text) > limit or any(dropped for _, dropped in raws)
+        text = text[:limit]
+        if truncated and text and "\ud800" <= text[-1] <= "\udbff":
+            text = text[:-1]  # Half of a surrogate pair
+        return text, truncated
+
+
+class _NotebookReader:
+    """
+    Reads a notebook incrementally (see _JsonStream), and yields the Markdown of each cell. Only
+    the type and source of cells are parsed (and, with text_outputs, the first text_outputs
+    characters of their text outputs); other values, such as images and widget state, are skipped.
+    The title (the notebook's metadata.title, or its first "# " heading) is set once it is read.
+    """
+
+    def __init__(self, fh: BinaryIO, text_outputs: Optional[int] = None):
+        self._json = _JsonStream(fh)
+        self._text_outputs = text_outputs
+        self.title = None
+
+    def __iter__(self) -> Iterator[str]:
+        metadata_title = None
+        separator = ""
+        for key in self._json.iter_object():
+            if key == "cells":
+                for _ in self._json.iter_array():
+                    text = self._read_cell()
+                    if text is not None:
+                        yield separator + text
+                        separator = "\n\n"
+            elif key == "metadata":
+                for metadata_key in self._json.iter_object():
+                    if metadata_key == "title":
+                        metadata_title = self._json.parse()
+                    else:
+                        self._json.skip()
+            else:
+                self._json.skip()
+        if self._json.peek() != "":
+            raise self._json._error("Extra data")
+
+        # The notebook's title takes precedence over the first heading
+        if metadata_title is not None:
+            self.title = metadata_title
+
+    def _read_cell(self) -> Union[None, str]:
+        cell_type = ""
+        source_lines = []
+        outputs = []
+        for key in self._json.iter_object():
+            if key == "cell_type":
+                cell_type = self._json.parse()
+            elif key == "source":
+                source_lines = self._json.parse()
+            elif key == "outputs" and self._text_outputs:
+                for _ in self._json.iter_array():
+                    output = self._read_output()
+                    if output is not None:
+                        outputs.append(output)
+            else:
+                self._json.skip()
+
+        if cell_type == "markdown":
+            # Extract the first # heading as title if not already found
+            if self.title is None:
+                for line in source_lines:
+                    if line.startswith("# "):
+                        self.title = line.lstrip("# ").strip()
+                        break
+            return "".join(source_lines)
+
+        elif cell_type == "code":
+            # Code cells are wrapped in Markdown code blocks
+            text = f"```python\n{''.join(source_lines)}\n```"
+            for output, truncated in outputs:
+                output = output.rstrip("\n")
+                if truncated:
+                    output += "\n[output truncated]"
+                text += f"\n\nOutput:\n\n```\n{output}\n```"
+            return text
+        elif cell_type == "raw":
+            return f"```\n{''.join(source_lines)}\n```"
+        return None
+
+    def _read_output(self) -> Union[None, Tuple[str, bool]]:
+        """The (truncated) text of an output: the text of a stream, the text/plain representation of
+        a result, or the name and value of an error. Returns None for other outputs (e.g., images).
+        """
+        text = None
+        error = {}
+        for key in self._json.iter_object():
+            if key == "text":
+                text = self._json.parse_text(self._text_outputs)
+            elif key == "data":
+                for mime_type in self._json.iter_object():
+                    if mime_type == "text/plain":
+                        text = self._json.parse_text(self._text_outputs)
+                    else:
+                        self._json.skip()
+            elif key in ["ename", "evalue"]:
+                error[key] = self._json.parse()
+            else:
+                self._json.skip()
+
+        if text is None and error:
+            text = (f"{error.get('ename', '')}: {error.get('evalue', '')}", False)
+        return text
+
+
 class IpynbConverter(DocumentConverter):
-    """Converts Jupyter Notebook (.ipynb) files to Markdown."""
+    """Converts Jupyter Notebook (.ipynb) files to Markdown.
+
+    The notebook is parsed incrementally, and only the cells' types and sources are read: outputs
+    (e.g., images and dataframes) are skipped without being parsed, so large notebooks convert
+    in bounded memory. With the ipynb_text_outputs option, the text outputs of code cells (streams,
+    plain text results and errors) are included, truncated to that many characters each.
+    """
+
+    supported_extensions = [".ipynb"]
+    accepts_streams = True
 
     def convert(
         self, local_path: str, **kwargs: Any
@@ -553,49 +1681,35 @@ class IpynbConverter(DocumentConverter):
             return None
 
         # Parse and convert the notebook
-        result = None
-        with open(local_path, "rt", encoding="utf-8") as fh:
-            notebook_content = json.load(fh)
-            result = self._convert(notebook_content)
-
-        return result
-
-    def _convert(self, notebook_content: dict) -> Union[None, DocumentConverterResult]:
-        """Helper function that converts notebook JSON content to Markdown."""
-        try:
-            md_output = []
-            title = None
-
-            for cell in notebook_content.get("cells", []):
-                cell_type = cell.get("cell_type", "")
-                source_lines = cell.get("source", [])
-
-                if cell_type == "markdown":
-                    md_output.append("".join(source_lines))
-
-                    # Extract the first # heading as title if not already found
-                    if title is None:
-                        for line in source_lines:
-                            if line.startswith("# "):
-                                title = line.lstrip("# ").strip()
-                                break
-
-                elif cell_type == "code":
-                    # Code cells are wrapped in Markdown code blocks
-                    md_output.append(f"```python\n{''.join(source_lines)}\n```")
-                elif cell_type == "raw":
-                    md_output.append(f"```\n{''.join(source_lines)}\n```")
+        with _open_binary(local_path) as fh:
+            reader = _NotebookReader(fh, kwargs.get("ipynb_text_outputs"))
+            text_content = "".join(self._iter_cells(reader))
+        return DocumentConverterResult(title=reader.title, text_content=text_content)
 
-            md_text = "\n\n".join(md_output)
+    def convert_iter(
+        self, local_path: str, **kwargs: Any
+    ) -> Union[None, Iterator[str]]:
+        # Bail if not ipynb
+        extension = kwargs.get("file_extension", "")
+        if extension.lower() != ".ipynb":
+            return None
 
-            # Check for title in notebook metadata
-            title = notebook_content.get("metadata", {}).get("title", title)
+        return self._iter_notebook(local_path, kwargs.get("ipynb_text_outputs"))
 
-            return DocumentConverterResult(
-                title=title,
-                text_content=md_text,
-            )
+    def _iter_notebook(
+        self, local_path: str, text_outputs: Optional[int]
+    ) -> Iterator[str]:
+        with _open_binary(local_path) as fh:
+            yield from self._iter_cells(_NotebookReader(fh, text_outputs))
 
+    def _iter_cells(self, reader: _NotebookReader) -> Iterator[str]:
+        """Yield the Markdown of each cell. Syntax errors are raised as they are (like json.loads
+        would), and errors in the structure of the notebook as FileConversionException.
+        """
+        try:
+            yield from reader
+        except json.JSONDecodeError:
+            raise
         except Exception as e:
             raise FileConversionException(
                 f"Error converting .ipynb file: {str(e)}"
@@ -608,6 +1722,11 @@ class BingSerpConverter(DocumentConverter):
     NOTE: It is better to use the Bing API
     """
 
+    # 2: rendered by _MarkdownSerializer
+    version = "2"
+    supported_extensions = [".html", ".htm"]
+    accepts_streams = True
+
     def convert(self, local_path, **kwargs) -> Union[None, DocumentConverterResult]:
         # Bail if not a Bing SERP
         extension = kwargs.get("file_extension", "")
@@ -621,22 +1740,23 @@ class BingSerpConverter(DocumentConverter):
         parsed_params = parse_qs(urlparse(url).query)
         query = parsed_params.get("q", [""])[0]
 
-        # Parse the file
-        soup = None
-        with open(local_path, "rt", encoding="utf-8") as fh:
-            soup = BeautifulSoup(fh.read(), "html.parser")
-
-        # Clean up some formatting
-        for tptt in soup.find_all(class_="tptt"):
-            if hasattr(tptt, "string") and tptt.string:
-                tptt.string += " "
-        for slug in soup.find_all(class_="algoSlug_icon"):
-            slug.extract()
+        # Parse the file (the results are in the body)
+        soup = _parse_html(_read_text(local_path), kwargs, body_only=True)
 
         # Parse the algorithmic results
-        _markdownify = _CustomMarkdownify()
+        _markdownify = _markdown_serializer()
         results = list()
         for result in soup.find_all(class_="b_algo"):
+            # The document may be shared with other converters, so edit a copy
+            result = copy.copy(result)
+
+            # Clean up some formatting
+            for tptt in result.find_all(class_="tptt"):
+                if hasattr(tptt, "string") and tptt.string:
+                    tptt.string += " "
+            for slug in result.find_all(class_="algoSlug_icon"):
+                slug.extract()
+
             # Rewrite redirect urls
             for a in result.find_all("a", href=True):
                 parsed_href = urlparse(a["href"])
@@ -673,27 +1793,257 @@ class BingSerpConverter(DocumentConverter):
         )
 
 
-class PdfConverter(DocumentConverter):
+class PdfEngine:
     """
-    Converts PDFs to Markdown. Most style information is ignored, so the results are essentially plain-text.
+    Abstract superclass of the PDF text extraction engines that PdfConverter can use. Each engine
+    wraps a PDF library, and extracts the text one page at a time.
     """
 
-    def convert(self, local_path, **kwargs) -> Union[None, DocumentConverterResult]:
-        # Bail if not a PDF
-        extension = kwargs.get("file_extension", "")
-        if extension.lower() != ".pdf":
-            return None
+    # The module that must be importable for the engine to be available
+    requirement: str = None
 
-        return DocumentConverterResult(
-            title=None,
-            text_content=pdfminer.high_level.extract_text(local_path),
-        )
+    def is_available(self) -> bool:
+        return importlib.util.find_spec(self.requirement) is not None
 
+    def count_pages(self, source: Union[str, BinaryIO]) -> int:
+        raise NotImplementedError()
 
-class DocxConverter(HtmlConverter):
-    """
-    Converts DOCX files to Markdown. Style information (e.g.m headings) and tables are preserved where possible.
-    """
+    def iter_pages(
+        self, source: Union[str, BinaryIO], page_numbers: Optional[List[int]] = None
+    ) -> Iterator[str]:
+        """Yield the text of each page (or of the given 0-based pages), ending with a form feed."""
+        raise NotImplementedError()
+
+
+class PdfminerEngine(PdfEngine):
+    """The default engine: pdfminer.six, slow but with the best layout analysis."""
+
+    requirement = "pdfminer"
+
+    def count_pages(self, source: Union[str, BinaryIO]) -> int:
+        import pdfminer.pdfpage
+
+        with _open_binary(source) as fh:
+            return sum(1 for _ in pdfminer.pdfpage.PDFPage.get_pages(fh))
+
+    def iter_pages(
+        self, source: Union[str, BinaryIO], page_numbers: Optional[List[int]] = None
+    ) -> Iterator[str]:
+        """This mirrors pdfminer.high_level.extract_text, so the pages join to the same text."""
+        import pdfminer.converter
+        import pdfminer.layout
+        import pdfminer.pdfinterp
+        import pdfminer.pdfpage
+
+        with _open_binary(source) as fh, io.StringIO() as output_string:
+            rsrcmgr = pdfminer.pdfinterp.PDFResourceManager(caching=True)
+            device = pdfminer.converter.TextConverter(
+                rsrcmgr,
+                output_string,
+                codec="utf-8",
+                laparams=pdfminer.layout.LAParams(),
+            )
+            interpreter = pdfminer.pdfinterp.PDFPageInterpreter(rsrcmgr, device)
+
+            for page in pdfminer.pdfpage.PDFPage.get_pages(
+                fh, page_numbers, caching=True
+            ):
+                interpreter.process_page(page)
+                yield output_string.getvalue()
+                output_string.seek(0)
+                output_string.truncate(0)
+
+
+class PdfiumEngine(PdfEngine):
+    """pypdfium2 (PDFium's text extraction): much faster than pdfminer, with a simpler layout."""
+
+    requirement = "pypdfium2"
+
+    def count_pages(self, source: Union[str, BinaryIO]) -> int:
+        import pypdfium2
+
+        with _open_binary(source) as fh:
+            pdf = pypdfium2.PdfDocument(fh)
+            try:
+                return len(pdf)
+            finally:
+                pdf.close()
+
+    def iter_pages(
+        self, source: Union[str, BinaryIO], page_numbers: Optional[List[int]] = None
+    ) -> Iterator[str]:
+        import pypdfium2
+
+        with _open_binary(source) as fh:
+            pdf = pypdfium2.PdfDocument(fh)
+            try:
+                for i in range(len(pdf)) if page_numbers is None else page_numbers:
+                    page = pdf[i]
+                    text_page = page.get_textpage()
+                    try:
+                        text = text_page.get_text_range()
+                    finally:
+                        text_page.close()
+                        page.close()
+                    yield text.rstrip("\r\n") + "\n\f"
+            finally:
+                pdf.close()
+
+
+class PypdfEngine(PdfEngine):
+    """pypdf (or PyPDF2, its former name): pure Python, and faster than pdfminer."""
+
+    requirement = "pypdf"
+
+    def is_available(self) -> bool:
+        return super().is_available() or importlib.util.find_spec("PyPDF2") is not None
+
+    def _reader(self, fh: BinaryIO) -> Any:
+        try:
+            from pypdf import PdfReader
+        except ImportError:
+            from PyPDF2 import PdfReader
+        return PdfReader(fh)
+
+    def count_pages(self, source: Union[str, BinaryIO]) -> int:
+        with _open_binary(source) as fh:
+            return len(self._reader(fh).pages)
+
+    def iter_pages(
+        self, source: Union[str, BinaryIO], page_numbers: Optional[List[int]] = None
+    ) -> Iterator[str]:
+        with _open_binary(source) as fh:
+            reader = self._reader(fh)
+            for i in range(len(reader.pages)) if page_numbers is None else page_numbers:
+                text = reader.pages[i].extract_text() or ""
+                yield text.rstrip("\r\n") + "\n\f"
+
+
+class PdfConverter(DocumentConverter):
+    """
+    Converts PDFs to Markdown. Most style information is ignored, so the results are essentially plain-text.
+
+    The text is extracted by one of several engines, chosen with the pdf_engine option: an engine
+    name, or a profile ("quality", the default, or "fast") that picks the first available engine
+    from its list. Optional engines are used only when their library is installed.
+    """
+
+    supported_extensions = [".pdf"]
+    accepts_streams = True
+
+    # The engines, by name
+    engines: Dict[str, PdfEngine] = {
+        "pdfminer": PdfminerEngine(),
+        "pdfium": PdfiumEngine(),
+        "pypdf": PypdfEngine(),
+    }
+
+    # The engines of each profile, in order of preference
+    profiles: Dict[str, List[str]] = {
+        "quality": ["pdfminer"],
+        "fast": ["pdfium", "pypdf", "pdfminer"],
+    }
+
+    def convert(self, local_path, **kwargs) -> Union[None, DocumentConverterResult]:
+        pages = self.convert_iter(local_path, **kwargs)
+        if pages is None:
+            return None
+
+        return DocumentConverterResult(
+            title=None,
+            text_content="".join(pages),
+        )
+
+    def convert_iter(self, local_path, **kwargs) -> Union[None, Iterator[str]]:
+        # Bail if not a PDF
+        extension = kwargs.get("file_extension", "")
+        if extension.lower() != ".pdf":
+            return None
+
+        engine_name = self.get_engine_name(kwargs.get("pdf_engine") or "quality")
+
+        # Optionally split the pages across a pool of processes (which need a path to open)
+        max_workers = kwargs.get("max_workers")
+        if max_workers is not None and max_workers > 1 and not _is_stream(local_path):
+            return self._iter_text_parallel(local_path, engine_name, max_workers)
+        else:
+            return self.engines[engine_name].iter_pages(local_path)
+
+    def get_engine_name(self, pdf_engine: str) -> str:
+        """Resolve an engine name or a profile to the name of an available engine."""
+        if pdf_engine in self.profiles:
+            for name in self.profiles[pdf_engine]:
+                if self.engines[name].is_available():
+                    return name
+            raise ValueError(
+                f"No PDF engine of the '{pdf_engine}' profile is installed."
+            )
+
+        if pdf_engine not in self.engines:
+            raise ValueError(
+                f"Unknown PDF engine '{pdf_engine}'. Use one of {list(self.engines) + list(self.profiles)}."
+            )
+        if not self.engines[pdf_engine].is_available():
+            raise ValueError(
+                f"The PDF engine '{pdf_engine}' requires {self.engines[pdf_engine].requirement}, which is not installed."
+            )
+        return pdf_engine
+
+    def _iter_text_parallel(
+        self, local_path: str, engine_name: str, max_workers: int
+    ) -> Iterator[str]:
+        """Extract the text of contiguous page slices in worker processes, and yield them in order.
+        The slices join to the same text as extracting all the pages at once.
+        """
+        engine = self.engines[engine_name]
+        page_count = engine.count_pages(local_path)
+
+        if page_count < 2:
+            yield from engine.iter_pages(local_path)
+            return
+
+        # Use a few slices per worker, so that uneven pages balance out
+        slice_count = min(page_count, max_workers * 4)
+        bounds = [page_count * i // slice_count for i in range(slice_count + 1)]
+        slices = [list(range(bounds[i], bounds[i + 1])) for i in range(slice_count)]
+
+        with concurrent.futures.ProcessPoolExecutor(
+            max_workers=min(max_workers, slice_count)
+        ) as executor:
+            yield from executor.map(
+                _extract_pdf_pages,
+                [local_path] * slice_count,
+                slices,
+                [engine_name] * slice_count,
+            )
+
+
+def _extract_pdf_pages(
+    local_path: str, page_numbers: List[int], engine_name: str = "pdfminer"
+) -> str:
+    """Extract the text of the given (0-based) pages of a PDF. Runs in PdfConverter's worker processes."""
+    engine = PdfConverter.engines[engine_name]
+    return "".join(engine.iter_pages(local_path, page_numbers))
+
+
+class DocxConverter(HtmlConverter):
+    """
+    Converts DOCX files to Markdown. Style information (e.g.m headings) and tables are preserved where possible.
+
+    By default, word/document.xml is streamed with an incremental XML parser, and paragraphs, headings,
+    lists, tables, links and comments are written straight to Markdown, as mammoth and markdownify
+    would render them. Documents with other content (e.g., footnotes, fields or text boxes), or
+    converted with a style_map other than "comment-reference => ", fall back to mammoth. Pass
+    docx_streaming=False to always use mammoth.
+
+    Either way, images are written according to the image_policy option (see _ImagePolicy), rather
+    than inlined as base64 data URIs.
+    """
+
+    # 2: the streaming reader, and images written according to the image_policy option
+    version = "2"
+    supported_extensions = [".docx"]
+    accepts_streams = True
 
     def convert(self, local_path, **kwargs) -> Union[None, DocumentConverterResult]:
         # Bail if not a DOCX
@@ -701,39 +2051,1046 @@ class DocxConverter(HtmlConverter):
         if extension.lower() != ".docx":
             return None
 
-        result = None
-        with open(local_path, "rb") as docx_file:
-            style_map = kwargs.get("style_map", None)
+        style_map = kwargs.get("style_map", None)
+        image_policy = _ImagePolicy.from_kwargs(kwargs)
+        if kwargs.get("docx_streaming", True):
+            include_comments = _docx_style_map_comments(style_map)
+            if include_comments is not None:
+                try:
+                    with _open_binary(local_path) as docx_file:
+                        with zipfile.ZipFile(docx_file) as zip_file:
+                            reader = _DocxReader(
+                                zip_file, include_comments, image_policy
+                            )
+                            text_content = "".join(reader.iter_markdown())
+                    return DocumentConverterResult(
+                        title=None, text_content=text_content
+                    )
+                except _DocxFallback:
+                    pass
+
+        import mammoth
+
+        def _convert_image(image):
+            def _read():
+                with image.open() as fh:
+                    return fh.read()
 
-            result = mammoth.convert_to_html(docx_file, style_map=style_map)
+            src = image_policy.src(image.content_type, _read)
+            if src is None:
+                return []
+            attributes = {"alt": image.alt_text} if image.alt_text else {}
+            attributes["src"] = src
+            return [mammoth.html.element("img", attributes)]
+
+        result = None
+        with _open_binary(local_path) as docx_file:
+            result = mammoth.convert_to_html(
+                docx_file, style_map=style_map, convert_image=_convert_image
+            )
             html_content = result.value
-            result = self._convert(html_content)
+            result = self._convert(html_content, **kwargs)
 
         return result
 
 
+def _docx_style_map_comments(style_map: Optional[str]) -> Optional[bool]:
+    """Whether a mammoth style map includes comments (i.e., is "comment-reference => "), or None if
+    the style map maps anything else, and must be applied by mammoth."""
+    include_comments = False
+    for line in (style_map or "").split("\n"):
+        line = line.strip()
+        if line == "" or line.startswith("#"):
+            continue
+        if re.match(r"^comment-reference\s*=>$", line) is None:
+            return None
+        include_comments = True
+    return include_comments
+
+
+class _DocxFallback(Exception):
+    """Raised by _DocxReader on content it does not convert, to fall back to mammoth."""
+
+
+# The namespaces of the WordprocessingML elements and attributes read by _DocxReader
+_W = "{http://schemas.openxmlformats.org/wordprocessingml/2006/main}"
+_R = "{http://schemas.openxmlformats.org/officeDocument/2006/relationships}"
+_WP = "{http://schemas.openxmlformats.org/drawingml/2006/wordprocessingDrawing}"
+_A = "{http://schemas.openxmlformats.org/drawingml/2006/main}"
+_PIC = "{http://schemas.openxmlformats.org/drawingml/2006/picture}"
+_PACKAGE_RELATIONSHIPS = (
+    "{http://schemas.openxmlformats.org/package/2006/relationships}"
+)
+
+# Elements that mammoth renders, but _DocxReader does not (notes, fields, symbols, ...). Drawings
+# are only read in runs.
+_DOCX_FALLBACK_ELEMENTS = {
+    _W + "drawing",
+    _W + "pict",
+    _W + "object",
+    _W + "sym",
+    _W + "fldChar",
+    _W + "instrText",
+    _W + "footnoteReference",
+    _W + "endnoteReference",
+    _W + "txbxContent",
+    "{http://schemas.openxmlformats.org/markup-compatibility/2006}AlternateContent",
+    "{http://schemas.openxmlformats.org/drawingml/2006/wordprocessingDrawing}inline",
+    "{http://schemas.openxmlformats.org/drawingml/2006/wordprocessingDrawing}anchor",
+    "{urn:schemas-microsoft-com:vml}imagedata",
+    "{urn:schemas-microsoft-com:vml}shape",
+    "{urn:schemas-microsoft-com:vml}textbox",
+}
+
+# Elements whose children are read in place of the element (e.g., tracked insertions)
+_DOCX_TRANSPARENT_ELEMENTS = {
+    _W + "ins",
+    _W + "smartTag",
+    _W + "customXml",
+    _W + "moveTo",
+    _W + "moveFromRangeStart",
+    _W + "moveFromRangeEnd",
+    _W + "moveToRangeStart",
+    _W + "moveToRangeEnd",
+}
+
+# Runs of these styles are dropped by mammoth's default style map
+_DOCX_IGNORED_RUN_STYLES = {
+    "FOOTNOTE REFERENCE",
+    "ENDNOTE REFERENCE",
+    "ANNOTATION REFERENCE",
+    "FOOTNOTE ANCHOR",
+    "ENDNOTE ANCHOR",
+}
+
+# Written in the HTML in place of empty elements that mammoth keeps (e.g., empty table cells)
+_FORCE_WRITE = object()
+
+
+class _HtmlNode:
+    """An element of the HTML that mammoth would generate for a document. Like mammoth's, a node
+    may have several tag names (e.g., "ul" or "ol"), and only collapsible nodes are merged into an
+    identical previous sibling."""
+
+    __slots__ = ["tags", "attributes", "collapsible", "children"]
+
+    def __init__(
+        self,
+        tags: Tuple[str, ...],
+        attributes: Dict[str, str],
+        collapsible: bool,
+        children: List[Any],
+    ):
+        self.tags = tags
+        self.attributes = attributes
+        self.collapsible = collapsible
+        self.children = children
+
+    @property
+    def tag(self) -> str:
+        return self.tags[0]
+
+
+def _strip_empty(nodes: List[Any]) -> List[Any]:
+    """Remove empty text and elements, as mammoth does before writing its HTML."""
+    stripped = []
+    for node in nodes:
+        if isinstance(node, _HtmlNode):
+            node.children = _strip_empty(node.children)
+            if len(node.children) == 0 and node.tag not in ["br", "img"]:
+                continue
+        elif node == "":
+            continue
+        stripped.append(node)
+    return stripped
+
+
+def _collapse(nodes: List[Any]) -> List[Any]:
+    """Merge collapsible elements into identical previous siblings, as mammoth does."""
+    collapsed = []
+    for node in nodes:
+        _collapsing_add(collapsed, node)
+    return collapsed
+
+
+def _collapsing_add(collapsed: List[Any], node: Any) -> None:
+    if isinstance(node, _HtmlNode):
+        node.children = _collapse(node.children)
+        if (
+            node.collapsible
+            and len(collapsed) > 0
+            and isinstance(collapsed[-1], _HtmlNode)
+            and collapsed[-1].tag in node.tags
+            and collapsed[-1].attributes == node.attributes
+        ):
+            for child in node.children:
+                _collapsing_add(collapsed[-1].children, child)
+            return
+    collapsed.append(node)
+
+
+def _render_html_nodes(
+    nodes: List[Any], inline: bool = False, ancestors: Tuple[str, ...] = ()
+) -> str:
+    """Render mammoth's HTML nodes to Markdown, as _MarkdownSerializer would render the HTML."""
+    output = []
+    i = 0
+    while i < len(nodes):
+        node = nodes[i]
+        if isinstance(node, _HtmlNode):
+            following = [n for n in nodes[i + 1 :] if n is not _FORCE_WRITE]
+            next_tag = None
+            if len(following) > 0:
+                next_tag = (
+                    following[0].tag if isinstance(following[0], _HtmlNode) else ""
+                )
+            output.append(_render_html_node(node, inline, ancestors, next_tag))
+            i += 1
+            continue
+        if node is _FORCE_WRITE:
+            i += 1
+            continue
+
+        # Consecutive text nodes are a single string in the HTML
+        j = i
+        while j < len(nodes) and not isinstance(nodes[j], _HtmlNode):
+            j += 1
+        text = "".join(n for n in nodes[i:j] if n is not _FORCE_WRITE)
+        text = _escape_markdown(re.sub(r"[\t ]+", " ", text))
+        if (
+            len(ancestors) > 0
+            and ancestors[-1] == "li"
+            and (j == len(nodes) or nodes[j].tag in ["ul", "ol"])
+        ):
+            text = text.rstrip()
+        output.append(text)
+        i = j
+    return "".join(output)
+
+
+def _render_html_node(
+    node: _HtmlNode,
+    inline: bool,
+    ancestors: Tuple[str, ...],
+    next_tag: Optional[str] = None,
+) -> str:
+    """Render a node, given the tag of its next sibling ("" for text, None if it is the last)."""
+    tag = node.tag
+    heading = re.match(r"^h([1-6])$", tag)
+    children_inline = inline or heading is not None or tag in ["td", "th"]
+
+    if tag in ["ul", "ol"]:
+        items = []
+        for index, item in enumerate(node.children):
+            text = _render_html_nodes(
+                item.children, children_inline, ancestors + (tag, "li")
+            )
+            if tag == "ol":
+                bullet = f"{index + 1}."
+            else:
+                bullet = "*+-"[(ancestors.count("ul")) % 3]
+            items.append(f"{bullet} {text.strip()}\n")
+        text = "".join(items)
+        if "li" in ancestors:
+            return "\n" + re.sub(r"^", "\t", text, flags=re.MULTILINE).rstrip()
+        return text + (
+            "\n" if next_tag is not None and next_tag not in ["ul", "ol"] else ""
+        )
+
+    if tag == "table":
+        rows = []
+        for index, row in enumerate(n for n in node.children if n is not _FORCE_WRITE):
+            cells = [n for n in row.children if n is not _FORCE_WRITE]
+            text = "".join(
+                _render_html_node(cell, children_inline, ancestors + (tag, "tr"))
+                for cell in cells
+            )
+            rows.append("|" + text + "\n")
+            if index == 0:
+                colspan = sum(int(c.attributes.get("colspan", 1)) for c in cells)
+                rows.append("| " + " | ".join(["---"] * colspan) + " |\n")
+        return "\n\n" + "".join(rows) + "\n"
+
+    text = _render_html_nodes(node.children, children_inline, ancestors + (tag,))
+
+    if tag == "p":
+        return text if inline or not text else text + "\n\n"
+    if heading is not None:
+        if inline:
+            return text
+        prefix = "" if text.startswith("\n") else "\n"
+        return prefix + "#" * int(heading.group(1)) + " " + text.strip() + "\n\n"
+    if tag in ["td", "th"]:
+        colspan = int(node.attributes.get("colspan", 1))
+        return " " + text.strip().replace("\n", " ") + " |" * colspan
+    if tag == "br":
+        return "" if inline else "  \n"
+    if tag == "img":
+        alt = node.attributes.get("alt") or ""
+        if inline:
+            return alt
+        src = node.attributes["src"]
+        if src.startswith("data:"):
+            src = src.split(",")[0] + "..."
+        return f"![{alt}]({src})"
+    if tag == "a":
+        return _markdown_link(node.attributes, text)
+    if tag in ["strong", "em", "s", "sub", "sup"]:
+        marker = {"strong": "**", "em": "*", "s": "~~"}.get(tag, "")
+        prefix = " " if text.startswith(" ") else ""
+        suffix = " " if text.endswith(" ") else ""
+        text = text.strip()
+        if not text:
+            return ""
+        return prefix + marker + text + marker + suffix
+    return text
+
+
+class _DocxReader:
+    """
+    Converts a DOCX file to Markdown, streaming word/document.xml with an incremental XML parser.
+    The output is the same as converting the HTML of mammoth (with its default style map) with
+    _MarkdownSerializer: the reader builds mammoth's HTML nodes for one top-level block at a time,
+    and renders them as markdownify would. Raises _DocxFallback on content it does not support.
+    """
+
+    def __init__(
+        self,
+        zip_file: zipfile.ZipFile,
+        include_comments: bool = False,
+        image_policy: Optional[_ImagePolicy] = None,
+    ):
+        from xml.etree import ElementTree
+
+        self._zip_file = zip_file
+        self._include_comments = include_comments
+        self._image_policy = image_policy or _ImagePolicy()
+        self._referenced_comments = []
+        self._content_types = None  # Read with the first image
+
+        names = set(zip_file.namelist())
+        self._names = names
+        if "mammoth/style-map" in names:
+            raise _DocxFallback("The document embeds a style map")
+
+        self._document_path = self._find_part("", "_rels/.rels", "officeDocument")
+        if self._document_path is None:
+            self._document_path = "word/document.xml"
+        base, name = os.path.split(self._document_path)
+        document_rels = f"{base}/_rels/{name}.rels" if base else f"_rels/{name}.rels"
+        self._relationships = self._read_relationships(document_rels)
+
+        def _read_part(relationship_type):
+            path = self._find_part(base, document_rels, relationship_type)
+            if path is None:
+                path = f"{base or 'word'}/{relationship_type}.xml"
+            if path not in names:
+                return None, path
+            with zip_file.open(path) as fh:
+                return ElementTree.parse(fh).getroot(), path
+
+        # Styles: the names of paragraph and character styles
+        self._paragraph_styles = {}
+        self._character_styles = {}
+        styles, _ = _read_part("styles")
+        if styles is not None:
+            for style in styles.iter(_W + "style"):
+                name = style.find(_W + "name")
+                name = None if name is None else name.get(_W + "val")
+                style_id = style.get(_W + "styleId")
+                if style.get(_W + "type") == "paragraph":
+                    self._paragraph_styles[style_id] = name
+                elif style.get(_W + "type") == "character":
+                    self._character_styles[style_id] = name
+
+        # Numbering: whether each level of each list is ordered
+        self._abstract_nums = {}
+        self._nums = {}
+        self._numbered_styles = set()
+        numbering, _ = _read_part("numbering")
+        if numbering is not None:
+            for abstract_num in numbering.iter(_W + "abstractNum"):
+                levels = {}
+                for level in abstract_num.iter(_W + "lvl"):
+                    num_fmt = level.find(_W + "numFmt")
+                    is_ordered = num_fmt is None or num_fmt.get(_W + "val") != "bullet"
+                    levels.setdefault(level.get(_W + "ilvl") or "0", is_ordered)
+                    style = level.find(_W + "pStyle")
+                    if style is not None:
+                        self._numbered_styles.add(style.get(_W + "val"))
+                linked = abstract_num.find(_W + "numStyleLink") is not None
+                self._abstract_nums[abstract_num.get(_W + "abstractNumId")] = (
+                    levels,
+                    linked,
+                )
+            for num in numbering.iter(_W + "num"):
+                abstract_num_id = num.find(_W + "abstractNumId")
+                if abstract_num_id is not None:
+                    self._nums[num.get(_W + "numId")] = abstract_num_id.get(_W + "val")
+
+        # Comments, with the relationships of their part (for links)
+        self._comments = {}
+        comments, comments_path = _read_part("comments")
+        if comments is not None and include_comments:
+            base, name = os.path.split(comments_path)
+            comment_relationships = self._read_relationships(
+                f"{base}/_rels/{name}.rels"
+            )
+            for comment in comments.iter(_W + "comment"):
+                self._comments[comment.get(_W + "id")] = (
+                    comment,
+                    comment.get(_W + "initials") or "",
+                    comment_relationships,
+                )
+
+    def iter_markdown(self) -> Iterator[str]:
+        """Yield the Markdown of the document, one top-level block (or list) at a time."""
+        pending = None
+        for element in self._iter_body():
+            for node in _strip_empty(self._read_block(element, False)):
+                node.children = _collapse(node.children)
+                if (
+                    pending is not None
+                    and node.collapsible
+                    and pending.tag in node.tags
+                    and pending.attributes == node.attributes
+                ):
+                    for child in node.children:
+                        _collapsing_add(pending.children, child)
+                    continue
+                if pending is not None:
+                    yield _render_html_node(pending, False, (), node.tag)
+                pending = node
+        if pending is not None:
+            next_tag = "dl" if len(self._referenced_comments) > 0 else None
+            yield _render_html_node(pending, False, (), next_tag)
+
+        # The comments are listed at the end, in the order of their first reference
+        comments = []
+        for label, comment_id in self._referenced_comments:
+            comment, _, relationships = self._comments[comment_id]
+            self._relationships = relationships
+            body = self._read_blocks(comment, False) + [
+                _HtmlNode(
+                    ("p",),
+                    {},
+                    True,
+                    [
+                        " ",
+                        _HtmlNode(
+                            ("a",), {"href": f"#comment-ref-{comment_id}"}, False, ["↑"]
+                        ),
+                    ],
+                )
+            ]
+            comments.append(
+                _HtmlNode(
+                    ("dt",),
+                    {"id": f"comment-{comment_id}"},
+                    False,
+                    [f"Comment {label}"],
+                )
+            )
+            comments.append(_HtmlNode(("dd",), {}, False, body))
+        yield _render_html_nodes(_collapse(_strip_empty(comments)))
+
+    def _iter_body(self) -> Iterator[Any]:
+        """Yield the children of the document's body as they are parsed, and free them after use."""
+        from xml.etree import ElementTree
+
+        depth = 0
+        body = None
+        with self._zip_file.open(self._document_path) as fh:
+            for event, element in ElementTree.iterparse(fh, events=("start", "end")):
+                if event == "start":
+                    depth += 1
+                    if depth == 2 and element.tag == _W + "body":
+                        body = element
+                    continue
+                depth -= 1
+                if depth == 2 and body is not None:
+                    yield element
+                    body.remove(element)
+
+    def _read_blocks(self, parent: Any, in_cell: bool) -> List[Any]:
+        nodes = []
+        for child in parent:
+            nodes.extend(self._read_block(child, in_cell))
+        return nodes
+
+    def _read_block(self, element: Any, in_cell: bool) -> List[Any]:
+        """The HTML nodes of a paragraph, a table, or another block-level element."""
+        tag = element.tag
+        if tag == _W + "p":
+            return [self._read_paragraph(element, in_cell)]
+        if tag == _W + "tbl":
+            if in_cell:
+                raise _DocxFallback("Nested table")
+            return [self._read_table(element)]
+        if tag == _W + "sdt":
+            return self._read_blocks(self._sdt_content(element), in_cell)
+        if tag in _DOCX_TRANSPARENT_ELEMENTS:
+            return self._read_blocks(element, in_cell)
+        if tag == _W + "bookmarkStart":
+            return self._read_bookmark(element)
+        if tag in _DOCX_FALLBACK_ELEMENTS or tag in [_W + "r", _W + "hyperlink"]:
+            raise _DocxFallback(f"Unsupported element {tag}")
+        # Like mammoth, ignore anything else (e.g., w:sectPr)
+        return []
+
+    def _read_paragraph(self, paragraph: Any, in_cell: bool) -> _HtmlNode:
+        properties = paragraph.find(_W + "pPr")
+        if properties is None:
+            properties = paragraph.makeelement(_W + "pPr", {})
+        if properties.find(f"{_W}rPr/{_W}del") is not None:
+            raise _DocxFallback("Deleted paragraph mark")
+
+        style = properties.find(_W + "pStyle")
+        style_id = None if style is None else style.get(_W + "val")
+        style_name = (self._paragraph_styles.get(style_id) or "").upper()
+        children = self._read_inline(paragraph)
+
+        # Headings, as in mammoth's default style map
+        match = re.match(r"^Heading([1-6])?$", style_id or "") or re.match(
+            r"^HEADING(?: ([1-6]))?$", style_name
+        )
+        if match is not None:
+            return _HtmlNode((f"h{match.group(1) or 1}",), {}, False, children)
+
+        # Lists, up to 5 levels deep
+        level = self._read_numbering(properties, style_id)
+        if level is not None and level[0] in ["0", "1", "2", "3", "4"]:
+            if in_cell:
+                raise _DocxFallback("List in a table cell")
+            list_tag = "ol" if level[1] else "ul"
+            node = _HtmlNode(
+                (list_tag,), {}, True, [_HtmlNode(("li",), {}, False, children)]
+            )
+            for _ in range(int(level[0])):
+                node = _HtmlNode(("li",), {}, True, [node])
+                node = _HtmlNode(("ul", "ol"), {}, True, [node])
+            return node
+
+        return _HtmlNode(("p",), {}, False, children)
+
+    def _read_numbering(self, properties: Any, style_id: Optional[str]):
+        """The (level index, is ordered) of a numbered paragraph, or None."""
+        num_pr = properties.find(_W + "numPr")
+        num_id = level_index = None
+        if num_pr is not None:
+            num_id = num_pr.find(_W + "numId")
+            num_id = None if num_id is None else num_id.get(_W + "val")
+            level_index = num_pr.find(_W + "ilvl")
+            level_index = None if level_index is None else level_index.get(_W + "val")
+        if num_id is None or level_index is None:
+            if style_id in self._numbered_styles:
+                raise _DocxFallback("Numbering from a paragraph style")
+            if num_id is None:
+                return None
+            level_index = "0"
+
+        abstract_num = self._abstract_nums.get(self._nums.get(num_id))
+        if abstract_num is None:
+            return None
+        levels, linked = abstract_num
+        if linked:
+            raise _DocxFallback("Numbering linked to a style")
+        if level_index not in levels:
+            return None
+        return level_index, levels[level_index]
+
+    def _read_table(self, table: Any) -> _HtmlNode:
+        rows = []
+        for row in table:
+            if row.tag in [_W + "tblPr", _W + "tblGrid"]:
+                continue
+            if row.tag != _W + "tr":
+                raise _DocxFallback("Unexpected element in a table")
+            properties = row.find(_W + "trPr")
+            if properties is not None:
+                if properties.find(_W + "del") is not None:
+                    continue
+                if properties.find(_W + "tblHeader") is not None:
+                    raise _DocxFallback("Table header row")
+            cells = []
+            for cell in row:
+                if cell.tag == _W + "trPr":
+                    continue
+                if cell.tag != _W + "tc":
+                    raise _DocxFallback("Unexpected element in a table row")
+                properties = cell.find(_W + "tcPr")
+                colspan, vmerge = 1, False
+                if properties is not None:
+                    grid_span = properties.find(_W + "gridSpan")
+                    if grid_span is not None and grid_span.get(_W + "val"):
+                        colspan = int(grid_span.get(_W + "val"))
+                    v_merge = properties.find(_W + "vMerge")
+                    if v_merge is not None:
+                        vmerge = v_merge.get(_W + "val") in [None, "", "continue"]
+                cells.append((colspan, vmerge, self._read_blocks(cell, True)))
+            rows.append(cells)
+
+        # Vertically merged cells are dropped (mammoth gives the first cell a rowspan)
+        columns = set()
+        row_nodes = [_FORCE_WRITE]
+        for cells in rows:
+            cell_nodes = [_FORCE_WRITE]
+            index = 0
+            for colspan, vmerge, content in cells:
+                if not (vmerge and index in columns):
+                    columns.add(index)
+                    attributes = {"colspan": str(colspan)} if colspan != 1 else {}
+                    cell_nodes.append(
+                        _HtmlNode(("td",), attributes, False, [_FORCE_WRITE] + content)
+                    )
+                index += colspan
+            row_nodes.append(_HtmlNode(("tr",), {}, False, cell_nodes))
+        return _HtmlNode(("table",), {}, False, row_nodes)
+
+    def _read_inline(self, parent: Any) -> List[Any]:
+        """The HTML nodes of the runs, links, etc. of a paragraph."""
+        nodes = []
+        for element in parent:
+            tag = element.tag
+            if tag == _W + "r":
+                nodes.extend(self._read_run(element))
+            elif tag == _W + "hyperlink":
+                nodes.extend(self._read_hyperlink(element))
+            elif tag == _W + "sdt":
+                nodes.extend(self._read_inline(self._sdt_content(element)))
+            elif tag in _DOCX_TRANSPARENT_ELEMENTS:
+                nodes.extend(self._read_inline(element))
+            elif tag == _W + "bookmarkStart":
+                nodes.extend(self._read_bookmark(element))
+            elif tag in _DOCX_FALLBACK_ELEMENTS or tag in [_W + "p", _W + "tbl"]:
+                raise _DocxFallback(f"Unsupported element {tag}")
+        return nodes
+
+    def _read_hyperlink(self, hyperlink: Any) -> List[Any]:
+        relationship_id = hyperlink.get(_R + "id")
+        if hyperlink.get(_W + "anchor") is not None:
+            raise _DocxFallback("Link to an anchor")
+        children = self._read_inline(hyperlink)
+        if relationship_id is None:
+            return children
+        if relationship_id not in self._relationships:
+            raise _DocxFallback("Missing link target")
+        attributes = {"href": self._relationships[relationship_id]}
+        if hyperlink.get(_W + "tgtFrame"):
+            attributes["target"] = hyperlink.get(_W + "tgtFrame")
+        return [_HtmlNode(("a",), attributes, True, children)]
+
+    def _read_run(self, run: Any) -> List[Any]:
+        properties = run.find(_W + "rPr")
+        if properties is None:
+            properties = run.makeelement(_W + "rPr", {})
+        style = properties.find(_W + "rStyle")
+        style_name = None
+        if style is not None:
+            style_name = (
+                self._character_styles.get(style.get(_W + "val")) or ""
+            ).upper()
+        if style_name in _DOCX_IGNORED_RUN_STYLES:
+            return []
+
+        children = []
+        for element in run:
+            tag = element.tag
+            if tag == _W + "t":
+                children.append("".join(element.itertext()))
+            elif tag == _W + "tab":
+                children.append("\t")
+            elif tag == _W + "br":
+                if element.get(_W + "type") in [None, "", "textWrapping"]:
+                    children.append(_HtmlNode(("br",), {}, False, []))
+            elif tag == _W + "noBreakHyphen":
+                children.append("‑")
+            elif tag == _W + "softHyphen":
+                children.append("­")
+            elif tag == _W + "commentReference":
+                if self._include_comments:
+                    children.append(self._read_comment_reference(element))
+            elif tag == _W + "drawing":
+                children.extend(self._read_drawing(element))
+            elif tag in _DOCX_FALLBACK_ELEMENTS:
+                raise _DocxFallback(f"Unsupported element {tag}")
+
+        def _is_set(name):
+            element = properties.find(_W + name)
+            return element is not None and element.get(_W + "val") not in [
+                "false",
+                "0",
+            ]
+
+        # Wrap the content in the run's formatting, from the innermost element out
+        vertical_alignment = properties.find(_W + "vertAlign")
+        vertical_alignment = (
+            None if vertical_alignment is None else vertical_alignment.get(_W + "val")
+        )
+        for tag, is_set in [
+            ("s", _is_set("strike")),
+            ("sub", vertical_alignment == "subscript"),
+            ("sup", vertical_alignment == "superscript"),
+            ("em", _is_set("i")),
+            ("strong", _is_set("b")),
+            ("strong", style_name == "STRONG"),
+        ]:
+            if is_set:
+                children = [_HtmlNode((tag,), {}, True, children)]
+        return children
+
+    def _read_drawing(self, drawing: Any) -> List[Any]:
+        """The images of a drawing, as mammoth reads its pictures."""
+        nodes = []
+        for element in drawing:
+            if element.tag not in [_WP + "inline", _WP + "anchor"]:
+                continue
+            properties = element.find(_WP + "docPr")
+            if properties is None:
+                properties = element.makeelement(_WP + "docPr", {})
+            alt = properties.get("descr", "")
+            if not alt.strip():
+                alt = properties.get("title")
+            link = properties.find(_A + "hlinkClick")
+            if link is not None and link.get(_R + "id"):
+                raise _DocxFallback("Image with a link")
+
+            for blip in element.iterfind(
+                f"{_A}graphic/{_A}graphicData/{_PIC}pic/{_PIC}blipFill/{_A}blip"
+            ):
+                if blip.get(_R + "embed") is None:
+                    if blip.get(_R + "link") is not None:
+                        raise _DocxFallback("Linked image")
+                    continue
+                target = self._relationships.get(blip.get(_R + "embed"))
+                if target is None:
+                    raise _DocxFallback("Missing image")
+                path = target[1:] if target.startswith("/") else "word/" + target
+                if path not in self._names:
+                    raise _DocxFallback("Missing image")
+
+                src = self._image_policy.src(
+                    self._content_type(path),
+                    functools.partial(self._zip_file.read, path),
+                )
+                if src is not None:
+                    attributes = {"alt": alt} if alt else {}
+                    attributes["src"] = src
+                    nodes.append(_HtmlNode(("img",), attributes, False, []))
+        return nodes
+
+    def _content_type(self, path: str) -> Optional[str]:
+        """The content type of a part, from [Content_Types].xml, as mammoth finds it."""
+        from xml.etree import ElementTree
+
+        if self._content_types is None:
+            defaults, overrides = {}, {}
+            if "[Content_Types].xml" in self._names:
+                types = "{http://schemas.openxmlformats.org/package/2006/content-types}"
+                with self._zip_file.open("[Content_Types].xml") as fh:
+                    root = ElementTree.parse(fh).getroot()
+                for default in root.iter(types + "Default"):
+                    defaults[default.get("Extension")] = default.get("ContentType")
+                for override in root.iter(types + "Override"):
+                    overrides[override.get("PartName").lstrip("/")] = override.get(
+                        "ContentType"
+                    )
+            self._content_types = (defaults, overrides)
+
+        defaults, overrides = self._content_types
+        if path in overrides:
+            return overrides[path]
+        extension = path.rpartition(".")[2]
+        if extension in defaults:
+            return defaults[extension]
+        image_type = {
+            "png": "png",
+            "gif": "gif",
+            "jpeg": "jpeg",
+            "jpg": "jpeg",
+            "tif": "tiff",
+            "tiff": "tiff",
+            "bmp": "bmp",
+        }.get(extension.lower())
+        return None if image_type is None else "image/" + image_type
+
+    def _read_comment_reference(self, reference: Any) -> _HtmlNode:
+        comment_id = reference.get(_W + "id")
+        if comment_id not in self._comments:
+            raise _DocxFallback("Missing comment")
+        label = f"[{self._comments[comment_id][1]}{len(self._referenced_comments) + 1}]"
+        self._referenced_comments.append((label, comment_id))
+        return _HtmlNode(
+            ("a",),
+            {"href": f"#comment-{comment_id}", "id": f"comment-ref-{comment_id}"},
+            False,
+            [label],
+        )
+
+    def _read_bookmark(self, bookmark: Any) -> List[Any]:
+        name = bookmark.get(_W + "name")
+        if name == "_GoBack":
+            return []
+        return [_HtmlNode(("a",), {"id": name}, True, [_FORCE_WRITE])]
+
+    def _sdt_content(self, sdt: Any) -> Any:
+        properties = sdt.find(_W + "sdtPr")
+        if properties is not None and any(
+            child.tag.endswith("}checkbox") for child in properties
+        ):
+            raise _DocxFallback("Checkbox")
+        content = sdt.find(_W + "sdtContent")
+        return [] if content is None else content
+
+    def _find_part(
+        self, base: str, relationships_path: str, relationship_type: str
+    ) -> Optional[str]:
+        """The path of the part of the given relationship type, from a relationships part."""
+        if relationships_path not in self._zip_file.namelist():
+            return None
+        from xml.etree import ElementTree
+
+        with self._zip_file.open(relationships_path) as fh:
+            root = ElementTree.parse(fh).getroot()
+        for relationship in root.iter(_PACKAGE_RELATIONSHIPS + "Relationship"):
+            if relationship.get("Type", "").endswith("/" + relationship_type):
+                target = relationship.get("Target", "")
+                if target.startswith("/"):
+                    return target.lstrip("/")
+                return os.path.normpath(os.path.join(base, target)).replace("\\", "/")
+        return None
+
+    def _read_relationships(self, relationships_path: str) -> Dict[str, str]:
+        """The targets of the relationships of a part, by id."""
+        if relationships_path not in self._zip_file.namelist():
+            return {}
+        from xml.etree import ElementTree
+
+        with self._zip_file.open(relationships_path) as fh:
+            root = ElementTree.parse(fh).getroot()
+        return {
+            relationship.get("Id"): relationship.get("Target")
+            for relationship in root.iter(_PACKAGE_RELATIONSHIPS + "Relationship")
+        }
+
+
 class XlsxConverter(HtmlConverter):
     """
     Converts XLSX files to Markdown, with each sheet presented as a separate Markdown table.
+
+    By default, each sheet is loaded with pandas, and converted through HTML. Options:
+
+        - xlsx_sheets: the sheets to convert, as a list of names or (0-based) indexes. Defaults to all.
+        - xlsx_rows: a (start, stop) window of (0-based) data rows, not counting the header row.
+        - xlsx_columns: a (start, stop) window of (0-based) columns.
+        - xlsx_streaming: if True, read the rows with openpyxl in read-only mode, and write them
+          straight to Markdown, so that large workbooks are converted in constant memory.
+
+    The streaming writer formats cells by their own type, rather than by their column's (as pandas
+    does): empty cells and headers are left blank (pandas writes NaN and "Unnamed: N"), integral
+    numbers are written without a fractional part, other numbers in full, and booleans as True or
+    False.
     """
 
+    supported_extensions = [".xlsx"]
+    accepts_streams = True
+
     def convert(self, local_path, **kwargs) -> Union[None, DocumentConverterResult]:
+        sheets = self.convert_iter(local_path, **kwargs)
+        if sheets is None:
+            return None
+
+        return DocumentConverterResult(
+            title=None,
+            text_content="".join(sheets),
+        )
+
+    def convert_iter(self, local_path, **kwargs) -> Union[None, Iterator[str]]:
         # Bail if not a XLSX
         extension = kwargs.get("file_extension", "")
         if extension.lower() != ".xlsx":
             return None
 
-        sheets = pd.read_excel(local_path, sheet_name=None)
-        md_content = ""
-        for s in sheets:
-            md_content += f"## {s}\n"
-            html_content = sheets[s].to_html(index=False)
-            md_content += self._convert(html_content).text_content.strip() + "\n\n"
+        rows = slice(*(kwargs.get("xlsx_rows") or (None,)))
+        columns = slice(*(kwargs.get("xlsx_columns") or (None,)))
+        if kwargs.get("xlsx_streaming", False):
+            return self._iter_sheets_streaming(
+                local_path, kwargs.get("xlsx_sheets"), rows, columns
+            )
+        return self._iter_sheets(local_path, kwargs.get("xlsx_sheets"), rows, columns)
 
-        return DocumentConverterResult(
-            title=None,
-            text_content=md_content.strip(),
+    def _iter_sheets(
+        self,
+        local_path: str,
+        sheets: Optional[List[Union[str, int]]] = None,
+        rows: slice = slice(None),
+        columns: slice = slice(None),
+    ) -> Iterator[str]:
+        """Yield the Markdown of each sheet, loading one sheet at a time with pandas."""
+        import pandas as pd
+
+        if _is_stream(local_path):
+            local_path.seek(0)
+        with pd.ExcelFile(local_path) as workbook:
+            for i, s in enumerate(self._select_sheets(workbook.sheet_names, sheets)):
+                df = workbook.parse(s).iloc[rows, columns]
+                html_content = df.to_html(index=False)
+                yield (
+                    ("\n\n" if i > 0 else "")
+                    + f"## {s}\n"
+                    + self._convert(html_content).text_content.strip()
+                )
+
+    def _iter_sheets_streaming(
+        self,
+        local_path: str,
+        sheets: Optional[List[Union[str, int]]] = None,
+        rows: slice = slice(None),
+        columns: slice = slice(None),
+    ) -> Iterator[str]:
+        """Yield the Markdown of each sheet, reading the rows with openpyxl in read-only mode.
+        Each table is yielded in chunks of rows, and the first row of each sheet is its header.
+        """
+        import openpyxl
+
+        def _row(values):
+            return _markdown_table_row(_format_cell(v) for v in values)
+
+        if _is_stream(local_path):
+            local_path.seek(0)
+        workbook = openpyxl.load_workbook(local_path, read_only=True, data_only=True)
+        try:
+            for i, s in enumerate(self._select_sheets(workbook.sheetnames, sheets)):
+                worksheet = workbook[s]
+                min_col = (columns.start or 0) + 1
+                max_col = columns.stop
+
+                header = next(
+                    worksheet.iter_rows(
+                        min_row=1,
+                        max_row=1,
+                        min_col=min_col,
+                        max_col=max_col,
+                        values_only=True,
+                    ),
+                    (),
+                )
+                header = _trim_row(header)
+                width = len(header)
+                lines = [("\n\n" if i > 0 else "") + f"## {s}"]
+
+                def _start_table():
+                    lines.append(_row(list(header) + [None] * (width - len(header))))
+                    lines.append("| " + " | ".join(["---"] * width) + " |")
+
+                # The table starts with the first data row (which may widen the header)
+                if width > 0:
+                    _start_table()
+                started = width > 0
+
+                # Empty rows are held back until a non-empty row follows, to drop trailing ones
+                empty_rows = 0
+                for values in worksheet.iter_rows(
+                    min_row=(rows.start or 0) + 2,
+                    max_row=None if rows.stop is None else rows.stop + 1,
+                    min_col=min_col,
+                    max_col=max_col,
+                    values_only=True,
+                ):
+                    values = _trim_row(values)
+                    if len(values) == 0:
+                        empty_rows += 1
+                        continue
+                    if not started:
+                        width = len(values)
+                        _start_table()
+                        started = True
+                    lines.extend([_row([None] * width)] * empty_rows)
+                    empty_rows = 0
+                    lines.append(_row(list(values) + [None] * (width - len(values))))
+                    if len(lines) >= _XLSX_CHUNK_ROWS:
+                        yield "\n".join(lines)
+                        lines = [
+                            ""
+                        ]  # The next chunk starts with the line break after this one
+                yield "\n".join(lines).rstrip("\n")
+        finally:
+            workbook.close()
+
+    def _select_sheets(
+        self, sheet_names: List[str], sheets: Optional[List[Union[str, int]]]
+    ) -> List[str]:
+        """The names of the selected sheets (all of them if sheets is None), in the given order."""
+        if sheets is None:
+            return list(sheet_names)
+        selected = []
+        for sheet in sheets:
+            if isinstance(sheet, int):
+                if not -len(sheet_names) <= sheet < len(sheet_names):
+                    raise ValueError(
+                        f"Sheet index {sheet} is out of range: the workbook has {len(sheet_names)} sheets."
+                    )
+                selected.append(sheet_names[sheet])
+            elif sheet in sheet_names:
+                selected.append(sheet)
+            else:
+                raise ValueError(
+                    f"Sheet '{sheet}' not found. The workbook has sheets {sheet_names}."
+                )
+        return selected
+
+
+# The number of Markdown lines XlsxConverter accumulates before yielding them
+_XLSX_CHUNK_ROWS = 1000
+
+
+def _trim_row(values: Iterable[Any]) -> tuple:
+    """Drop the trailing empty cells of a row."""
+    values = tuple(values)
+    end = len(values)
+    while end > 0 and (values[end - 1] is None or values[end - 1] == ""):
+        end -= 1
+    return values[:end]
+
+
+def _format_cell(value: Any) -> str:
+    """Format a cell value by its type: empty cells are left blank, and integral numbers are
+    written without a fractional part."""
+    if value is None:
+        return ""
+    if isinstance(value, float) and value.is_integer():
+        return str(int(value))
+    return re.sub(r"\s+", " ", str(value)).strip()
+
+
+def _escape_markdown(text: str) -> str:
+    """Escape the characters that markdownify escapes (with its default options) in text."""
+    text = re.sub(r"([\\&<`[>~#=+|-])", r"\\\1", text)
+    text = re.sub(r"([0-9])([.)])", r"\1\\\2", text)
+    return text.replace("*", r"\*").replace("_", r"\_")
+
+
+def _markdown_table_row(cells: Iterable[str]) -> str:
+    """A row of a Markdown table, with the cells' text escaped and on one line, as markdownify
+    renders a row of an HTML table."""
+    return (
+        "| "
+        + " | ".join(
+            _escape_markdown(re.sub(r"[\t ]+", " ", cell)).strip().replace("\n", " ")
+            for cell in cells
         )
+        + " |"
+    )
+
+
+def _markdown_table(rows: List[List[str]]) -> str:
+    """A Markdown table, with the first row as its header."""
+    if len(rows) == 0:
+        return ""
+    lines = [_markdown_table_row(rows[0])]
+    lines.append("| " + " | ".join(["---"] * len(rows[0])) + " |")
+    lines.extend(_markdown_table_row(row) for row in rows[1:])
+    return "\n".join(lines)
 
 
 class PptxConverter(HtmlConverter):
@@ -741,86 +3098,122 @@ class PptxConverter(HtmlConverter):
     Converts PPTX files to Markdown. Supports heading, tables and images with alt text.
     """
 
+    supported_extensions = [".pptx"]
+    accepts_streams = True
+
     def convert(self, local_path, **kwargs) -> Union[None, DocumentConverterResult]:
+        slides = self.convert_iter(local_path, **kwargs)
+        if slides is None:
+            return None
+
+        return DocumentConverterResult(
+            title=None,
+            text_content="".join(slides),
+        )
+
+    def convert_iter(self, local_path, **kwargs) -> Union[None, Iterator[str]]:
         # Bail if not a PPTX
         extension = kwargs.get("file_extension", "")
         if extension.lower() != ".pptx":
             return None
 
-        md_content = ""
+        max_workers = kwargs.get("max_workers")
+        if max_workers is not None and max_workers > 1 and not _is_stream(local_path):
+            return self._iter_slides_parallel(local_path, max_workers)
+        return self._iter_slides(local_path)
+
+    def _iter_slides(
+        self, local_path: str, slide_numbers: Optional[List[int]] = None
+    ) -> Iterator[str]:
+        """Yield the Markdown of each slide (or of the given 0-based slides)."""
+        import pptx
 
+        if _is_stream(local_path):
+            local_path.seek(0)
         presentation = pptx.Presentation(local_path)
-        slide_num = 0
-        for slide in presentation.slides:
-            slide_num += 1
-
-            md_content += f"\n\n<!-- Slide number: {slide_num} -->\n"
-
-            title = slide.shapes.title
-            for shape in slide.shapes:
-                # Pictures
-                if self._is_picture(shape):
-                    # https://github.com/scanny/python-pptx/pull/512#issuecomment-1713100069
-                    alt_text = ""
-                    try:
-                        alt_text = shape._element._nvXxPr.cNvPr.attrib.get("descr", "")
-                    except Exception:
-                        pass
+        slides = presentation.slides
+        if slide_numbers is None:
+            slide_numbers = range(len(slides))
+        for i in slide_numbers:
+            md_content = self._convert_slide(slides[i], i + 1)
+
+            # The first slide does not start with a blank line
+            yield md_content.lstrip() if i == 0 else md_content
+
+    def _iter_slides_parallel(self, local_path: str, max_workers: int) -> Iterator[str]:
+        """Convert contiguous slide slices in worker processes, and yield them in order. Every worker
+        loads the whole presentation, so the slides are split into one slice per worker (at most
+        one per CPU), and decks of fewer than _PPTX_PARALLEL_MIN_SLIDES slides are converted in
+        this process."""
+        slide_count = _count_pptx_slides(local_path)
+        workers = min(max_workers, slide_count, _cpu_count())
+        if workers < 2 or slide_count < _PPTX_PARALLEL_MIN_SLIDES:
+            yield from self._iter_slides(local_path)
+            return
 
-                    # A placeholder name
-                    filename = re.sub(r"\W", "", shape.name) + ".jpg"
-                    md_content += (
-                        "\n!["
-                        + (alt_text if alt_text else shape.name)
-                        + "]("
-                        + filename
-                        + ")\n"
-                    )
+        bounds = [slide_count * i // workers for i in range(workers + 1)]
+        slices = [list(range(bounds[i], bounds[i + 1])) for i in range(workers)]
 
-                # Tables
-                if self._is_table(shape):
-                    html_table = "<html><body><table>"
-                    first_row = True
-                    for row in shape.table.rows:
-                        html_table += "<tr>"
-                        for cell in row.cells:
-                            if first_row:
-                                html_table += "<th>" + html.escape(cell.text) + "</th>"
-                            else:
-                                html_table += "<td>" + html.escape(cell.text) + "</td>"
-                        html_table += "</tr>"
-                        first_row = False
-                    html_table += "</table></body></html>"
-                    md_content += (
-                        "\n" + self._convert(html_table).text_content.strip() + "\n"
-                    )
+        with concurrent.futures.ProcessPoolExecutor(max_workers=workers) as executor:
+            yield from executor.map(
+                _convert_pptx_slides, [local_path] * workers, slices
+            )
 
-                # Charts
-                if shape.has_chart:
-                    md_content += self._convert_chart_to_markdown(shape.chart)
+    def _convert_slide(self, slide, slide_num: int) -> str:
+        """The Markdown of a slide, starting with a blank line and its slide number comment."""
+        parts = [f"\n\n<!-- Slide number: {slide_num} -->\n"]
 
-                # Text areas
-                elif shape.has_text_frame:
-                    if shape == title:
-                        md_content += "# " + shape.text.lstrip() + "\n"
-                    else:
-                        md_content += shape.text + "\n"
+        title = slide.shapes.title
+        for shape in slide.shapes:
+            # Pictures
+            if self._is_picture(shape):
+                # https://github.com/scanny/python-pptx/pull/512#issuecomment-1713100069
+                alt_text = ""
+                try:
+                    alt_text = shape._element._nvXxPr.cNvPr.attrib.get("descr", "")
+                except Exception:
+                    pass
 
-            md_content = md_content.strip()
+                # A placeholder name
+                filename = re.sub(r"\W", "", shape.name) + ".jpg"
+                parts.append(
+                    "\n!["
+                    + (alt_text if alt_text else shape.name)
+                    + "]("
+                    + filename
+                    + ")\n"
+                )
 
-            if slide.has_notes_slide:
-                md_content += "\n\n### Notes:\n"
-                notes_frame = slide.notes_slide.notes_text_frame
-                if notes_frame is not None:
-                    md_content += notes_frame.text
-                md_content = md_content.strip()
+            # Tables
+            if self._is_table(shape):
+                rows = [[cell.text for cell in row.cells] for row in shape.table.rows]
+                parts.append("\n" + _markdown_table(rows) + "\n")
 
-        return DocumentConverterResult(
-            title=None,
-            text_content=md_content.strip(),
-        )
+            # Charts
+            if shape.has_chart:
+                parts.append(self._convert_chart_to_markdown(shape.chart))
+
+            # Text areas
+            elif shape.has_text_frame:
+                if shape == title:
+                    parts.append("# " + shape.text.lstrip() + "\n")
+                else:
+                    parts.append(shape.text + "\n")
+
+        md_content = "".join(parts).rstrip()
+
+        if slide.has_notes_slide:
+            md_content += "\n\n### Notes:\n"
+            notes_frame = slide.notes_slide.notes_text_frame
+            if notes_frame is not None:
+                md_content += notes_frame.text
+            md_content = md_content.rstrip()
+
+        return md_content
 
     def _is_picture(self, shape):
+        import pptx
+
         if shape.shape_type == pptx.enum.shapes.MSO_SHAPE_TYPE.PICTURE:
             return True
         if shape.shape_type == pptx.enum.shapes.MSO_SHAPE_TYPE.PLACEHOLDER:
@@ -829,6 +3222,8 @@ class PptxConverter(HtmlConverter):
         return False
 
     def _is_table(self, shape):
+        import pptx
+
         if shape.shape_type == pptx.enum.shapes.MSO_SHAPE_TYPE.TABLE:
             return True
         return False
@@ -857,36 +3252,367 @@ class PptxConverter(HtmlConverter):
         return md + "\n".join([header, separator] + markdown_table[1:])
 
 
+# The number of slides from which PptxConverter splits a presentation across processes (with
+# max_workers): below it, loading the presentation in each worker costs more than it saves
+_PPTX_PARALLEL_MIN_SLIDES = 200
+
+
+def _cpu_count() -> int:
+    """The number of CPUs this process can run on."""
+    if hasattr(os, "sched_getaffinity"):
+        return len(os.sched_getaffinity(0))
+    return os.cpu_count() or 1
+
+
+def _count_pptx_slides(local_path: str) -> int:
+    """The number of slides of a presentation, read from its slide list without loading it."""
+    from xml.etree import ElementTree
+
+    try:
+        with zipfile.ZipFile(local_path) as zip_file:
+            with zip_file.open("ppt/presentation.xml") as fh:
+                root = ElementTree.parse(fh).getroot()
+    except KeyError:
+        # The presentation part has another name: load the presentation to find it
+        import pptx
+
+        return len(pptx.Presentation(local_path).slides)
+    namespace = "{http://schemas.openxmlformats.org/presentationml/2006/main}"
+    return len(root.findall(f"{namespace}sldIdLst/{namespace}sldId"))
+
+
+def _convert_pptx_slides(local_path: str, slide_numbers: List[int]) -> str:
+    """Convert the given (0-based) slides of a presentation. Runs in PptxConverter's worker processes."""
+    return "".join(PptxConverter()._iter_slides(local_path, slide_numbers))
+
+
+class ExifTool:
+    """
+    A persistent `exiftool -stay_open True -@ -` process, which reads the metadata of files as JSON
+    without starting Perl for every file. Commands are written to the process's stdin, and each
+    response is framed by the `{readyN}` line that exiftool prints when command N is done.
+
+    If the process dies, it is restarted, and the files that were not answered are retried (a file
+    that kills it twice gets no metadata).
+    Sessions are thread-safe. Use _get_exiftool() to share one session per process (worker
+    processes get their own).
+    """
+
+    def __init__(self, path: Optional[str] = None):
+        self.path = path or shutil.which("exiftool")
+        if self.path is None:
+            raise ValueError("exiftool is not installed.")
+        self._process = None
+        self._command_number = 0
+        self._lock = threading.Lock()
+
+    def get_metadata(
+        self, local_path: Union[str, BinaryIO]
+    ) -> Union[None, Dict[str, Any]]:
+        """Return the metadata of a file (a local path, or a seekable binary stream), or None if
+        exiftool cannot read it."""
+        return self.get_metadata_batch([local_path])[0]
+
+    def get_metadata_batch(
+        self, local_paths: Iterable[Union[str, BinaryIO]]
+    ) -> List[Union[None, Dict[str, Any]]]:
+        """Return the metadata of many files (or None for the files exiftool cannot read), in the
+        order of local_paths, in one round trip. Streams are written to temporary files.
+        """
+        paths = []
+        temp_paths = []
+        try:
+            for local_path in local_paths:
+                if _is_stream(local_path):
+                    handle, temp_path = tempfile.mkstemp()
+                    temp_paths.append(temp_path)
+                    with os.fdopen(handle, "wb") as fh, _open_binary(local_path) as src:
+                        shutil.copyfileobj(src, fh, _SPOOL_CHUNK_SIZE)
+                    local_path = temp_path
+                paths.append(os.fspath(local_path))
+
+            with self._lock:
+                results = []
+                failed_at = None
+                while len(results) < len(paths):
+                    results += self._execute_all(paths[len(results) :])
+                    if len(results) < len(paths):
+                        # The process died: restart it, and retry the files that were not
+                        # answered, skipping a file that kills it twice
+                        self._stop()
+                        if failed_at == len(results):
+                            results.append(None)
+                            failed_at = None
+                        else:
+                            failed_at = len(results)
+            return results
+        finally:
+            for temp_path in temp_paths:
+                os.unlink(temp_path)
+
+    def close(self) -> None:
+        """Ask the exiftool process to exit."""
+        with self._lock:
+            if self._process is not None and self._process.poll() is None:
+                try:
+                    self._process.stdin.write(b"-stay_open\nFalse\n")
+                    self._process.stdin.flush()
+                    self._process.wait(timeout=5)
+                except (OSError, subprocess.TimeoutExpired):
+                    pass
+            self._stop()
+
+    def _start(self) -> subprocess.Popen:
+        if self._process is None or self._process.poll() is not None:
+            self._stop()
+            self._process = subprocess.Popen(
+                [self.path, "-stay_open", "True", "-@", "-"],
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
+            )
+        return self._process
+
+    def _stop(self) -> None:
+        if self._process is not None:
+            if self._process.poll() is None:
+                self._process.kill()
+            self._process.wait()
+            for pipe in [self._process.stdin, self._process.stdout]:
+                pipe.close()
+            self._process = None
+
+    def _execute_all(self, paths: List[str]) -> List[Union[None, Dict[str, Any]]]:
+        """Send one command per file, then read the responses in order. Returns fewer results
+        than paths if the process dies."""
+        if not paths:
+            return []
+        process = self._start()
+
+        commands = []
+        first_number = self._command_number + 1
+        for path in paths:
+            self._command_number += 1
+            # One argument per line: file names starting with "-" are passed as "./-name"
+            if path.startswith("-"):
+                path = os.path.join(".", path)
+            commands.append(
+                f"-json\n-charset\nfilename=utf8\n{path}\n-execute{self._command_number}\n"
+            )
+
+        # Write from a thread, so that large batches cannot fill both pipes
+        def write_commands():
+            try:
+                process.stdin.write("".join(commands).encode("utf-8"))
+                process.stdin.flush()
+            except OSError:
+                pass
+
+        writer = threading.Thread(target=write_commands, daemon=True)
+        writer.start()
+
+        results = []
+        try:
+            for number in range(first_number, self._command_number + 1):
+                ready = f"{{ready{number}}}".encode("ascii")
+                output = []
+                for line in process.stdout:
+                    if line.rstrip() == ready:
+                        break
+                    output.append(line)
+                else:
+                    break  # The process died
+                results.append(_parse_exiftool_json(b"".join(output)))
+        except BaseException:
+            # Unread responses would be taken for those of the next commands
+            self._stop()
+            raise
+        finally:
+            writer.join()
+        return results
+
+
+def _parse_exiftool_json(output: bytes) -> Union[None, Dict[str, Any]]:
+    """The metadata in an exiftool -json response, or None if it has none."""
+    try:
+        return json.loads(output.decode("utf-8"))[0]
+    except (ValueError, IndexError, KeyError, TypeError):
+        return None
+
+
+# The ExifTool sessions of this process, by executable
+_exiftool_sessions: Dict[Tuple[int, str], ExifTool] = {}
+_exiftool_sessions_lock = threading.Lock()
+
+
+def _get_exiftool(path: Optional[str] = None) -> Union[None, ExifTool]:
+    """Return this process's ExifTool session (started on first use), or None if exiftool is not
+    installed. Forked worker processes start their own session rather than use their parent's.
+    """
+    path = path or shutil.which("exiftool")
+    if path is None:
+        return None
+    key = (os.getpid(), path)
+    with _exiftool_sessions_lock:
+        session = _exiftool_sessions.get(key)
+        if session is None:
+            session = _exiftool_sessions[key] = ExifTool(path)
+        return session
+
+
+def _close_exiftool_sessions() -> None:
+    for (pid, _), session in list(_exiftool_sessions.items()):
+        if pid == os.getpid():
+            session.close()
+
+
+atexit.register(_close_exiftool_sessions)
+
+
 class MediaConverter(DocumentConverter):
     """
     Abstract class for multi-modal media (e.g., images and audio)
     """
 
     def _get_metadata(self, local_path):
-        exiftool = shutil.which("exiftool")
-        if not exiftool:
-            return None
+        return self.get_metadata_batch([local_path])[0]
+
+    def get_metadata_batch(
+        self, local_paths: List[Union[str, BinaryIO]]
+    ) -> List[Union[None, Dict[str, Any]]]:
+        """Return the exiftool metadata of many files in one round trip to this process's exiftool
+        session (or None for each file, if exiftool is not installed)."""
+        exiftool = _get_exiftool()
+        if exiftool is None:
+            return [None] * len(local_paths)
+        try:
+            return exiftool.get_metadata_batch(local_paths)
+        except Exception:
+            return [None] * len(local_paths)
+
+
+class AudioRecognizer:
+    """
+    Transcribes a segment of audio (a pydub.AudioSegment, at most audio_segment_length seconds
+    long) to text. WavConverter and Mp3Converter split recordings into segments, and transcribe
+    them concurrently with the audio_recognizer option, so implementations must be thread-safe.
+
+    Conversions with a recognizer are only cached (see ConversionCache) if its cache_token()
+    returns a string identifying its transcriptions, e.g., its backend and model.
+    """
+
+    def recognize(self, segment: Any) -> str:
+        raise NotImplementedError()
+
+    def cache_token(self) -> Optional[str]:
+        return None
+
+    def __deepcopy__(self, memo: Dict[int, Any]) -> "AudioRecognizer":
+        # The options of a conversion are deep-copied, but share the recognizer
+        return self
+
+
+class GoogleRecognizer(AudioRecognizer):
+    """Transcribes audio with speech_recognition's Google Web Speech backend (the default)."""
+
+    def cache_token(self) -> Optional[str]:
+        return "google"
+
+    def recognize(self, segment: Any) -> str:
+        import speech_recognition as sr
+
+        segment = segment.set_channels(1)
+        audio = sr.AudioData(segment.raw_data, segment.frame_rate, segment.sample_width)
+        try:
+            return sr.Recognizer().recognize_google(audio).strip()
+        except sr.UnknownValueError:
+            # No speech in this segment
+            return ""
+
+
+# WavConverter and Mp3Converter transcribe segments of at most this many seconds (unless the
+# audio_segment_length option is given), cut at the quietest point of their last few seconds
+_AUDIO_SEGMENT_LENGTH = 30
+_AUDIO_SEGMENT_SEARCH = 5
+
+# The default number of segments transcribed at once
+_DEFAULT_AUDIO_CONCURRENCY = 4
+
+
+def _import_pydub() -> Any:
+    """Import pydub, without its warning about a missing ffmpeg (which WAV files do not need)."""
+    with catch_warnings(record=True):
+        import pydub
+    return pydub
+
+
+def _split_audio(segment: Any, max_length: float) -> List[Tuple[int, int]]:
+    """Split a pydub.AudioSegment into (start, end) millisecond ranges of at most max_length
+    seconds. Each cut is placed at the quietest 10 ms frame of the last few seconds of its range,
+    so that words are not cut in half."""
+    import numpy as np
+
+    duration = len(segment)
+    max_length_ms = max(int(max_length * 1000), 1000)
+    if duration <= max_length_ms:
+        return [(0, duration)]
+
+    search_ms = min(_AUDIO_SEGMENT_SEARCH * 1000, max_length_ms // 2)
+    ranges = []
+    start = 0
+    while duration - start > max_length_ms:
+        # Only the window searched for the cut is decoded to samples, not the whole recording
+        first_ms = (start + max_length_ms - search_ms) // 10 * 10
+        energy = _frame_energy(segment[first_ms : start + max_length_ms])
+        if len(energy) == 0:
+            cut = start + max_length_ms
         else:
-            try:
-                result = subprocess.run(
-                    [exiftool, "-json", local_path], capture_output=True, text=True
-                ).stdout
-                return json.loads(result)[0]
-            except Exception:
-                return None
+            # The middle of the longest run of the quietest frames
+            quiet = np.concatenate(([0], (energy == energy.min()).view(np.int8), [0]))
+            edges = np.flatnonzero(np.diff(quiet))
+            runs = edges.reshape(-1, 2)
+            run_start, run_end = runs[np.argmax(runs[:, 1] - runs[:, 0])]
+            cut = first_ms + int(run_start + run_end) // 2 * 10
+        ranges.append((start, cut))
+        start = cut
+    ranges.append((start, duration))
+    return ranges
+
+
+def _frame_energy(segment: Any) -> Any:
+    """The RMS energy of each (whole) 10 ms frame of a pydub.AudioSegment, mixed down to mono, as
+    a numpy array."""
+    import numpy as np
+
+    mono = segment.set_channels(1)
+    samples = np.array(mono.get_array_of_samples(), dtype=np.float64)
+    frame_samples = max(mono.frame_rate // 100, 1)
+    frame_count = len(samples) // frame_samples
+    frames = samples[: frame_count * frame_samples].reshape(frame_count, frame_samples)
+    return np.sqrt((frames**2).mean(axis=1))
 
 
 class WavConverter(MediaConverter):
     """
     Converts WAV files to markdown via extraction of metadata (if `exiftool` is installed), and speech transcription (if `speech_recognition` is installed).
+
+    Recordings are split into segments of at most audio_segment_length seconds (30 by default),
+    cut at quiet points, which are transcribed audio_concurrency (4 by default) at a time with the
+    audio_recognizer option (an AudioRecognizer; GoogleRecognizer by default), then joined in order.
     """
 
+    supported_extensions = [".wav"]
+    accepts_streams = True
+
     def convert(self, local_path, **kwargs) -> Union[None, DocumentConverterResult]:
         # Bail if not a WAV
         extension = kwargs.get("file_extension", "")
         if extension.lower() != ".wav":
             return None
 
+        return self._convert_audio(local_path, **kwargs)
+
+    def _convert_audio(self, local_path, **kwargs) -> DocumentConverterResult:
         md_content = ""
 
         # Add metadata
@@ -908,9 +3634,12 @@ class WavConverter(MediaConverter):
                     md_content += f"{f}: {metadata[f]}\n"
 
         # Transcribe
-        if IS_AUDIO_TRANSCRIPTION_CAPABLE:
+        recognizer = kwargs.get("audio_recognizer")
+        if recognizer is None and _is_audio_transcription_capable():
+            recognizer = GoogleRecognizer()
+        if recognizer is not None:
             try:
-                transcript = self._transcribe_audio(local_path)
+                transcript = self._transcribe_audio(local_path, recognizer, **kwargs)
                 md_content += "\n\n### Audio Transcript:\n" + (
                     "[No speech detected]" if transcript == "" else transcript
                 )
@@ -924,79 +3653,235 @@ class WavConverter(MediaConverter):
             text_content=md_content.strip(),
         )
 
-    def _transcribe_audio(self, local_path) -> str:
-        recognizer = sr.Recognizer()
-        with sr.AudioFile(local_path) as source:
-            audio = recognizer.record(source)
-            return recognizer.recognize_google(audio).strip()
+    def _load_audio(self, local_path) -> Any:
+        """Decode the audio into a pydub.AudioSegment."""
+        pydub = _import_pydub()
+        with _open_binary(local_path) as fh:
+            return pydub.AudioSegment.from_wav(fh)
+
+    def _transcribe_audio(
+        self, local_path, recognizer: AudioRecognizer, **kwargs: Any
+    ) -> str:
+        audio = self._load_audio(local_path)
+        ranges = _split_audio(
+            audio, kwargs.get("audio_segment_length") or _AUDIO_SEGMENT_LENGTH
+        )
+        if len(ranges) == 1:
+            return recognizer.recognize(audio).strip()
+
+        concurrency = kwargs.get("audio_concurrency") or _DEFAULT_AUDIO_CONCURRENCY
+        with concurrent.futures.ThreadPoolExecutor(
+            max_workers=min(concurrency, len(ranges))
+        ) as executor:
+            texts = executor.map(
+                lambda r: recognizer.recognize(audio[r[0] : r[1]]).strip(), ranges
+            )
+            return " ".join(text for text in texts if text)
 
 
 class Mp3Converter(WavConverter):
     """
     Converts MP3 files to markdown via extraction of metadata (if `exiftool` is installed), and speech transcription (if `speech_recognition` AND `pydub` are installed).
+
+    The MP3 is decoded in memory by pydub (and ffmpeg), and transcribed like a WAV file.
     """
 
+    supported_extensions = [".mp3"]
+    accepts_streams = True
+
     def convert(self, local_path, **kwargs) -> Union[None, DocumentConverterResult]:
         # Bail if not a MP3
         extension = kwargs.get("file_extension", "")
         if extension.lower() != ".mp3":
             return None
 
-        md_content = ""
-
-        # Add metadata
-        metadata = self._get_metadata(local_path)
-        if metadata:
-            for f in [
-                "Title",
-                "Artist",
-                "Author",
-                "Band",
-                "Album",
-                "Genre",
-                "Track",
-                "DateTimeOriginal",
-                "CreateDate",
-                "Duration",
-            ]:
-                if f in metadata:
-                    md_content += f"{f}: {metadata[f]}\n"
+        return self._convert_audio(local_path, **kwargs)
 
-        # Transcribe
-        if IS_AUDIO_TRANSCRIPTION_CAPABLE:
-            handle, temp_path = tempfile.mkstemp(suffix=".wav")
-            os.close(handle)
-            try:
-                sound = pydub.AudioSegment.from_mp3(local_path)
-                sound.export(temp_path, format="wav")
+    def _load_audio(self, local_path) -> Any:
+        pydub = _import_pydub()
+        if _is_stream(local_path):
+            local_path.seek(0)
+        return pydub.AudioSegment.from_file(local_path, format="mp3")
 
-                _args = dict()
-                _args.update(kwargs)
-                _args["file_extension"] = ".wav"
 
-                try:
-                    transcript = super()._transcribe_audio(temp_path).strip()
-                    md_content += "\n\n### Audio Transcript:\n" + (
-                        "[No speech detected]" if transcript == "" else transcript
-                    )
-                except Exception:
-                    md_content += "\n\n### Audio Transcript:\nError. Could not transcribe this audio."
+class CaptionCache:
+    """
+    An in-memory cache of LLM image descriptions, keyed by the SHA-256 of the image, the model,
+    the prompt and the size the image was downscaled to. Beyond max_entries, the least recently
+    used descriptions are evicted. A MarkItDown instance keeps one by default, so that an image
+    repeated across documents (e.g., a logo) is described once.
 
-            finally:
-                os.unlink(temp_path)
+    Copies of the cache (e.g., pickled to worker processes) start empty.
+    """
 
-        # Return the result
-        return DocumentConverterResult(
-            title=None,
-            text_content=md_content.strip(),
+    def __init__(self, max_entries: int = 10000):
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._entries: "collections.OrderedDict[str, str]" = collections.OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def get_key(
+        image: bytes, model: str, prompt: str, max_image_size: Optional[int] = None
+    ) -> str:
+        description = json.dumps([model, prompt, max_image_size])
+        return (
+            hashlib.sha256(image).hexdigest()
+            + ":"
+            + hashlib.sha256(description.encode("utf-8")).hexdigest()
         )
 
+    def get(self, key: str) -> Union[None, str]:
+        """Return the cached description (marking it as recently used), or None."""
+        with self._lock:
+            description = self._entries.get(key)
+            if description is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+            self._entries.move_to_end(key)
+            return description
+
+    def put(self, key: str, description: str) -> None:
+        with self._lock:
+            self._entries[key] = description
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def stats(self) -> Dict[str, int]:
+        """Return the hit and miss counters, and the number of cached descriptions."""
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "entries": len(self._entries),
+            }
+
+    def __reduce__(self):
+        return (CaptionCache, (self.max_entries,))
+
+    def __deepcopy__(self, memo: Dict[int, Any]) -> "CaptionCache":
+        # The options of a conversion are deep-copied, but share the cache
+        return self
+
+
+# The default number of images ImageConverter describes at once, see _describe_images
+_DEFAULT_LLM_CONCURRENCY = 4
+
+
+def _downscale_image(
+    image: bytes, max_image_size: int
+) -> Union[None, Tuple[bytes, str]]:
+    """Shrink an image so that neither side exceeds max_image_size pixels, and re-encode it (as PNG
+    if it has transparency, otherwise as JPEG). Returns the (content, content type) of the smaller
+    image, or None if it is already small enough, Pillow is not installed, or the image cannot be
+    read."""
+    if importlib.util.find_spec("PIL") is None:
+        return None
+    from PIL import Image
+
+    try:
+        with Image.open(io.BytesIO(image)) as img:
+            if max(img.size) <= max_image_size:
+                return None
+            img.thumbnail((max_image_size, max_image_size))
+
+            output = io.BytesIO()
+            if img.mode in ("RGBA", "LA") or "transparency" in img.info:
+                img.save(output, format="PNG", optimize=True)
+                content_type = "image/png"
+            else:
+                img.convert("RGB").save(output, format="JPEG", quality=85)
+                content_type = "image/jpeg"
+    except Exception:
+        return None
+    return output.getvalue(), content_type
+
+
+def _describe_image(image: bytes, extension: str, kwargs: Dict[str, Any]) -> str:
+    """Describe an image with the llm_client and llm_model options, using the caption_cache
+    option (if any), and downscaling the image to llm_max_image_size pixels (if given) first.
+    """
+    client = kwargs["llm_client"]
+    model = kwargs["llm_model"]
+    prompt = kwargs.get("llm_prompt")
+    if prompt is None or prompt.strip() == "":
+        prompt = "Write a detailed caption for this image."
+    max_image_size = kwargs.get("llm_max_image_size")
+
+    cache = kwargs.get("caption_cache")
+    key = None
+    if cache is not None:
+        key = CaptionCache.get_key(image, model, prompt, max_image_size)
+        description = cache.get(key)
+        if description is not None:
+            return description
+
+    content_type, encoding = mimetypes.guess_type("_dummy" + extension)
+    if content_type is None:
+        content_type = "image/jpeg"
+    if max_image_size:
+        downscaled = _downscale_image(image, max_image_size)
+        if downscaled is not None:
+            image, content_type = downscaled
+    image_base64 = base64.b64encode(image).decode("utf-8")
+    data_uri = f"data:{content_type};base64,{image_base64}"
+
+    messages = [
+        {
+            "role": "user",
+            "content": [
+                {"type": "text", "text": prompt},
+                {
+                    "type": "image_url",
+                    "image_url": {
+                        "url": data_uri,
+                    },
+                },
+            ],
+        }
+    ]
+
+    response = client.chat.completions.create(model=model, messages=messages)
+    description = response.choices[0].message.content
+    if key is not None:
+        cache.put(key, description)
+    return description
+
+
+def _describe_images(
+    images: Iterable[Tuple[bytes, str]], kwargs: Dict[str, Any]
+) -> List[str]:
+    """Describe many (content, extension) images, llm_concurrency (4 by default) at a time, and
+    return their descriptions in order. Identical images are described once."""
+    futures = {}
+    with concurrent.futures.ThreadPoolExecutor(
+        max_workers=kwargs.get("llm_concurrency") or _DEFAULT_LLM_CONCURRENCY
+    ) as executor:
+        keys = []
+        for image, extension in images:
+            key = (hashlib.sha256(image).digest(), extension.lower())
+            if key not in futures:
+                futures[key] = executor.submit(
+                    _describe_image, image, extension, kwargs
+                )
+            keys.append(key)
+        return [futures[key].result() for key in keys]
+
 
 class ImageConverter(MediaConverter):
     """
     Converts images to markdown via extraction of metadata (if `exiftool` is installed), OCR (if `easyocr` is installed), and description via a multimodal LLM (if an llm_client is configured).
+
+    Descriptions are cached in the caption_cache option (see CaptionCache), and images are
+    downscaled to llm_max_image_size pixels (if given, and Pillow is installed) before upload.
     """
 
+    supported_extensions = [".jpg", ".jpeg", ".png"]
+    accepts_streams = True
+
     def convert(self, local_path, **kwargs) -> Union[None, DocumentConverterResult]:
         # Bail if not an image
         extension = kwargs.get("file_extension", "")
@@ -1035,6 +3920,8 @@ class ImageConverter(MediaConverter):
                     llm_client,
                     llm_model,
                     prompt=kwargs.get("llm_prompt"),
+                    caption_cache=kwargs.get("caption_cache"),
+                    max_image_size=kwargs.get("llm_max_image_size"),
                 ).strip()
                 + "\n"
             )
@@ -1044,43 +3931,81 @@ class ImageConverter(MediaConverter):
             text_content=md_content,
         )
 
-    def _get_llm_description(self, local_path, extension, client, model, prompt=None):
-        if prompt is None or prompt.strip() == "":
-            prompt = "Write a detailed caption for this image."
+    def _get_llm_description(
+        self,
+        local_path,
+        extension,
+        client,
+        model,
+        prompt=None,
+        caption_cache=None,
+        max_image_size=None,
+    ):
+        with _open_binary(local_path) as image_file:
+            image = image_file.read()
+        return _describe_image(
+            image,
+            extension,
+            {
+                "llm_client": client,
+                "llm_model": model,
+                "llm_prompt": prompt,
+                "caption_cache": caption_cache,
+                "llm_max_image_size": max_image_size,
+            },
+        )
 
-        data_uri = ""
-        with open(local_path, "rb") as image_file:
-            content_type, encoding = mimetypes.guess_type("_dummy" + extension)
-            if content_type is None:
-                content_type = "image/jpeg"
-            image_base64 = base64.b64encode(image_file.read()).decode("utf-8")
-            data_uri = f"data:{content_type};base64,{image_base64}"
 
-        messages = [
-            {
-                "role": "user",
-                "content": [
-                    {"type": "text", "text": prompt},
-                    {
-                        "type": "image_url",
-                        "image_url": {
-                            "url": data_uri,
-                        },
-                    },
-                ],
-            }
-        ]
+# Limits of ZipConverter, which can be overridden with the zip_max_members and zip_max_size options
+_ZIP_MAX_MEMBERS = 10000
+_ZIP_MAX_SIZE = 1024 * 1024 * 1024
+
+# Nested archives deeper than this are skipped
+_ZIP_MAX_DEPTH = 8
 
-        response = client.chat.completions.create(model=model, messages=messages)
-        return response.choices[0].message.content
+
+class _ZipBudget:
+    """Counts the members and the uncompressed bytes read from an archive (and the archives nested
+    in it), and raises ValueError once either exceeds its limit. The sizes are counted as the
+    members are decompressed, rather than trusted from the archive's headers."""
+
+    def __init__(self, max_members: int, max_size: int):
+        self.max_members = max_members
+        self.max_size = max_size
+        self.members = 0
+        self.size = 0
+
+    def add_member(self, name: str) -> None:
+        self.members += 1
+        if self.members > self.max_members:
+            raise ValueError(
+                f"The zip file has more than {self.max_members} members (see zip_max_members), at {name}"
+            )
+
+    def add_size(self, name: str, size: int) -> None:
+        self.size += size
+        if self.size > self.max_size:
+            raise ValueError(
+                f"The zip file uncompresses to more than {self.max_size} bytes (see zip_max_size), at {name}"
+            )
 
 
 class ZipConverter(DocumentConverter):
-    """Converts ZIP files to markdown by extracting and converting all contained files.
+    """Converts ZIP files to markdown by converting all contained files.
 
-    The converter extracts the ZIP contents to a temporary directory, processes each file
-    using appropriate converters based on file extensions, and then combines the results
-    into a single markdown document. The temporary directory is cleaned up after processing.
+    Each member is decompressed from the archive into memory (or a temporary file, if it is larger
+    than the spool threshold), converted with the first converter that accepts it, and emitted in
+    archive order, under a heading with its path. Nested ZIP files are opened in memory, and their
+    members are listed under the path of the nested archive (e.g., `data.zip/report.xlsx`). Nothing
+    is extracted next to the ZIP file.
+
+    With max_workers greater than 1, members are converted in a pool of that many processes.
+    With an llm_client, members are converted in this process instead, but images are described
+    ahead of their conversion, llm_concurrency (4 by default) at a time.
+
+    The zip_max_members and zip_max_size options bound the number of members and the total
+    uncompressed size (nested archives included) that are converted; beyond either limit, the
+    conversion fails rather than exhaust memory or disk on a ZIP bomb.
 
     Example output format:
     ```markdown
@@ -1093,112 +4018,836 @@ class ZipConverter(DocumentConverter):
 
     ## File: images/example.jpg
 
-    ImageSize: 1920x1080
-    DateTimeOriginal: 2024-02-15 14:30:00
-    Description: A beautiful landscape photo
+    ImageSize: 1920x1080
+    DateTimeOriginal: 2024-02-15 14:30:00
+    Description: A beautiful landscape photo
+
+    ## File: data/report.xlsx
+
+    ## Sheet1
+    | Column1 | Column2 | Column3 |
+    |---------|---------|---------|
+    | data1   | data2   | data3   |
+    | data4   | data5   | data6   |
+    ```
+    """
+
+    # 2: members in archive order (rather than in the order of os.walk), and nested archives
+    version = "2"
+    supported_extensions = [".zip"]
+    accepts_streams = True
+
+    def convert(
+        self, local_path: str, **kwargs: Any
+    ) -> Union[None, DocumentConverterResult]:
+        members = self.convert_iter(local_path, **kwargs)
+        if members is None:
+            return None
+
+        try:
+            return DocumentConverterResult(title=None, text_content="".join(members))
+        except zipfile.BadZipFile:
+            return DocumentConverterResult(
+                title=None,
+                text_content=f"[ERROR] Invalid or corrupted zip file: {_source_name(local_path)}",
+            )
+        except Exception as e:
+            return DocumentConverterResult(
+                title=None,
+                text_content=f"[ERROR] Failed to process zip file {_source_name(local_path)}: {str(e)}",
+            )
+
+    def convert_iter(
+        self, local_path: str, **kwargs: Any
+    ) -> Union[None, Iterator[str]]:
+        # Bail if not a ZIP
+        extension = kwargs.get("file_extension", "")
+        if extension.lower() != ".zip":
+            return None
+
+        # Get parent converters list if available
+        parent_converters = kwargs.get("_parent_converters", [])
+        if not parent_converters:
+            return iter(
+                [
+                    f"[ERROR] No converters available to process zip contents from: {_source_name(local_path)}"
+                ]
+            )
+
+        return self._iter_members(local_path, **kwargs)
+
+    def _iter_members(self, local_path: str, **kwargs: Any) -> Iterator[str]:
+        """Yield the header, then the Markdown of each member, in archive order."""
+        budget = _ZipBudget(
+            kwargs.get("zip_max_members") or _ZIP_MAX_MEMBERS,
+            kwargs.get("zip_max_size") or _ZIP_MAX_SIZE,
+        )
+
+        # The converters of the members (nested archives are expanded by _iter_files)
+        converters = [
+            c for c in kwargs["_parent_converters"] if not isinstance(c, ZipConverter)
+        ]
+        member_kwargs = {
+            k: v
+            for k, v in kwargs.items()
+            if k not in ["_html_documents", "_parent_converters", "file_extension"]
+        }
+
+        with _open_binary(local_path) as fh, zipfile.ZipFile(fh, "r") as zip_file:
+            yield f"Content from the zip file `{os.path.basename(_source_name(local_path))}`:"
+
+            files = self._iter_files(zip_file, "", budget, 0)
+            max_workers = kwargs.get("max_workers")
+            if kwargs.get("llm_client") is not None and kwargs.get("llm_model"):
+                # The LLM client stays in this process, and describes images ahead of time
+                if member_kwargs.get("caption_cache") is None:
+                    member_kwargs["caption_cache"] = CaptionCache()
+                results = (
+                    (
+                        path,
+                        _convert_zip_member(converters, path, content, member_kwargs),
+                    )
+                    for path, content in self._prefetch_captions(files, member_kwargs)
+                )
+            elif max_workers is not None and max_workers > 1:
+                results = self._convert_parallel(
+                    files, converters, member_kwargs, max_workers
+                )
+            else:
+                results = (
+                    (
+                        path,
+                        _convert_zip_member(converters, path, content, member_kwargs),
+                    )
+                    for path, content in files
+                )
+
+            for path, text in results:
+                if text is not None:
+                    yield f"\n\n\n## File: {path}\n\n" + text
+
+    def _iter_files(
+        self, zip_file: zipfile.ZipFile, prefix: str, budget: _ZipBudget, depth: int
+    ) -> Iterator[Tuple[str, BinaryIO]]:
+        """Yield the (path, content) of each file of the archive, in archive order, with the files
+        of nested archives in place of the archives. The caller closes the content streams.
+        """
+        for info in zip_file.infolist():
+            if info.is_dir():
+                continue
+            path = prefix + info.filename
+            budget.add_member(path)
+
+            content = self._read_member(zip_file, info, path, budget)
+            if os.path.splitext(info.filename)[1].lower() != ".zip":
+                yield path, content
+                continue
+
+            # Expand nested archives (which are skipped beyond _ZIP_MAX_DEPTH)
+            try:
+                if depth + 1 < _ZIP_MAX_DEPTH:
+                    with zipfile.ZipFile(content, "r") as nested:
+                        yield from self._iter_files(
+                            nested, path + "/", budget, depth + 1
+                        )
+            finally:
+                content.close()
+
+    def _read_member(
+        self,
+        zip_file: zipfile.ZipFile,
+        info: zipfile.ZipInfo,
+        path: str,
+        budget: _ZipBudget,
+    ) -> BinaryIO:
+        """Decompress a member into a seekable stream, counting its size against the budget."""
+        spool = _SpooledBuffer(max_size=_DEFAULT_SPOOL_THRESHOLD)
+        try:
+            with zip_file.open(info) as member:
+                for chunk in iter(lambda: member.read(_SPOOL_CHUNK_SIZE), b""):
+                    budget.add_size(path, len(chunk))
+                    spool.write(chunk)
+            spool.seek(0)
+        except BaseException:
+            spool.close()
+            raise
+        return spool
+
+    def _prefetch_captions(
+        self, files: Iterator[Tuple[str, BinaryIO]], member_kwargs: Dict[str, Any]
+    ) -> Iterator[Tuple[str, BinaryIO]]:
+        """Yield the files, once the images among them are described (and their descriptions in
+        the caption cache). Images are described in a pool of llm_concurrency threads, while the
+        files ahead of them are converted."""
+        concurrency = member_kwargs.get("llm_concurrency") or _DEFAULT_LLM_CONCURRENCY
+        with concurrent.futures.ThreadPoolExecutor(max_workers=concurrency) as executor:
+            pending = collections.deque()
+            for path, content in files:
+                extension = os.path.splitext(path)[1]
+                future = None
+                if extension.lower() in ImageConverter.supported_extensions:
+                    image = content.read()
+                    content.seek(0)
+                    future = executor.submit(
+                        _describe_image, image, extension, member_kwargs
+                    )
+                pending.append((path, content, future))
+
+                if len(pending) > concurrency:
+                    path, content, future = pending.popleft()
+                    if future is not None:
+                        # Errors are raised again when ImageConverter describes the image
+                        concurrent.futures.wait([future])
+                    yield path, content
+            while pending:
+                path, content, future = pending.popleft()
+                if future is not None:
+                    concurrent.futures.wait([future])
+                yield path, content
+
+    def _convert_parallel(
+        self,
+        files: Iterator[Tuple[str, BinaryIO]],
+        converters: List[DocumentConverter],
+        member_kwargs: Dict[str, Any],
+        max_workers: int,
+    ) -> Iterator[Tuple[str, Union[None, str]]]:
+        """Convert the files in a pool of processes, and yield the (path, Markdown) of each, in
+        order. At most a few files per worker are read ahead of the one being yielded.
+        """
+        # The members are converted in a single process each
+        member_kwargs = dict(member_kwargs, max_workers=None)
+
+        with concurrent.futures.ProcessPoolExecutor(
+            max_workers=max_workers,
+            initializer=_init_zip_worker,
+            initargs=(converters,),
+        ) as executor:
+            pending = collections.deque()
+            for path, content in files:
+                with content:
+                    data = content.read()
+                pending.append(
+                    (
+                        path,
+                        executor.submit(
+                            _convert_zip_member_bytes, path, data, member_kwargs
+                        ),
+                    )
+                )
+                if len(pending) >= max_workers * 2:
+                    path, future = pending.popleft()
+                    yield path, future.result()
+            while pending:
+                path, future = pending.popleft()
+                yield path, future.result()
+
+
+def _convert_zip_member(
+    converters: List[DocumentConverter],
+    path: str,
+    content: BinaryIO,
+    kwargs: Dict[str, Any],
+) -> Union[None, str]:
+    """Convert a member of a ZIP file with the first converter that accepts it, and return its
+    Markdown, or None if no converter accepts it. Closes the content."""
+    kwargs = dict(kwargs)
+    kwargs["file_extension"] = os.path.splitext(path)[1]
+    kwargs["_html_documents"] = _HtmlDocuments()
+    kwargs["_parent_converters"] = converters
+
+    source = _SpilledSource(content)
+    try:
+        for converter in converters:
+            result = converter.convert(source.get(converter), **kwargs)
+            if result is not None:
+                return result.text_content.rstrip()
+        return None
+    finally:
+        source.close()
+        content.close()
+
+
+# The converters of a ZipConverter worker process
+_zip_worker_converters = None
+
+
+def _init_zip_worker(converters: List[DocumentConverter]) -> None:
+    """Keep the converters of a ZipConverter worker process."""
+    global _zip_worker_converters
+    _zip_worker_converters = list(converters)
+
+
+def _convert_zip_member_bytes(
+    path: str, data: bytes, kwargs: Dict[str, Any]
+) -> Union[None, str]:
+    """Convert a member of a ZIP file in a ZipConverter worker process."""
+    return _convert_zip_member(_zip_worker_converters, path, io.BytesIO(data), kwargs)
+
+
+def _is_requests_response(obj: Any) -> bool:
+    """Check if obj is a requests.Response, without importing requests if it was not already."""
+    requests = sys.modules.get("requests")
+    return requests is not None and isinstance(obj, requests.Response)
+
+
+class FileConversionException(BaseException):
+    pass
+
+
+class UnsupportedFormatException(BaseException):
+    pass
+
+
+class _StreamingNormalizer:
+    """
+    Incrementally applies MarkItDown's line normalization (trailing whitespace is stripped from
+    every line, and runs of blank lines are collapsed into one) to a stream of text chunks.
+    The concatenated output is identical to normalizing the concatenated input in one go.
+    """
+
+    def __init__(self):
+        self._partial_line = ""
+        self._pending_newlines = 0
+
+    def feed(self, text: str) -> str:
+        """Normalize the next chunk, returning the text of the lines it completes."""
+        lines = re.split(r"\r?\n", self._partial_line + text)
+        self._partial_line = lines.pop()
+
+        output = []
+        for line in lines:
+            line = line.rstrip()
+            if line == "":
+                self._pending_newlines += 1
+            else:
+                output.append("\n" * min(self._pending_newlines, 2))
+                output.append(line)
+                self._pending_newlines = 1
+        return "".join(output)
+
+    def finish(self) -> str:
+        """Flush the last (unterminated) line."""
+        output = "\n" * min(self._pending_newlines, 2) + self._partial_line.rstrip()
+        self._partial_line = ""
+        self._pending_newlines = 0
+        return output
+
+
+# Options that are left out of cache keys, as they do not change the output of a conversion
+# (the effect of file_extension is captured by the candidate extensions)
+_CACHE_IGNORED_OPTIONS = [
+    "_html_documents",
+    "_parent_converters",
+    "audio_concurrency",
+    "caption_cache",
+    "file_extension",
+    "llm_concurrency",
+    "max_workers",
+]
+
+# Options that are keyed by whether they are given, rather than by their value
+_CACHE_PRESENCE_OPTIONS = ["llm_client"]
+
+# Returned by _cache_token for values that cannot be part of a cache key
+_UNCACHEABLE = object()
+
+# The end of the URLs given to convert_urls (which may include None, reported as an error)
+_NO_MORE_URLS = object()
+
+
+def _cache_token(value: Any) -> Any:
+    """The JSON-serializable form of an option's value in cache keys, or _UNCACHEABLE. Objects are
+    keyed by their cache_token() method, if they have one (returning None when their output cannot
+    be cached), and are otherwise uncacheable."""
+    if value is None or isinstance(value, (str, int, float, bool)):
+        return value
+    if isinstance(value, (list, tuple)):
+        tokens = [_cache_token(v) for v in value]
+        return _UNCACHEABLE if any(t is _UNCACHEABLE for t in tokens) else tokens
+    if isinstance(value, dict) and all(isinstance(k, str) for k in value):
+        tokens = {k: _cache_token(v) for k, v in value.items()}
+        if any(t is _UNCACHEABLE for t in tokens.values()):
+            return _UNCACHEABLE
+        return tokens
+    cache_token = getattr(value, "cache_token", None)
+    token = cache_token() if callable(cache_token) else None
+    if token is None:
+        return _UNCACHEABLE
+    return [f"{type(value).__module__}.{type(value).__qualname__}", token]
+
+
+def _cache_environment() -> Dict[str, bool]:
+    """The optional tools and packages that some converters' output depends on, for cache keys."""
+    return {
+        "exiftool": shutil.which("exiftool") is not None,
+        "speech_recognition": importlib.util.find_spec("speech_recognition")
+        is not None,
+        "pydub": importlib.util.find_spec("pydub") is not None,
+        "youtube_transcript_api": importlib.util.find_spec("youtube_transcript_api")
+        is not None,
+    }
+
+
+# Content given to convert_stream (or downloaded by convert_response) stays in memory up to
+# this many bytes, and is spilled to a temporary file beyond
+_DEFAULT_SPOOL_THRESHOLD = 16 * 1024 * 1024
+
+# The size of the chunks read from streams and HTTP responses
+_SPOOL_CHUNK_SIZE = 64 * 1024
+
+
+class _SpooledBuffer(tempfile.SpooledTemporaryFile):
+    """A SpooledTemporaryFile without a name. Once rolled over to disk, the name of the underlying
+    temporary file is a file descriptor number, which some backends (e.g., mammoth) take for a path.
+    """
+
+    @property
+    def name(self) -> None:
+        return None
+
+
+class _SpilledSource:
+    """Hands a conversion's source to each converter: streams are passed as they are to converters
+    that accept them, and written (once, on demand) to a temporary file for the others.
+    """
+
+    def __init__(self, source: Union[str, BinaryIO]):
+        self._source = source
+        self._temp_path = None
+
+    def get(self, converter: DocumentConverter) -> Union[str, BinaryIO]:
+        if not _is_stream(self._source) or getattr(converter, "accepts_streams", False):
+            return self._source
+        if self._temp_path is None:
+            handle, self._temp_path = tempfile.mkstemp()
+            with os.fdopen(handle, "wb") as fh, _open_binary(self._source) as src:
+                shutil.copyfileobj(src, fh, _SPOOL_CHUNK_SIZE)
+        return self._temp_path
+
+    def close(self) -> None:
+        if self._temp_path is not None:
+            os.unlink(self._temp_path)
+            self._temp_path = None
+
+
+class ConversionCache:
+    """
+    A content-addressed, on-disk cache of conversion results, stored in a SQLite file.
+
+    Entries are keyed by the SHA-256 of the input bytes, the registered converters (and their
+    versions), the options that affect the output, and the optional tools installed (see
+    MarkItDown._get_cache_key). Conversions with options that cannot be keyed (e.g., an
+    AudioRecognizer without a cache_token) are not cached. When the stored results grow beyond
+    max_size bytes, the least recently used entries are evicted.
+
+    The total size is kept up to date in a metadata row (in the same transaction as each change,
+    as several processes may share the file), so that storing a result does not scan the table.
+    """
+
+    # The number of least recently used entries selected at once, when evicting
+    _EVICTION_BATCH = 64
+
+    def __init__(self, path: str, max_size: int = 1024 * 1024 * 1024):
+        self.path = path
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+
+        parent = os.path.dirname(os.path.abspath(path))
+        os.makedirs(parent, exist_ok=True)
+
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+        with self._connection:
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS results ("
+                "key TEXT PRIMARY KEY, title TEXT, text_content TEXT NOT NULL, "
+                "size INTEGER NOT NULL, last_access REAL NOT NULL)"
+            )
+            self._connection.execute(
+                "CREATE INDEX IF NOT EXISTS results_last_access ON results (last_access)"
+            )
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS metadata (name TEXT PRIMARY KEY, value INTEGER)"
+            )
+            # Files created before the metadata table have their total computed once
+            self._connection.execute(
+                "INSERT OR IGNORE INTO metadata SELECT 'size', COALESCE(SUM(size), 0) "
+                "FROM results"
+            )
+
+    def get(self, key: str) -> Union[None, DocumentConverterResult]:
+        """Return the cached result for the key (marking it as recently used), or None."""
+        with self._lock, self._connection:
+            row = self._connection.execute(
+                "SELECT title, text_content FROM results WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                self.misses += 1
+                return None
+
+            self.hits += 1
+            self._connection.execute(
+                "UPDATE results SET last_access = ? WHERE key = ?", (time.time(), key)
+            )
+            return DocumentConverterResult(title=row[0], text_content=row[1])
+
+    def put(self, key: str, result: DocumentConverterResult) -> None:
+        """Store a result, then evict the least recently used results beyond max_size."""
+        size = len(result.text_content.encode("utf-8"))
+        if result.title is not None:
+            size += len(result.title.encode("utf-8"))
+
+        with self._lock, self._connection:
+            self._connection.execute("BEGIN IMMEDIATE")
+            row = self._connection.execute(
+                "SELECT size FROM results WHERE key = ?", (key,)
+            ).fetchone()
+            self._connection.execute(
+                "INSERT OR REPLACE INTO results VALUES (?, ?, ?, ?, ?)",
+                (key, result.title, result.text_content, size, time.time()),
+            )
+            total = self._add_size(size - (row[0] if row else 0))
+
+            # Evict the least recently used entries, a batch at a time
+            while total > self.max_size:
+                evicted = self._connection.execute(
+                    "SELECT key, size FROM results ORDER BY last_access LIMIT ?",
+                    (self._EVICTION_BATCH,),
+                ).fetchall()
+                if not evicted:
+                    break
+                freed = 0
+                for old_key, old_size in evicted:
+                    if total - freed <= self.max_size:
+                        break
+                    self._connection.execute(
+                        "DELETE FROM results WHERE key = ?", (old_key,)
+                    )
+                    freed += old_size
+                total = self._add_size(-freed)
+
+    def _add_size(self, delta: int) -> int:
+        """Add to the total size (in the current transaction), and return the new total."""
+        self._connection.execute(
+            "UPDATE metadata SET value = value + ? WHERE name = 'size'", (delta,)
+        )
+        return self._connection.execute(
+            "SELECT value FROM metadata WHERE name = 'size'"
+        ).fetchone()[0]
+
+    def clear(self) -> None:
+        """Remove all cached results, and reset the counters."""
+        with self._lock, self._connection:
+            self._connection.execute("DELETE FROM results")
+            self._connection.execute(
+                "UPDATE metadata SET value = 0 WHERE name = 'size'"
+            )
+            self.hits = 0
+            self.misses = 0
+
+    def stats(self) -> Dict[str, int]:
+        """Return the hit and miss counters, and the number and total size of the cached results."""
+        with self._lock:
+            entries = self._connection.execute(
+                "SELECT COUNT(*) FROM results"
+            ).fetchone()[0]
+            size = self._connection.execute(
+                "SELECT value FROM metadata WHERE name = 'size'"
+            ).fetchone()[0]
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "entries": entries,
+            "size": size,
+        }
+
+    def close(self) -> None:
+        self._connection.close()
+
+
+# A response stored in a HttpCache: its final URL (after redirects), stored headers, and content
+_HttpCacheEntry = collections.namedtuple(
+    "_HttpCacheEntry", ["url", "headers", "content"]
+)
+
+
+class HttpCache:
+    """
+    An on-disk cache of HTTP responses, stored in a SQLite file.
+
+    Responses with an ETag or a Last-Modified header are stored with their content. The next
+    request for the same URL is conditional (If-None-Match, If-Modified-Since), and if the server
+    answers 304 Not Modified, the stored content is used rather than downloaded again. When the
+    stored content grows beyond max_size bytes, the least recently used responses are evicted.
+    """
+
+    # The response headers that are stored (the validators, and what extensions are guessed from)
+    STORED_HEADERS = ["etag", "last-modified", "content-type", "content-disposition"]
+
+    def __init__(self, path: str, max_size: int = 1024 * 1024 * 1024):
+        self.path = path
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+
+        parent = os.path.dirname(os.path.abspath(path))
+        os.makedirs(parent, exist_ok=True)
+
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+        with self._connection:
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS responses ("
+                "url TEXT PRIMARY KEY, final_url TEXT NOT NULL, headers TEXT NOT NULL, "
+                "content BLOB NOT NULL, size INTEGER NOT NULL, last_access REAL NOT NULL)"
+            )
+            self._connection.execute(
+                "CREATE INDEX IF NOT EXISTS responses_last_access ON responses (last_access)"
+            )
+
+    def get(self, url: str) -> Union[None, _HttpCacheEntry]:
+        """Return the stored response for the URL, or None. Its headers are used to make the
+        request conditional."""
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT final_url, headers, content FROM responses WHERE url = ?",
+                (url,),
+            ).fetchone()
+        if row is None:
+            return None
+        return _HttpCacheEntry(url=row[0], headers=json.loads(row[1]), content=row[2])
+
+    def revalidate(self, url: str) -> None:
+        """Record that the server confirmed the stored response (304 Not Modified)."""
+        with self._lock, self._connection:
+            self.hits += 1
+            self._connection.execute(
+                "UPDATE responses SET last_access = ? WHERE url = ?", (time.time(), url)
+            )
 
-    ## File: data/report.xlsx
+    def put(
+        self, url: str, final_url: str, headers: Dict[str, str], content: bytes
+    ) -> None:
+        """Record a downloaded response, storing it if it has an ETag or Last-Modified header. Then
+        evict the least recently used responses beyond max_size."""
+        headers = {
+            k: headers[k] for k in self.STORED_HEADERS if headers.get(k) is not None
+        }
+        with self._lock, self._connection:
+            self.misses += 1
+            if "etag" not in headers and "last-modified" not in headers:
+                self._connection.execute("DELETE FROM responses WHERE url = ?", (url,))
+                return
+
+            self._connection.execute(
+                "INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?, ?)",
+                (
+                    url,
+                    final_url,
+                    json.dumps(headers),
+                    content,
+                    len(content),
+                    time.time(),
+                ),
+            )
 
-    ## Sheet1
-    | Column1 | Column2 | Column3 |
-    |---------|---------|---------|
-    | data1   | data2   | data3   |
-    | data4   | data5   | data6   |
-    ```
+            total = self._connection.execute(
+                "SELECT COALESCE(SUM(size), 0) FROM responses"
+            ).fetchone()[0]
+            if total <= self.max_size:
+                return
 
-    Key features:
-    - Maintains original file structure in headings
-    - Processes nested files recursively
-    - Uses appropriate converters for each file type
-    - Preserves formatting of converted content
-    - Cleans up temporary files after processing
+            for old_url, old_size in self._connection.execute(
+                "SELECT url, size FROM responses ORDER BY last_access"
+            ).fetchall():
+                if total <= self.max_size:
+                    break
+                self._connection.execute(
+                    "DELETE FROM responses WHERE url = ?", (old_url,)
+                )
+                total -= old_size
+
+    def clear(self) -> None:
+        """Remove all stored responses, and reset the counters."""
+        with self._lock, self._connection:
+            self._connection.execute("DELETE FROM responses")
+            self.hits = 0
+            self.misses = 0
+
+    def stats(self) -> Dict[str, int]:
+        """Return the hit (revalidated) and miss (downloaded) counters, and the number and total
+        size of the stored responses."""
+        with self._lock:
+            entries, size = self._connection.execute(
+                "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM responses"
+            ).fetchone()
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "entries": entries,
+            "size": size,
+        }
+
+    def close(self) -> None:
+        self._connection.close()
+
+
+# The MarkItDown instance of a MarkItDown.convert_urls worker process
+_url_worker_markitdown = None
+
+
+def _init_url_worker(
+    converters: List[DocumentConverter], options: Dict[str, Any]
+) -> None:
+    """Create the MarkItDown instance of a convert_urls worker process."""
+    global _url_worker_markitdown
+    options = dict(options)
+    if options["cache"] is not None:
+        options["cache"] = ConversionCache(*options["cache"])
+    _url_worker_markitdown = MarkItDown(**options)
+    _url_worker_markitdown._page_converters = list(converters)
+    _url_worker_markitdown._converter_index = {}
+
+
+def _convert_url_content(
+    content: bytes, extensions: List[str], url: str, kwargs: Dict[str, Any]
+) -> DocumentConverterResult:
+    """Convert a downloaded page in a convert_urls worker process."""
+    res = _url_worker_markitdown._convert_content(
+        content, extensions, url=url, **kwargs
+    )
+
+    # Titles can be BeautifulSoup strings, which pickle with their whole document
+    if res.title is not None:
+        res.title = str(res.title)
+    return res
+
+
+def _copy_future_outcome(
+    source: concurrent.futures.Future, target: concurrent.futures.Future
+) -> None:
+    """Set the result (or exception) of a finished future on another future."""
+    try:
+        target.set_result(source.result())
+    except BaseException as e:
+        target.set_exception(e)
+
+
+class ConversionTrace:
+    """
+    What happened in one conversion (see ConversionMetrics): the source (its path, or "<stream>"),
+    the candidate extensions, each converter attempted (as (converter, extension, seconds, outcome)
+    tuples, where outcome is "accepted", "declined" or "error"), the converter that won, the input
+    and output sizes (in bytes and characters), and the time spent normalizing the output and in
+    the whole conversion. Cached results are recorded with cached=True, and no attempts.
     """
 
-    def convert(
-        self, local_path: str, **kwargs: Any
-    ) -> Union[None, DocumentConverterResult]:
-        # Bail if not a ZIP
-        extension = kwargs.get("file_extension", "")
-        if extension.lower() != ".zip":
-            return None
+    def __init__(self, source: str, extensions: List[Union[str, None]]):
+        self.source = source
+        self.extensions = list(extensions)
+        self.attempts: List[Tuple[str, Union[None, str], float, str]] = []
+        self.converter: Union[None, str] = None
+        self.cached = False
+        self.input_size: Union[None, int] = None
+        self.output_size: Union[None, int] = None
+        self.normalize_time = 0.0
+        self.total_time = 0.0
+        self.error: Union[None, str] = None
+
+    def add_attempt(
+        self,
+        converter: DocumentConverter,
+        extension: Union[None, str],
+        seconds: float,
+        outcome: str,
+    ) -> None:
+        name = type(converter).__name__
+        self.attempts.append((name, extension, seconds, outcome))
+        if outcome == "accepted":
+            self.converter = name
 
-        # Get parent converters list if available
-        parent_converters = kwargs.get("_parent_converters", [])
-        if not parent_converters:
-            return DocumentConverterResult(
-                title=None,
-                text_content=f"[ERROR] No converters available to process zip contents from: {local_path}",
-            )
+    def to_dict(self) -> Dict[str, Any]:
+        return dict(vars(self))
 
-        extracted_zip_folder_name = (
-            f"extracted_{os.path.basename(local_path).replace('.zip', '_zip')}"
-        )
-        new_folder = os.path.normpath(
-            os.path.join(os.path.dirname(local_path), extracted_zip_folder_name)
-        )
-        md_content = f"Content from the zip file `{os.path.basename(local_path)}`:\n\n"
 
-        # Safety check for path traversal
-        if not new_folder.startswith(os.path.dirname(local_path)):
-            return DocumentConverterResult(
-                title=None, text_content=f"[ERROR] Invalid zip file path: {local_path}"
-            )
+class ConversionMetrics:
+    """
+    Receives a ConversionTrace for every conversion of a MarkItDown instance (including failed
+    ones), and aggregates them: stats() returns the number of conversions, failures and cache hits,
+    the total input and output sizes and times, and per converter, the number of attempts (and of
+    those accepted, declined and failed) and the time spent in them.
 
-        try:
-            # Extract the zip file
-            with zipfile.ZipFile(local_path, "r") as zipObj:
-                zipObj.extractall(path=new_folder)
-
-            # Process each extracted file
-            for root, dirs, files in os.walk(new_folder):
-                for name in files:
-                    file_path = os.path.join(root, name)
-                    relative_path = os.path.relpath(file_path, new_folder)
-
-                    # Get file extension
-                    _, file_extension = os.path.splitext(name)
-
-                    # Update kwargs for the file
-                    file_kwargs = kwargs.copy()
-                    file_kwargs["file_extension"] = file_extension
-                    file_kwargs["_parent_converters"] = parent_converters
-
-                    # Try converting the file using available converters
-                    for converter in parent_converters:
-                        # Skip the zip converter to avoid infinite recursion
-                        if isinstance(converter, ZipConverter):
-                            continue
-
-                        result = converter.convert(file_path, **file_kwargs)
-                        if result is not None:
-                            md_content += f"\n## File: {relative_path}\n\n"
-                            md_content += result.text_content + "\n\n"
-                            break
-
-            # Clean up extracted files if specified
-            if kwargs.get("cleanup_extracted", True):
-                shutil.rmtree(new_folder)
-
-            return DocumentConverterResult(title=None, text_content=md_content.strip())
+    A MarkItDown instance keeps one by default. Subclass it, and override record (calling the base
+    method to keep the aggregates), to send the traces elsewhere (e.g., a log, or a tracing system).
+    """
 
-        except zipfile.BadZipFile:
-            return DocumentConverterResult(
-                title=None,
-                text_content=f"[ERROR] Invalid or corrupted zip file: {local_path}",
-            )
-        except Exception as e:
-            return DocumentConverterResult(
-                title=None,
-                text_content=f"[ERROR] Failed to process zip file {local_path}: {str(e)}",
-            )
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.reset()
+
+    def record(self, trace: ConversionTrace) -> None:
+        with self._lock:
+            self._conversions += 1
+            self._failures += trace.error is not None
+            self._cache_hits += trace.cached
+            self._input_size += trace.input_size or 0
+            self._output_size += trace.output_size or 0
+            self._normalize_time += trace.normalize_time
+            self._total_time += trace.total_time
+            for name, _, seconds, outcome in trace.attempts:
+                converter = self._converters.setdefault(
+                    name,
+                    {
+                        "attempts": 0,
+                        "accepted": 0,
+                        "declined": 0,
+                        "errors": 0,
+                        "time": 0.0,
+                    },
+                )
+                converter["attempts"] += 1
+                converter["errors" if outcome == "error" else outcome] += 1
+                converter["time"] += seconds
+
+    def stats(self) -> Dict[str, Any]:
+        """Return the aggregates of the traces recorded (since the last reset)."""
+        with self._lock:
+            return {
+                "conversions": self._conversions,
+                "failures": self._failures,
+                "cache_hits": self._cache_hits,
+                "input_size": self._input_size,
+                "output_size": self._output_size,
+                "normalize_time": self._normalize_time,
+                "total_time": self._total_time,
+                "converters": copy.deepcopy(self._converters),
+            }
 
+    def reset(self) -> None:
+        with self._lock:
+            self._conversions = 0
+            self._failures = 0
+            self._cache_hits = 0
+            self._input_size = 0
+            self._output_size = 0
+            self._normalize_time = 0.0
+            self._total_time = 0.0
+            self._converters: Dict[str, Dict[str, Any]] = {}
 
-class FileConversionException(BaseException):
-    pass
+    def __reduce__(self):
+        return (type(self), ())
 
+    def __deepcopy__(self, memo: Dict[int, Any]) -> "ConversionMetrics":
+        return self
 
-class UnsupportedFormatException(BaseException):
-    pass
+
+def _source_size(source: Union[str, BinaryIO]) -> int:
+    """The size, in bytes, of a converter's source."""
+    if _is_stream(source):
+        return source.seek(0, os.SEEK_END)
+    return os.path.getsize(source)
 
 
 class MarkItDown:
@@ -1207,18 +4856,32 @@ class MarkItDown:
 
     def __init__(
         self,
-        requests_session: Optional[requests.Session] = None,
+        requests_session: Optional["requests.Session"] = None,
         llm_client: Optional[Any] = None,
         llm_model: Optional[str] = None,
         style_map: Optional[str] = None,
+        max_workers: Optional[int] = None,
+        pdf_engine: Optional[str] = None,
+        image_policy: Optional[str] = None,
+        image_dir: Optional[str] = None,
+        html_parser: Optional[str] = None,
+        caption_cache: Optional[CaptionCache] = None,
+        llm_max_image_size: Optional[int] = None,
+        llm_concurrency: Optional[int] = None,
+        cache: Union[None, str, ConversionCache] = None,
+        http_cache: Union[None, str, "HttpCache"] = None,
+        spool_threshold: int = _DEFAULT_SPOOL_THRESHOLD,
+        metrics: Optional[ConversionMetrics] = None,
         # Deprecated
         mlm_client: Optional[Any] = None,
         mlm_model: Optional[str] = None,
     ):
-        if requests_session is None:
-            self._requests_session = requests.Session()
-        else:
-            self._requests_session = requests_session
+        # Created on first use, see _get_requests_session (and _get_pooled_session for the
+        # adapter mounted for convert_urls, and its pool size)
+        self._requests_session = requests_session
+        self._owns_requests_session = requests_session is None
+        self._pooled_adapter = None
+        self._pooled_adapter_size = 0
 
         # Handle deprecation notices
         #############################
@@ -1252,9 +4915,38 @@ class MarkItDown:
         self._llm_client = llm_client
         self._llm_model = llm_model
         self._style_map = style_map
+        self._max_workers = max_workers
+        self._pdf_engine = pdf_engine
+        self._image_policy = image_policy
+        self._image_dir = image_dir
+        self._html_parser = html_parser
+
+        # LLM image descriptions are cached (by default, for the lifetime of this instance)
+        self._caption_cache = CaptionCache() if caption_cache is None else caption_cache
+        self._llm_max_image_size = llm_max_image_size
+        self._llm_concurrency = llm_concurrency
+
+        # An optional cache of conversion results, given as a ConversionCache or the path of its file
+        if isinstance(cache, str):
+            cache = ConversionCache(cache)
+        self._cache = cache
+
+        # An optional cache of HTTP responses, to revalidate (rather than download again) URLs
+        if isinstance(http_cache, str):
+            http_cache = HttpCache(http_cache)
+        self._http_cache = http_cache
+
+        # In-memory content beyond this size is spilled to a temporary file, see _spool
+        self._spool_threshold = spool_threshold
+
+        # Every conversion is traced (converters attempted, times, sizes), see stats
+        self._metrics = ConversionMetrics() if metrics is None else metrics
 
         self._page_converters: List[DocumentConverter] = []
 
+        # Maps a (lower case) extension to the converters that may accept it, in priority order
+        self._converter_index: Dict[Union[str, None], List[DocumentConverter]] = {}
+
         # Register converters for successful browsing operations
         # Later registrations are tried first / take higher priority than earlier registrations
         # To this end, the most specific converters should appear below the most generic converters
@@ -1275,12 +4967,21 @@ class MarkItDown:
         self.register_page_converter(ZipConverter())
 
     def convert(
-        self, source: Union[str, requests.Response], **kwargs: Any
+        self, source: Union[str, "requests.Response", BinaryIO, bytes], **kwargs: Any
     ) -> DocumentConverterResult:  # TODO: deal with kwargs
         """
         Args:
-            - source: can be a string representing a path or url, or a requests.response object
+            - source: can be a string representing a path or url, a requests.response object, or a binary file-like object or bytes-like buffer
             - extension: specifies the file extension to use when interpreting the file. If None, infer from source (path, uri, content-type, etc.)
+            - max_workers: if greater than 1, converters that support it (e.g., PDF) split the work across this many processes. Defaults to the value passed to the constructor.
+            - pdf_engine: the PDF text extraction engine ("pdfminer", "pdfium" or "pypdf"), or profile ("quality" or "fast"). Defaults to the value passed to the constructor, or "quality".
+            - image_policy: how embedded images (DOCX images, data URIs in HTML) are written: "truncate" (a truncated data URI), "drop", "placeholder" (a link named after the image's SHA-256) or "assets" (the image is written to image_dir under that name). Defaults to the value passed to the constructor, or "truncate".
+            - image_dir: the directory of the "assets" image policy. Defaults to the value passed to the constructor.
+            - html_parser: the HTML parser ("html.parser", "lxml" or "html5-parser"), or profile ("quality" or "fast"). Defaults to the value passed to the constructor, or "quality".
+            - llm_max_image_size: if given, images are downscaled so that neither side exceeds this many pixels before they are sent to the LLM. Defaults to the value passed to the constructor.
+            - llm_concurrency: the number of images described by the LLM at once (e.g., in a ZIP file). Defaults to the value passed to the constructor, or 4.
+            - audio_recognizer: the AudioRecognizer that transcribes audio. Defaults to GoogleRecognizer, if speech_recognition, pydub and ffmpeg are installed.
+            - audio_segment_length, audio_concurrency: audio is transcribed in segments of at most this many seconds (30 by default), this many at a time (4 by default).
         """
 
         # Local path or url
@@ -1294,13 +4995,60 @@ class MarkItDown:
             else:
                 return self.convert_local(source, **kwargs)
         # Request response
-        elif isinstance(source, requests.Response):
+        elif _is_requests_response(source):
             return self.convert_response(source, **kwargs)
+        # Stream or buffer
+        elif _is_stream(source) or isinstance(source, (bytes, bytearray, memoryview)):
+            return self.convert_stream(source, **kwargs)
+
+    def convert_iter(
+        self, source: Union[str, "requests.Response", BinaryIO, bytes], **kwargs: Any
+    ) -> Iterator[str]:
+        """
+        Like convert, but yields the Markdown one page or section at a time (per page for PDFs,
+        per slide for PPTX, per sheet for XLSX, per member for ZIP), as soon as it is converted.
+        Other formats are yielded as a single section. The line normalization is applied
+        incrementally, so that joining the yielded strings gives the same text as convert.
+
+        This returns a generator: conversion (and any exception) happens while iterating.
+        """
+        # Local path or url
+        if isinstance(source, str):
+            if (
+                source.startswith("http://")
+                or source.startswith("https://")
+                or source.startswith("file://")
+            ):
+                if self._http_cache is not None:
+                    final_url, headers, content = self._download(source)
+                    return self._convert_content_iter(
+                        content,
+                        self._get_http_extensions(headers, final_url, **kwargs),
+                        url=final_url,
+                        **kwargs,
+                    )
+                response = self._get_requests_session().get(source, stream=True)
+                response.raise_for_status()
+                return self._convert_response_iter(response, **kwargs)
+            else:
+                return self._convert_iter(
+                    source, self._get_local_extensions(source, **kwargs), **kwargs
+                )
+        # Request response
+        elif _is_requests_response(source):
+            return self._convert_response_iter(source, **kwargs)
+        # Stream or buffer
+        elif _is_stream(source) or isinstance(source, (bytes, bytearray, memoryview)):
+            return self._convert_stream_iter(source, **kwargs)
 
     def convert_local(
         self, path: str, **kwargs: Any
     ) -> DocumentConverterResult:  # TODO: deal with kwargs
-        # Prepare a list of extensions to try (in order of priority)
+        # Convert
+        return self._convert(path, self._get_local_extensions(path, **kwargs), **kwargs)
+
+    def _get_local_extensions(self, path: str, **kwargs: Any) -> List[str]:
+        """Prepare a list of extensions to try for a local file (in order of priority)."""
         ext = kwargs.get("file_extension")
         extensions = [ext] if ext is not None else []
 
@@ -1311,157 +5059,764 @@ class MarkItDown:
         for g in self._guess_ext_magic(path):
             self._append_ext(extensions, g)
 
-        # Convert
-        return self._convert(path, extensions, **kwargs)
+        return extensions
 
-    # TODO what should stream's type be?
     def convert_stream(
-        self, stream: Any, **kwargs: Any
+        self, stream: Union[BinaryIO, bytes], **kwargs: Any
     ) -> DocumentConverterResult:  # TODO: deal with kwargs
+        """Convert a file-like object (binary, or text encoded as UTF-8) or a bytes-like buffer.
+        The content is read in memory, and only spilled to a temporary file if it is larger than
+        spool_threshold, or for converters that only accept local paths."""
         # Prepare a list of extensions to try (in order of priority)
         ext = kwargs.get("file_extension")
         extensions = [ext] if ext is not None else []
 
-        # Save the file locally to a temporary file. It will be deleted before this method exits
-        handle, temp_path = tempfile.mkstemp()
-        fh = os.fdopen(handle, "wb")
-        result = None
-        try:
-            # Write to the temporary file
-            content = stream.read()
-            if isinstance(content, str):
-                fh.write(content.encode("utf-8"))
-            else:
-                fh.write(content)
-            fh.close()
+        return self._convert_content(stream, extensions, **kwargs)
+
+    def _convert_stream_iter(
+        self, stream: Union[BinaryIO, bytes], **kwargs: Any
+    ) -> Iterator[str]:
+        """Like convert_stream, but yields the Markdown of each page or section."""
+        ext = kwargs.get("file_extension")
+        extensions = [ext] if ext is not None else []
+
+        return self._convert_content_iter(stream, extensions, **kwargs)
 
+    def _convert_content(
+        self, content: Any, extensions: List[str], **kwargs: Any
+    ) -> DocumentConverterResult:
+        """Convert content (anything _spool accepts), trying the given extensions, then those
+        guessed by puremagic."""
+        source = self._spool(content)
+        try:
             # Use puremagic to check for more extension options
-            for g in self._guess_ext_magic(temp_path):
+            for g in self._guess_ext_magic(source):
                 self._append_ext(extensions, g)
 
             # Convert
-            result = self._convert(temp_path, extensions, **kwargs)
+            return self._convert(source, extensions, **kwargs)
         # Clean up
         finally:
-            try:
-                fh.close()
-            except Exception:
-                pass
-            os.unlink(temp_path)
+            source.close()
 
-        return result
+    def _convert_content_iter(
+        self, content: Any, extensions: List[str], **kwargs: Any
+    ) -> Iterator[str]:
+        """Like _convert_content, but yields the Markdown of each page or section."""
+        source = self._spool(content)
+        try:
+            for g in self._guess_ext_magic(source):
+                self._append_ext(extensions, g)
+
+            yield from self._convert_iter(source, extensions, **kwargs)
+        finally:
+            source.close()
+
+    def _spool(self, content: Any) -> BinaryIO:
+        """Return a seekable binary stream holding the content of a file-like object, a bytes-like
+        buffer, or an iterable of chunks (e.g., of a HTTP response). Buffers are wrapped without
+        copying to disk, and other content is kept in memory up to spool_threshold bytes, then
+        spilled to a temporary file."""
+        if isinstance(content, (bytes, bytearray, memoryview)):
+            return io.BytesIO(content)
+
+        if _is_stream(content):
+            # Read until an empty chunk (b"" for binary streams, "" for text streams)
+            chunks = iter(lambda: content.read(_SPOOL_CHUNK_SIZE) or None, None)
+        else:
+            chunks = iter(content)
+
+        spool = _SpooledBuffer(max_size=self._spool_threshold)
+        try:
+            for chunk in chunks:
+                if isinstance(chunk, str):
+                    chunk = chunk.encode("utf-8")
+                spool.write(chunk)
+            spool.seek(0)
+        except BaseException:
+            spool.close()
+            raise
+        return spool
+
+    def describe_images(
+        self, images: Iterable[Union[str, BinaryIO, bytes]], **kwargs: Any
+    ) -> List[str]:
+        """Describe many images (local paths, binary streams or bytes) with the LLM, and return the
+        descriptions in order. Images are described llm_concurrency (4 by default) at a time, and
+        the descriptions are cached. The content type of streams and bytes is taken from the
+        file_extension option (".jpg" by default).
+
+        Accepts the llm_client, llm_model, llm_prompt, llm_max_image_size, llm_concurrency and
+        caption_cache options of convert."""
+        converter_kwargs = self._get_converter_kwargs(**kwargs)
+        if (
+            converter_kwargs.get("llm_client") is None
+            or converter_kwargs.get("llm_model") is None
+        ):
+            raise ValueError(
+                "Describing images requires an llm_client and an llm_model."
+            )
+
+        contents = []
+        for image in images:
+            if isinstance(image, (bytes, bytearray, memoryview)):
+                contents.append(
+                    (bytes(image), converter_kwargs.get("file_extension") or ".jpg")
+                )
+                continue
+            if _is_stream(image):
+                extension = converter_kwargs.get("file_extension") or ".jpg"
+            else:
+                extension = os.path.splitext(image)[1]
+            with _open_binary(image) as fh:
+                contents.append((fh.read(), extension))
+        return _describe_images(contents, converter_kwargs)
+
+    def stats(self) -> Dict[str, Any]:
+        """Return the aggregated traces of this instance's conversions (see ConversionMetrics):
+        the number of conversions, failures and cache hits, the input and output sizes, the time
+        spent converting and normalizing, and per converter, its attempts and their outcomes and
+        time."""
+        return self._metrics.stats()
 
     def convert_url(
         self, url: str, **kwargs: Any
     ) -> DocumentConverterResult:  # TODO: fix kwargs type
+        # With a HTTP cache, unchanged pages are not downloaded again
+        if self._http_cache is not None:
+            final_url, headers, content = self._download(url)
+            return self._convert_content(
+                content,
+                self._get_http_extensions(headers, final_url, **kwargs),
+                url=final_url,
+                **kwargs,
+            )
+
         # Send a HTTP request to the URL
-        response = self._requests_session.get(url, stream=True)
+        response = self._get_requests_session().get(url, stream=True)
         response.raise_for_status()
         return self.convert_response(response, **kwargs)
 
+    def convert_urls(
+        self,
+        urls: Iterable[str],
+        concurrency: int = 8,
+        workers: Optional[int] = None,
+        **kwargs: Any,
+    ) -> Iterator[Tuple[str, Union[DocumentConverterResult, BaseException]]]:
+        """
+        Convert many URLs, yielding (url, result) pairs in the order of urls. If a URL could not be
+        downloaded or converted (or is not a string, e.g., None), its result is the exception that
+        was raised.
+
+        Up to `concurrency` downloads run at once, in a pool of threads sharing a pool of as many
+        HTTP connections (unless a requests_session was given to the constructor, in which case its
+        own settings apply). Pages are converted while the next ones download: in this process, or
+        in a pool of `workers` processes if workers is greater than 1 (the options must then be
+        picklable). With a http_cache, unchanged pages are not downloaded again.
+        """
+        session = self._get_pooled_session(concurrency)
+        if workers is not None and workers > 1:
+            converter = concurrent.futures.ProcessPoolExecutor(
+                max_workers=workers,
+                initializer=_init_url_worker,
+                initargs=(self._page_converters, self._get_worker_options()),
+            )
+        else:
+            converter = None
+
+        def _convert_downloaded(download, result):
+            """Chain the conversion of a downloaded page to its download."""
+            try:
+                final_url, headers, content = download.result()
+                extensions = self._get_http_extensions(headers, final_url, **kwargs)
+                if converter is None:
+                    result.set_result((content, extensions, final_url))
+                    return
+                conversion = converter.submit(
+                    _convert_url_content, content, extensions, final_url, kwargs
+                )
+                conversion.add_done_callback(
+                    functools.partial(_copy_future_outcome, target=result)
+                )
+            except BaseException as e:
+                result.set_exception(e)
+
+        downloader = concurrent.futures.ThreadPoolExecutor(max_workers=concurrency)
+        pending = collections.deque()
+        url_iter = iter(urls)
+
+        def _submit_next():
+            url = next(url_iter, _NO_MORE_URLS)
+            if url is _NO_MORE_URLS:
+                return
+            result = concurrent.futures.Future()
+            download = downloader.submit(self._download, url, session)
+            download.add_done_callback(
+                functools.partial(_convert_downloaded, result=result)
+            )
+            pending.append((url, result))
+
+        # Keep a bounded window of URLs in flight, yielding them in order
+        try:
+            for _ in range(2 * concurrency + (workers or 0)):
+                _submit_next()
+
+            while pending:
+                url, result = pending.popleft()
+                _submit_next()
+                try:
+                    outcome = result.result()
+                    if converter is None:
+                        # Convert here, while the next pages download
+                        content, extensions, final_url = outcome
+                        outcome = self._convert_content(
+                            content, extensions, url=final_url, **kwargs
+                        )
+                except (KeyboardInterrupt, SystemExit):
+                    raise
+                except BaseException as e:
+                    outcome = e
+                yield url, outcome
+        finally:
+            downloader.shutdown(wait=True, cancel_futures=True)
+            if converter is not None:
+                converter.shutdown(wait=True, cancel_futures=True)
+
+    async def aconvert_urls(
+        self,
+        urls: Iterable[str],
+        concurrency: int = 8,
+        workers: Optional[int] = None,
+        **kwargs: Any,
+    ) -> List[Tuple[str, Union[DocumentConverterResult, BaseException]]]:
+        """
+        Like convert_urls, for asyncio: returns the list of (url, result) pairs, in the order of
+        urls. Downloads run in a pool of `concurrency` threads, and conversions in a pool of
+        `workers` processes (or of threads, if workers is None or 1), without blocking the event loop.
+        """
+        import asyncio
+
+        loop = asyncio.get_running_loop()
+        session = self._get_pooled_session(concurrency)
+
+        # Bound the URLs in flight (downloading, downloaded or converting), as convert_urls does
+        semaphore = asyncio.Semaphore(2 * concurrency + (workers or 0))
+        if workers is not None and workers > 1:
+            converter = concurrent.futures.ProcessPoolExecutor(
+                max_workers=workers,
+                initializer=_init_url_worker,
+                initargs=(self._page_converters, self._get_worker_options()),
+            )
+        else:
+            converter = None
+
+        async def _convert_one(url):
+            try:
+                async with semaphore:
+                    final_url, headers, content = await loop.run_in_executor(
+                        downloader, self._download, url, session
+                    )
+                    extensions = self._get_http_extensions(headers, final_url, **kwargs)
+                    if converter is None:
+                        result = await loop.run_in_executor(
+                            None,
+                            functools.partial(
+                                self._convert_content,
+                                content,
+                                extensions,
+                                url=final_url,
+                                **kwargs,
+                            ),
+                        )
+                    else:
+                        result = await loop.run_in_executor(
+                            converter,
+                            _convert_url_content,
+                            content,
+                            extensions,
+                            final_url,
+                            kwargs,
+                        )
+                return url, result
+            except (KeyboardInterrupt, SystemExit, asyncio.CancelledError):
+                raise
+            except BaseException as e:
+                return url, e
+
+        with concurrent.futures.ThreadPoolExecutor(
+            max_workers=concurrency
+        ) as downloader:
+            try:
+                return list(await asyncio.gather(*[_convert_one(url) for url in urls]))
+            finally:
+                if converter is not None:
+                    converter.shutdown(wait=True, cancel_futures=True)
+
+    def _download(
+        self, url: str, session: Optional["requests.Session"] = None
+    ) -> Tuple[str, Dict[str, str], bytes]:
+        """Download a URL, returning (final url, headers, content). With a http_cache, the request
+        is conditional, and the cached content is returned if the server answers 304 Not Modified.
+        """
+        if not isinstance(url, str):
+            raise TypeError(f"Expected a URL string, got {url!r}")
+        if session is None:
+            session = self._get_requests_session()
+
+        entry = None
+        request_headers = {}
+        if self._http_cache is not None:
+            entry = self._http_cache.get(url)
+            if entry is not None:
+                if entry.headers.get("etag"):
+                    request_headers["If-None-Match"] = entry.headers["etag"]
+                if entry.headers.get("last-modified"):
+                    request_headers["If-Modified-Since"] = entry.headers[
+                        "last-modified"
+                    ]
+
+        response = session.get(url, headers=request_headers)
+        if entry is not None and response.status_code == 304:
+            self._http_cache.revalidate(url)
+            return entry.url, entry.headers, entry.content
+        response.raise_for_status()
+
+        content = response.content
+        if self._http_cache is not None:
+            self._http_cache.put(url, response.url, response.headers, content)
+        return response.url, response.headers, content
+
     def convert_response(
-        self, response: requests.Response, **kwargs: Any
+        self, response: "requests.Response", **kwargs: Any
     ) -> DocumentConverterResult:  # TODO fix kwargs type
         # Prepare a list of extensions to try (in order of priority)
+        extensions = self._get_http_extensions(response.headers, response.url, **kwargs)
+
+        # Download the file (in memory, unless it is larger than spool_threshold), and convert it
+        return self._convert_content(
+            response.iter_content(chunk_size=_SPOOL_CHUNK_SIZE),
+            extensions,
+            url=response.url,
+            **kwargs,
+        )
+
+    def _convert_response_iter(
+        self, response: "requests.Response", **kwargs: Any
+    ) -> Iterator[str]:
+        """Like convert_response, but yields the Markdown of each page or section."""
+        extensions = self._get_http_extensions(response.headers, response.url, **kwargs)
+        return self._convert_content_iter(
+            response.iter_content(chunk_size=_SPOOL_CHUNK_SIZE),
+            extensions,
+            url=response.url,
+            **kwargs,
+        )
+
+    def _get_http_extensions(
+        self, headers: Dict[str, str], url: str, **kwargs: Any
+    ) -> List[str]:
+        """Prepare a list of extensions to try for a HTTP response, given its (case insensitive,
+        or lower case) headers and its URL (in order of priority)."""
         ext = kwargs.get("file_extension")
         extensions = [ext] if ext is not None else []
 
         # Guess from the mimetype
-        content_type = response.headers.get("content-type", "").split(";")[0]
+        content_type = headers.get("content-type", "").split(";")[0]
         self._append_ext(extensions, mimetypes.guess_extension(content_type))
 
         # Read the content disposition if there is one
-        content_disposition = response.headers.get("content-disposition", "")
+        content_disposition = headers.get("content-disposition", "")
         m = re.search(r"filename=([^;]+)", content_disposition)
         if m:
             base, ext = os.path.splitext(m.group(1).strip("\"'"))
             self._append_ext(extensions, ext)
 
         # Read from the extension from the path
-        base, ext = os.path.splitext(urlparse(response.url).path)
+        base, ext = os.path.splitext(urlparse(url).path)
         self._append_ext(extensions, ext)
 
-        # Save the file locally to a temporary file. It will be deleted before this method exits
-        handle, temp_path = tempfile.mkstemp()
-        fh = os.fdopen(handle, "wb")
-        result = None
-        try:
-            # Download the file
-            for chunk in response.iter_content(chunk_size=512):
-                fh.write(chunk)
-            fh.close()
-
-            # Use puremagic to check for more extension options
-            for g in self._guess_ext_magic(temp_path):
-                self._append_ext(extensions, g)
-
-            # Convert
-            result = self._convert(temp_path, extensions, url=response.url, **kwargs)
-        # Clean up
-        finally:
-            try:
-                fh.close()
-            except Exception:
-                pass
-            os.unlink(temp_path)
-
-        return result
+        return extensions
 
     def _convert(
         self, local_path: str, extensions: List[Union[str, None]], **kwargs
     ) -> DocumentConverterResult:
-        error_trace = ""
-        for ext in extensions + [None]:  # Try last with no extension
-            for converter in self._page_converters:
-                _kwargs = copy.deepcopy(kwargs)
-
-                # Overwrite file_extension appropriately
-                if ext is None:
-                    if "file_extension" in _kwargs:
-                        del _kwargs["file_extension"]
-                else:
-                    _kwargs.update({"file_extension": ext})
-
-                # Copy any additional global options
-                if "llm_client" not in _kwargs and self._llm_client is not None:
-                    _kwargs["llm_client"] = self._llm_client
-
-                if "llm_model" not in _kwargs and self._llm_model is not None:
-                    _kwargs["llm_model"] = self._llm_model
-
-                # Add the list of converters for nested processing
-                _kwargs["_parent_converters"] = self._page_converters
+        start = time.perf_counter()
+        trace = ConversionTrace(_source_name(local_path), extensions)
+        try:
+            trace.input_size = _source_size(local_path)
+            res = self._convert_traced(local_path, extensions, trace, **kwargs)
+            trace.output_size = len(res.text_content)
+            return res
+        except BaseException as e:
+            trace.error = type(e).__name__
+            raise
+        finally:
+            trace.total_time = time.perf_counter() - start
+            self._metrics.record(trace)
 
-                if "style_map" not in _kwargs and self._style_map is not None:
-                    _kwargs["style_map"] = self._style_map
+    def _convert_traced(
+        self,
+        local_path: str,
+        extensions: List[Union[str, None]],
+        trace: ConversionTrace,
+        **kwargs,
+    ) -> DocumentConverterResult:
+        converter_kwargs = self._get_converter_kwargs(**kwargs)
+
+        # Return the cached result, if there is one
+        cache_key = None
+        if self._cache is not None:
+            cache_key = self._get_cache_key(local_path, extensions, converter_kwargs)
+        if cache_key is not None:
+            res = self._cache.get(cache_key)
+            if res is not None:
+                trace.cached = True
+                return res
 
+        error_trace = ""
+        source = _SpilledSource(local_path)
+        try:
+            for converter, _kwargs in self._iter_attempts(extensions, converter_kwargs):
                 # If we hit an error log it and keep trying
+                res = None
+                outcome = "declined"
+                attempt_start = time.perf_counter()
                 try:
-                    res = converter.convert(local_path, **_kwargs)
+                    res = converter.convert(source.get(converter), **_kwargs)
                 except Exception:
                     error_trace = ("\n\n" + traceback.format_exc()).strip()
+                    outcome = "error"
+                if res is not None:
+                    outcome = "accepted"
+                trace.add_attempt(
+                    converter,
+                    _kwargs.get("file_extension"),
+                    time.perf_counter() - attempt_start,
+                    outcome,
+                )
 
                 if res is not None:
                     # Normalize the content
+                    normalize_start = time.perf_counter()
                     res.text_content = "\n".join(
                         [line.rstrip() for line in re.split(r"\r?\n", res.text_content)]
                     )
                     res.text_content = re.sub(r"\n{3,}", "\n\n", res.text_content)
+                    trace.normalize_time = time.perf_counter() - normalize_start
+
+                    if cache_key is not None:
+                        self._cache.put(cache_key, res)
 
                     # Todo
                     return res
+        finally:
+            source.close()
+
+        self._raise_conversion_error(local_path, extensions, error_trace)
+
+    def _convert_iter(
+        self, local_path: str, extensions: List[Union[str, None]], **kwargs
+    ) -> Iterator[str]:
+        """Like _convert, but yields the normalized Markdown of each page or section. The times
+        traced exclude the time the caller spends between sections."""
+        trace = ConversionTrace(_source_name(local_path), extensions)
+        trace.output_size = 0
+        sections = self._convert_iter_traced(local_path, extensions, trace, **kwargs)
+        try:
+            resume = time.perf_counter()
+            trace.input_size = _source_size(local_path)
+            for text in sections:
+                trace.total_time += time.perf_counter() - resume
+                trace.output_size += len(text)
+                yield text
+                resume = time.perf_counter()
+            trace.total_time += time.perf_counter() - resume
+        except GeneratorExit:
+            raise
+        except BaseException as e:
+            trace.total_time += time.perf_counter() - resume
+            trace.error = type(e).__name__
+            raise
+        finally:
+            sections.close()
+            self._metrics.record(trace)
+
+    def _convert_iter_traced(
+        self,
+        local_path: str,
+        extensions: List[Union[str, None]],
+        trace: ConversionTrace,
+        **kwargs,
+    ) -> Iterator[str]:
+        converter_kwargs = self._get_converter_kwargs(**kwargs)
+
+        # Yield the cached result, if there is one. Streamed results have no title, so they are
+        # stored under their own key (which convert does not read), and full results are preferred
+        cache_key = stream_key = None
+        if self._cache is not None:
+            cache_key = self._get_cache_key(local_path, extensions, converter_kwargs)
+        if cache_key is not None:
+            stream_key = cache_key + ":sections"
+            res = self._cache.get(cache_key) or self._cache.get(stream_key)
+            if res is not None:
+                trace.cached = True
+                if res.text_content:
+                    yield res.text_content
+                return
+
+        error_trace = ""
+        source = _SpilledSource(local_path)
+        try:
+            for converter, _kwargs in self._iter_attempts(extensions, converter_kwargs):
+                # If we hit an error before the first section, log it and keep trying
+                sections = None
+                first = None
+                outcome = "declined"
+                attempt_start = time.perf_counter()
+                try:
+                    sections = converter.convert_iter(source.get(converter), **_kwargs)
+                    if sections is not None:
+                        first = next(sections, None)
+                        outcome = "accepted"
+                except Exception:
+                    error_trace = ("\n\n" + traceback.format_exc()).strip()
+                    sections = None
+                    outcome = "error"
+                converter_time = time.perf_counter() - attempt_start
+                if sections is None:
+                    trace.add_attempt(
+                        converter,
+                        _kwargs.get("file_extension"),
+                        converter_time,
+                        outcome,
+                    )
+
+                if sections is not None:
+                    normalizer = _StreamingNormalizer()
+                    output = []
+                    try:
+                        section = first or ""
+                        while True:
+                            normalize_start = time.perf_counter()
+                            text = normalizer.feed(section)
+                            trace.normalize_time += (
+                                time.perf_counter() - normalize_start
+                            )
+                            if text:
+                                output.append(text)
+                                yield text
+                            section_start = time.perf_counter()
+                            section = next(sections, None)
+                            converter_time += time.perf_counter() - section_start
+                            if section is None:
+                                break
+                    finally:
+                        trace.add_attempt(
+                            converter,
+                            _kwargs.get("file_extension"),
+                            converter_time,
+                            outcome,
+                        )
+                    normalize_start = time.perf_counter()
+                    text = normalizer.finish()
+                    trace.normalize_time += time.perf_counter() - normalize_start
+                    if text:
+                        output.append(text)
+                        yield text
+
+                    if stream_key is not None:
+                        self._cache.put(
+                            stream_key,
+                            DocumentConverterResult(
+                                title=None, text_content="".join(output)
+                            ),
+                        )
+                    return
+        finally:
+            source.close()
+
+        self._raise_conversion_error(local_path, extensions, error_trace)
+
+    def _get_converter_kwargs(self, **kwargs: Any) -> Dict[str, Any]:
+        """Copy the caller's options, and add any additional global options."""
+        base_kwargs = copy.deepcopy(kwargs)
+        if "llm_client" not in base_kwargs and self._llm_client is not None:
+            base_kwargs["llm_client"] = self._llm_client
+
+        if "llm_model" not in base_kwargs and self._llm_model is not None:
+            base_kwargs["llm_model"] = self._llm_model
+
+        if "style_map" not in base_kwargs and self._style_map is not None:
+            base_kwargs["style_map"] = self._style_map
+
+        if "max_workers" not in base_kwargs and self._max_workers is not None:
+            base_kwargs["max_workers"] = self._max_workers
+
+        if "pdf_engine" not in base_kwargs and self._pdf_engine is not None:
+            base_kwargs["pdf_engine"] = self._pdf_engine
+
+        if "image_policy" not in base_kwargs and self._image_policy is not None:
+            base_kwargs["image_policy"] = self._image_policy
+
+        if "image_dir" not in base_kwargs and self._image_dir is not None:
+            base_kwargs["image_dir"] = self._image_dir
+
+        if "html_parser" not in base_kwargs and self._html_parser is not None:
+            base_kwargs["html_parser"] = self._html_parser
+
+        if "caption_cache" not in base_kwargs:
+            base_kwargs["caption_cache"] = self._caption_cache
+
+        if (
+            "llm_max_image_size" not in base_kwargs
+            and self._llm_max_image_size is not None
+        ):
+            base_kwargs["llm_max_image_size"] = self._llm_max_image_size
+
+        if "llm_concurrency" not in base_kwargs and self._llm_concurrency is not None:
+            base_kwargs["llm_concurrency"] = self._llm_concurrency
+
+        # Share the parsed HTML documents between the converters tried
+        base_kwargs["_html_documents"] = _HtmlDocuments()
+
+        # Add the list of converters for nested processing
+        base_kwargs["_parent_converters"] = self._page_converters
+
+        return base_kwargs
+
+    def _iter_attempts(
+        self, extensions: List[Union[str, None]], converter_kwargs: Dict[str, Any]
+    ):
+        """Yield the (converter, kwargs) pairs to try, in priority order."""
+        tried = set()
+        for ext in extensions + [None]:  # Try last with no extension
+            # Skip repeated candidates
+            key = None if ext is None else ext.lower()
+            if key in tried:
+                continue
+            tried.add(key)
+
+            for converter in self._get_converters_for_extension(ext):
+                _kwargs = dict(converter_kwargs)
+
+                # Overwrite file_extension appropriately
+                if ext is None:
+                    if "file_extension" in _kwargs:
+                        del _kwargs["file_extension"]
+                else:
+                    _kwargs.update({"file_extension": ext})
+
+                yield converter, _kwargs
+
+    def _get_cache_key(
+        self,
+        local_path: str,
+        extensions: List[Union[str, None]],
+        converter_kwargs: Dict[str, Any],
+    ) -> Optional[str]:
+        """The cache key of a conversion: the SHA-256 of the input bytes, followed by a digest of
+        the registered converters (and their versions), the candidate extensions, the options that
+        affect the output, and the optional tools installed (see _cache_environment). None if an
+        option cannot be keyed (see _cache_token), in which case the conversion is not cached.
+        """
+        options = {}
+        for k, v in converter_kwargs.items():
+            if k in _CACHE_IGNORED_OPTIONS:
+                continue
+            if k in _CACHE_PRESENCE_OPTIONS:
+                options[k] = v is not None
+                continue
+            options[k] = _cache_token(v)
+            if options[k] is _UNCACHEABLE:
+                return None
+
+        content_digest = hashlib.sha256()
+        with _open_binary(local_path) as fh:
+            for chunk in iter(lambda: fh.read(1024 * 1024), b""):
+                content_digest.update(chunk)
+
+        converters = [
+            f"{type(c).__module__}.{type(c).__qualname__}:{getattr(c, 'version', None)}"
+            for c in self._page_converters
+        ]
+        description = json.dumps(
+            [__version__, converters, extensions, options, _cache_environment()],
+            sort_keys=True,
+        )
+        return (
+            content_digest.hexdigest()
+            + ":"
+            + hashlib.sha256(description.encode("utf-8")).hexdigest()
+        )
 
+    def _raise_conversion_error(
+        self, local_path: str, extensions: List[Union[str, None]], error_trace: str
+    ) -> None:
         # If we got this far without success, report any exceptions
         if len(error_trace) > 0:
             raise FileConversionException(
-                f"Could not convert '{local_path}' to Markdown. File type was recognized as {extensions}. While converting the file, the following error was encountered:\n\n{error_trace}"
+                f"Could not convert '{_source_name(local_path)}' to Markdown. File type was recognized as {extensions}. While converting the file, the following error was encountered:\n\n{error_trace}"
             )
 
         # Nothing can handle it!
         raise UnsupportedFormatException(
-            f"Could not convert '{local_path}' to Markdown. The formats {extensions} are not supported."
+            f"Could not convert '{_source_name(local_path)}' to Markdown. The formats {extensions} are not supported."
         )
 
+    def _get_requests_session(self) -> "requests.Session":
+        """Return the requests session, creating one on first use."""
+        if self._requests_session is None:
+            import requests
+
+            self._requests_session = requests.Session()
+        return self._requests_session
+
+    def _get_pooled_session(self, concurrency: int) -> "requests.Session":
+        """Return the requests session, with a connection pool sized for `concurrency` concurrent
+        requests per host. A session given to the constructor is returned as it is.
+
+        The adapter is reused (with its keep-alive connections) by later calls, unless they need a
+        larger pool, in which case it is closed and replaced."""
+        if not self._owns_requests_session:
+            return self._requests_session
+
+        import requests.adapters
+
+        session = self._get_requests_session()
+        if self._pooled_adapter is None or self._pooled_adapter_size < concurrency:
+            adapter = requests.adapters.HTTPAdapter(
+                pool_connections=concurrency, pool_maxsize=concurrency
+            )
+            session.mount("http://", adapter)
+            session.mount("https://", adapter)
+            if self._pooled_adapter is not None:
+                self._pooled_adapter.close()
+            self._pooled_adapter = adapter
+            self._pooled_adapter_size = concurrency
+        return session
+
+    def _get_worker_options(self) -> Dict[str, Any]:
+        """The constructor options of a MarkItDown equivalent to this one, in a worker process."""
+        return {
+            "llm_client": self._llm_client,
+            "llm_model": self._llm_model,
+            "style_map": self._style_map,
+            "max_workers": self._max_workers,
+            "pdf_engine": self._pdf_engine,
+            "image_policy": self._image_policy,
+            "image_dir": self._image_dir,
+            "html_parser": self._html_parser,
+            "caption_cache": self._caption_cache,
+            "llm_max_image_size": self._llm_max_image_size,
+            "llm_concurrency": self._llm_concurrency,
+            "spool_threshold": self._spool_threshold,
+            # The worker opens its own connection to the cache
+            "cache": None
+            if self._cache is None
+            else (self._cache.path, self._cache.max_size),
+        }
+
     def _append_ext(self, extensions, ext):
         """Append a unique non-None, non-empty extension to a list of extensions."""
         if ext is None:
@@ -1469,14 +5824,24 @@ class MarkItDown:
         ext = ext.strip()
         if ext == "":
             return
-        # if ext not in extensions:
-        extensions.append(ext)
+        if ext not in extensions:
+            extensions.append(ext)
 
     def _guess_ext_magic(self, path):
         """Use puremagic (a Python implementation of libmagic) to guess a file's extension based on the first few bytes."""
         # Use puremagic to guess
+        import puremagic
+
         try:
-            guesses = puremagic.magic_file(path)
+            if _is_stream(path):
+                # Only the first and last few bytes are read. Like magic_file, return no
+                # guesses if nothing matches
+                try:
+                    guesses = puremagic.magic_stream(path)
+                except puremagic.PureError:
+                    guesses = []
+            else:
+                guesses = puremagic.magic_file(path)
             extensions = list()
             for g in guesses:
                 ext = g.extension.strip()
@@ -1494,6 +5859,42 @@ class MarkItDown:
             pass
         return []
 
+    def _get_converters_for_extension(
+        self, ext: Union[str, None]
+    ) -> List[DocumentConverter]:
+        """Return the registered converters that may accept the given extension, in priority order.
+        Converters that do not declare their supported extensions are always included.
+        """
+        key = None if ext is None else ext.lower()
+        converters = self._converter_index.get(key)
+        if converters is not None:
+            return converters
+
+        content_type = None
+        if key is not None:
+            content_type, _ = mimetypes.guess_type("__placeholder" + key)
+            content_type = None if content_type is None else content_type.lower()
+
+        converters = []
+        for converter in self._page_converters:
+            if (
+                converter.supported_extensions is None
+                and converter.supported_mimetypes is None
+            ):
+                converters.append(converter)
+            elif key is None:
+                continue
+            elif key in (converter.supported_extensions or []):
+                converters.append(converter)
+            elif content_type is not None and any(
+                content_type.startswith(m) for m in converter.supported_mimetypes or []
+            ):
+                converters.append(converter)
+
+        self._converter_index[key] = converters
+        return converters
+
     def register_page_converter(self, converter: DocumentConverter) -> None:
         """Register a page text converter."""
         self._page_converters.insert(0, converter)
+        self._converter_index.clear()
@@ -0,0 +1,351 @@
+# SPDX-FileCopyrightText: 2024-present Adam Fourney <adamfo@microsoft.com>
+#
+# SPDX-License-Identifier: MIT
+"""
+A persistent conversion server, started with `markitdown --serve`.
+
+A pool of worker processes each keep a warm MarkItDown instance (heavy imports and pdfminer's
+CMaps are loaded once), behind a local HTTP endpoint on a TCP port or a Unix socket:
+
+    GET  /health    Returns the server status as JSON.
+    POST /convert   Converts a file, and streams back the Markdown (one chunk per page or section).
+                    The body is either a JSON object {"path": "/local/file.pdf"}, or the raw bytes
+                    of the file. Options (file_extension, url) can be passed as query parameters,
+                    or as members of the JSON object.
+
+The number of conversions running at once is bounded by the number of workers, and at most
+max_queue more requests wait for a worker. Beyond that, the server answers 503 (without reading
+the request body). Bodies are read into memory, and larger ones than max_body_size are answered
+with a 413. If a worker process dies, its conversion is answered with a 500, and the pool
+is recreated for the next requests.
+"""
+import concurrent.futures
+import http.server
+import json
+import multiprocessing
+import os
+import queue as queue_module
+import socketserver
+import stat
+import threading
+import traceback
+from typing import Any, Dict, Optional
+from urllib.parse import parse_qs, urlparse
+
+from ._markitdown import MarkItDown
+
+# The MarkItDown instance of a worker process
+_worker_markitdown: Optional[MarkItDown] = None
+
+# The default maximum size of a request body (an uploaded file), in bytes
+DEFAULT_MAX_BODY_SIZE = 256 * 1024**2
+
+# How often (in seconds) a request waiting for messages checks that its worker is still alive
+_POLL_INTERVAL = 1.0
+
+
+def _init_worker() -> None:
+    """Create the MarkItDown instance reused for every conversion in this worker process."""
+    global _worker_markitdown
+    _worker_markitdown = MarkItDown()
+
+
+def _convert_to_queue(request: Dict[str, Any], queue: Any) -> None:
+    """Convert a file in a worker process, putting ("section", text) messages on the queue as they
+    are converted, then ("done", None), or ("error", traceback) on failure."""
+    try:
+        kwargs = {k: request[k] for k in ["file_extension", "url"] if request.get(k)}
+
+        # A local path, or the uploaded bytes (converted in memory)
+        source = request.get("path")
+        if source is None:
+            source = request["content"]
+
+        for section in _worker_markitdown.convert_iter(source, **kwargs):
+            queue.put(("section", section))
+        queue.put(("done", None))
+    except BaseException:
+        queue.put(("error", traceback.format_exc()))
+
+
+class ConversionServer:
+    """Owns the worker pool, and bounds the number of running and queued conversions, and the size
+    of their request bodies."""
+
+    def __init__(
+        self,
+        workers: int = 4,
+        max_queue: int = 16,
+        max_body_size: int = DEFAULT_MAX_BODY_SIZE,
+    ):
+        self.workers = workers
+        self.max_queue = max_queue
+        self.max_body_size = max_body_size
+        self._slots = threading.BoundedSemaphore(workers + max_queue)
+        self._active = 0
+        self._active_lock = threading.Lock()
+        self._manager = multiprocessing.Manager()
+        self._executor_lock = threading.Lock()
+        self._executor = self._create_executor()
+        self.pool_restarts = 0
+
+    def _create_executor(self) -> concurrent.futures.ProcessPoolExecutor:
+        return concurrent.futures.ProcessPoolExecutor(
+            max_workers=self.workers, initializer=_init_worker
+        )
+
+    def _is_broken(self) -> bool:
+        # Set by the executor when one of its processes dies (even an idle one)
+        return bool(getattr(self._executor, "_broken", False))
+
+    def _restart_executor(self, broken: concurrent.futures.ProcessPoolExecutor) -> None:
+        """Replace a broken executor (unless another request already did)."""
+        with self._executor_lock:
+            if self._executor is not broken:
+                return
+            broken.shutdown(wait=False, cancel_futures=True)
+            self._executor = self._create_executor()
+            self.pool_restarts += 1
+
+    def try_acquire(self) -> bool:
+        """Reserve a slot for a request, returning False if the queue is full."""
+        if not self._slots.acquire(blocking=False):
+            return False
+        with self._active_lock:
+            self._active += 1
+        return True
+
+    def release(self) -> None:
+        with self._active_lock:
+            self._active -= 1
+        self._slots.release()
+
+    def status(self) -> Dict[str, Any]:
+        """The server status. A broken pool (a worker died) is recreated by the next conversion."""
+        broken = self._is_broken()
+        return {
+            "status": "degraded" if broken else "ok",
+            "pool": "broken" if broken else "ok",
+            "pool_restarts": self.pool_restarts,
+            "workers": self.workers,
+            "max_queue": self.max_queue,
+            "max_body_size": self.max_body_size,
+            "active": self._active,
+        }
+
+    def convert(self, request: Dict[str, Any]):
+        """Start a conversion, and return its future and a queue of its messages (see
+        _convert_to_queue, and next_message). A broken pool is recreated first."""
+        queue = self._manager.Queue()
+        executor = self._executor
+        if self._is_broken():
+            self._restart_executor(executor)
+            executor = self._executor
+        try:
+            future = executor.submit(_convert_to_queue, request, queue)
+        except concurrent.futures.process.BrokenProcessPool:
+            self._restart_executor(executor)
+            future = self._executor.submit(_convert_to_queue, request, queue)
+        return future, queue
+
+    def next_message(self, future: concurrent.futures.Future, queue: Any):
+        """Wait for the next message of a conversion. If its worker died (the future finished
+        without a last message), returns ("died", message) and recreates the pool."""
+        while True:
+            try:
+                return queue.get(timeout=_POLL_INTERVAL)
+            except queue_module.Empty:
+                if not future.done():
+                    continue
+            # Messages are put before the future completes, so a finished future has none left
+            try:
+                return queue.get_nowait()
+            except queue_module.Empty:
+                pass
+            error = future.exception()
+            if isinstance(error, concurrent.futures.process.BrokenProcessPool):
+                self._restart_executor(self._executor)
+            return "died", f"The worker process died: {error!r}"
+
+    def close(self) -> None:
+        self._executor.shutdown(wait=True, cancel_futures=True)
+        self._manager.shutdown()
+
+
+class _RequestHandler(http.server.BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    # Set by make_server
+    conversion_server: ConversionServer = None
+
+    def address_string(self) -> str:
+        # Unix socket clients have no address
+        return self.client_address[0] if self.client_address else "unix"
+
+    def do_GET(self) -> None:
+        if urlparse(self.path).path != "/health":
+            self._send_error(404, "Not found")
+            return
+        self._send_json(200, self.conversion_server.status())
+
+    def do_POST(self) -> None:
+        parsed_path = urlparse(self.path)
+        if parsed_path.path != "/convert":
+            self._send_error(404, "Not found")
+            return
+
+        # Reject requests beyond the queue before reading their body
+        if not self.conversion_server.try_acquire():
+            self.close_connection = True  # The body is left unread
+            self._send_error(503, "Server busy, try again later")
+            return
+        try:
+            self._convert(parsed_path)
+        finally:
+            self.conversion_server.release()
+
+    def _convert(self, parsed_path) -> None:
+        # The body is read into memory, up to max_body_size bytes
+        try:
+            content_length = int(self.headers.get("Content-Length") or 0)
+        except ValueError:
+            content_length = -1
+        if content_length < 0:
+            self.close_connection = True
+            self._send_error(400, "Invalid Content-Length")
+            return
+        if content_length > self.conversion_server.max_body_size:
+            self.close_connection = True  # The body is left unread
+            self._send_error(
+                413,
+                f"Request body too large (the maximum is {self.conversion_server.max_body_size} bytes)",
+            )
+            return
+        body = self.rfile.read(content_length)
+
+        # Read the request
+        params = {k: v[0] for k, v in parse_qs(parsed_path.query).items()}
+        content_type = self.headers.get("Content-Type", "").split(";")[0].strip()
+        if content_type == "application/json":
+            try:
+                request = json.loads(body.decode("utf-8"))
+            except ValueError:
+                request = None
+            if not isinstance(request, dict) or not isinstance(
+                request.get("path"), str
+            ):
+                self._send_error(400, 'Expected a JSON object like {"path": "..."}')
+                return
+            request = {**params, **request}
+        else:
+            request = {**params, "content": body}
+
+        future, queue = self.conversion_server.convert(request)
+
+        # Wait for the first message, so that errors get a proper status code
+        kind, payload = self.conversion_server.next_message(future, queue)
+        if kind == "error":
+            self._send_error(422, payload)
+            return
+        if kind == "died":
+            self._send_error(500, payload)
+            return
+
+        self.send_response(200)
+        self.send_header("Content-Type", "text/markdown; charset=utf-8")
+        self.send_header("Transfer-Encoding", "chunked")
+        self.end_headers()
+        while kind == "section":
+            if payload:
+                self._write_chunk(payload.encode("utf-8"))
+            kind, payload = self.conversion_server.next_message(future, queue)
+
+        # An error after the first section ends the stream without the final chunk,
+        # so that clients see a truncated response rather than a complete one
+        if kind != "done":
+            self.log_error("Conversion failed while streaming: %s", payload)
+            self.close_connection = True
+            return
+        self._write_chunk(b"")  # The last chunk
+
+    def _write_chunk(self, data: bytes) -> None:
+        self.wfile.write(f"{len(data):X}\r\n".encode("ascii") + data + b"\r\n")
+        self.wfile.flush()
+
+    def _send_json(self, code: int, obj: Any) -> None:
+        data = json.dumps(obj).encode("utf-8")
+        self.send_response(code)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def _send_error(self, code: int, message: str) -> None:
+        self._send_json(code, {"error": message})
+
+
+class _ThreadingUnixHTTPServer(
+    socketserver.ThreadingMixIn, socketserver.UnixStreamServer
+):
+    daemon_threads = True
+
+
+def make_server(
+    conversion_server: ConversionServer,
+    host: str = "127.0.0.1",
+    port: int = 8000,
+    socket_path: Optional[str] = None,
+) -> socketserver.BaseServer:
+    """Create the HTTP server (on a Unix socket if socket_path is given, otherwise on host:port)."""
+    handler = type(
+        "RequestHandler",
+        (_RequestHandler,),
+        {"conversion_server": conversion_server},
+    )
+    if socket_path is not None:
+        if os.path.lexists(socket_path):
+            if not _is_socket(socket_path):
+                raise ValueError(
+                    f"{socket_path} exists, and is not a socket: refusing to replace it."
+                )
+            os.unlink(socket_path)  # Left behind by a previous server
+        return _ThreadingUnixHTTPServer(socket_path, handler)
+    return http.server.ThreadingHTTPServer((host, port), handler)
+
+
+def _is_socket(path: str) -> bool:
+    """Whether path is a Unix socket (and not, e.g., a regular file, or a link to one)."""
+    try:
+        return stat.S_ISSOCK(os.lstat(path).st_mode)
+    except FileNotFoundError:
+        return False
+
+
+def serve(
+    host: str = "127.0.0.1",
+    port: int = 8000,
+    socket_path: Optional[str] = None,
+    workers: int = 4,
+    max_queue: int = 16,
+    max_body_size: int = DEFAULT_MAX_BODY_SIZE,
+) -> None:
+    """Run the conversion server until interrupted."""
+    conversion_server = ConversionServer(
+        workers=workers, max_queue=max_queue, max_body_size=max_body_size
+    )
+    try:
+        server = make_server(conversion_server, host, port, socket_path)
+    except BaseException:
+        conversion_server.close()
+        raise
+    address = socket_path if socket_path is not None else f"http://{host}:{port}"
+    print(f"markitdown serving on {address} with {workers} workers", flush=True)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        conversion_server.close()
+        if socket_path is not None and _is_socket(socket_path):
+            os.unlink(socket_path)
@@ -1,14 +1,52 @@
 #!/usr/bin/env python3 -m pytest
+import asyncio
+import base64
+import hashlib
+import http.client
+import http.server
 import io
+import json
+import mimetypes
 import os
 import shutil
+import socket
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+import wave
+import zipfile
 
 import pytest
 import requests
 
 from warnings import catch_warnings, resetwarnings
 
-from markitdown import MarkItDown
+from markitdown import (
+    ConversionCache,
+    ConversionMetrics,
+    ConversionTrace,
+    ExifTool,
+    FileConversionException,
+    HttpCache,
+    MarkItDown,
+    UnsupportedFormatException,
+)
+from markitdown import _markitdown, _server
+from markitdown._markitdown import (
+    AudioRecognizer,
+    DocumentConverter,
+    DocumentConverterResult,
+    DocxConverter,
+    HtmlConverter,
+    IpynbConverter,
+    PdfConverter,
+    RSSConverter,
+    WikipediaConverter,
+    XlsxConverter,
+)
+from markitdown._server import ConversionServer, make_server
 
 skip_remote = (
     True if os.environ.get("GITHUB_ACTIONS") else False
@@ -17,10 +55,12 @@ skip_remote = (
 
 # Don't run the llm tests without a key and the client library
 skip_llm = False if os.environ.get("OPENAI_API_KEY") else True
+skip_openai = False
 try:
     import openai
 except ModuleNotFoundError:
     skip_llm = True
+    skip_openai = True
 
 # Skip exiftool tests if not installed
 skip_exiftool = shutil.which("exiftool") is None
@@ -35,6 +75,11 @@ JPG_TEST_EXIFTOOL = {
     "DateTimeOriginal": "2024:03:14 22:10:00",
 }
 
+# A multi-page CJK PDF from the sample corpus
+PDF_TEST_FILE = os.path.join(
+    os.path.dirname(__file__), "..", "extracted_pdfs", "计算机网络的性能.pdf"
+)
+
 PDF_TEST_URL = "https://arxiv.org/pdf/2308.08155v2.pdf"
 PDF_TEST_STRINGS = [
     "While there is contemporaneous exploration of multi-agent approaches"
@@ -126,6 +171,23 @@ CSV_CP932_TEST_STRINGS = [
     "髙橋淳,35,名古屋",
 ]
 
+# Heavy dependencies that `import markitdown` must not import, and a (generous) time budget
+STARTUP_EXCLUDED_MODULES = [
+    "bs4",
+    "charset_normalizer",
+    "mammoth",
+    "markdownify",
+    "numpy",
+    "pandas",
+    "pdfminer",
+    "pptx",
+    "puremagic",
+    "pydub",
+    "requests",
+    "speech_recognition",
+    "youtube_transcript_api",
+]
+
 LLM_TEST_STRINGS = [
     "5bda1dd6",
 ]
@@ -244,6 +306,1440 @@ def test_markitdown_local() -> None:
         assert test_string in text_content
 
 
+def test_markitdown_startup() -> None:
+    # List the modules imported by a fresh interpreter with `python -X importtime` (the time
+    # itself is measured by benchmarks/run_suite.py, as it varies with the machine)
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import markitdown"],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+    # Each line is "import time: <self us> | <cumulative us> | <indented module name>"
+    import_times = {}
+    for line in completed.stderr.splitlines():
+        parts = line.split("|")
+        if len(parts) != 3 or not parts[1].strip().isdigit():
+            continue
+        import_times[parts[2].strip()] = int(parts[1].strip())
+
+    assert "markitdown" in import_times
+
+    # The converters' backends must be imported on first use, not on startup
+    for module in STARTUP_EXCLUDED_MODULES:
+        assert module not in import_times, f"'import markitdown' imports {module}"
+
+
+def test_markitdown_dispatch() -> None:
+    markitdown = MarkItDown()
+
+    # Only converters declaring the extension are tried, in priority order
+    pdf_converters = markitdown._get_converters_for_extension(".PDF")
+    assert [type(c).__name__ for c in pdf_converters] == ["PdfConverter"]
+    html_converters = markitdown._get_converters_for_extension(".html")
+    assert [type(c).__name__ for c in html_converters] == [
+        "BingSerpConverter",
+        "YouTubeConverter",
+        "WikipediaConverter",
+        "HtmlConverter",
+        "PlainTextConverter",
+    ]
+    assert markitdown._get_converters_for_extension(None) == []
+
+    # Converters that do not declare extensions are tried with every candidate
+    class _CountingConverter(DocumentConverter):
+        def __init__(self):
+            self.calls = []
+
+        def convert(self, local_path, **kwargs):
+            self.calls.append(kwargs.get("file_extension"))
+            return None
+
+    counter = _CountingConverter()
+    markitdown.register_page_converter(counter)
+    result = markitdown.convert(
+        os.path.join(TEST_FILES_DIR, "test.docx"), file_extension=".docx"
+    )
+    assert "# Abstract" in result.text_content
+    assert counter.calls == [".docx"]
+
+    # Repeated candidates are only tried once
+    with pytest.raises(UnsupportedFormatException):
+        markitdown._convert(
+            os.path.join(TEST_FILES_DIR, "test.jpg"), [".foo", ".FOO", ".foo"]
+        )
+    assert counter.calls == [".docx", ".foo", None]
+
+
+def test_markitdown_convert_iter() -> None:
+    markitdown = MarkItDown()
+
+    # Joining the sections gives the same text as convert
+    for name, min_sections in [
+        ("test.pptx", 3),
+        ("test.xlsx", 2),
+        ("test_files.zip", 3),
+        ("test.docx", 1),
+        ("test_mskanji.csv", 1),
+        ("test_rss.xml", 3),
+    ]:
+        path = os.path.join(TEST_FILES_DIR, name)
+        sections = list(markitdown.convert_iter(path))
+        assert len(sections) >= min_sections
+        assert "".join(sections) == markitdown.convert(path).text_content
+
+    # Sections are produced lazily
+    sections = markitdown.convert_iter(os.path.join(TEST_FILES_DIR, "test.pptx"))
+    assert "<!-- Slide number: 1 -->" in next(sections)
+
+    # Errors surface while iterating
+    with pytest.raises(UnsupportedFormatException):
+        list(
+            markitdown._convert_iter(os.path.join(TEST_FILES_DIR, "test.jpg"), [".foo"])
+        )
+
+    if os.path.isfile(PDF_TEST_FILE):
+        pages = list(markitdown.convert_iter(PDF_TEST_FILE))
+        assert len(pages) > 1
+        assert "".join(pages) == markitdown.convert(PDF_TEST_FILE).text_content
+
+
+def test_markitdown_stream() -> None:
+    markitdown = MarkItDown()
+    markitdown_spilled = MarkItDown(spool_threshold=1024)
+
+    # Streams and buffers are converted in memory, without temporary files
+    mkstemp = _markitdown.tempfile.mkstemp
+    temp_files = []
+
+    def _mkstemp(*args, **kwargs):
+        temp_files.append(args)
+        return mkstemp(*args, **kwargs)
+
+    _markitdown.tempfile.mkstemp = _mkstemp
+    try:
+        for name in [
+            "test.docx",
+            "test.pptx",
+            "test.xlsx",
+            "test_blog.html",
+            "test_mskanji.csv",
+            "test_notebook.ipynb",
+            "test_rss.xml",
+        ]:
+            path = os.path.join(TEST_FILES_DIR, name)
+            expected = markitdown.convert(path).text_content
+            with open(path, "rb") as fh:
+                content = fh.read()
+
+            extension = os.path.splitext(name)[1]
+            result = markitdown.convert_stream(
+                io.BytesIO(content), file_extension=extension
+            )
+            assert result.text_content == expected
+            result = markitdown.convert(content, file_extension=extension)
+            assert result.text_content == expected
+            sections = markitdown.convert_iter(
+                io.BytesIO(content), file_extension=extension
+            )
+            assert "".join(sections) == expected
+
+            # Beyond the threshold, the content is spilled to disk
+            result = markitdown_spilled.convert_stream(
+                io.BytesIO(content), file_extension=extension
+            )
+            assert result.text_content == expected
+        assert temp_files == []
+    finally:
+        _markitdown.tempfile.mkstemp = mkstemp
+
+    # Converters that do not accept streams get a temporary file
+    class PathOnlyConverter(DocumentConverter):
+        supported_extensions = [".foo"]
+
+        def convert(self, local_path, **kwargs):
+            with open(local_path, "rt", encoding="utf-8") as fh:
+                return DocumentConverterResult(text_content=fh.read().upper())
+
+    markitdown.register_page_converter(PathOnlyConverter())
+    result = markitdown.convert_stream(io.BytesIO(b"foo bar"), file_extension=".foo")
+    assert result.text_content == "FOO BAR"
+
+
+def test_markitdown_cache() -> None:
+    with tempfile.TemporaryDirectory() as temp_dir:
+        cache = ConversionCache(os.path.join(temp_dir, "cache.sqlite"))
+        markitdown = MarkItDown(cache=cache)
+        docx_path = os.path.join(TEST_FILES_DIR, "test.docx")
+
+        expected = markitdown.convert(docx_path).text_content
+        assert cache.stats()["misses"] == 1
+        assert cache.stats()["entries"] == 1
+
+        # Hits must not run any converter
+        def _fail(*args, **kwargs):
+            raise AssertionError("a converter ran on a cache hit")
+
+        for converter in markitdown._page_converters:
+            converter.convert = _fail
+            converter.convert_iter = _fail
+
+        assert markitdown.convert(docx_path).text_content == expected
+        with open(docx_path, "rb") as fh:
+            result = markitdown.convert_stream(fh, file_extension=".docx")
+            assert result.text_content == expected
+        assert "".join(markitdown.convert_iter(docx_path)) == expected
+        assert cache.stats()["hits"] == 3
+
+        # Options that change the output are part of the key
+        markitdown = MarkItDown(cache=cache)
+        markitdown.convert(docx_path, style_map="comment-reference => ")
+        assert cache.stats()["misses"] == 2
+
+        # Objects are keyed by their cache_token() (or not cached without one), and LLM clients
+        # by their presence
+        class _UnkeyedRecognizer(AudioRecognizer):
+            pass
+
+        class _KeyedRecognizer(AudioRecognizer):
+            def cache_token(self):
+                return "test"
+
+        def _key(**options):
+            converter_kwargs = markitdown._get_converter_kwargs(**options)
+            return markitdown._get_cache_key(docx_path, [".docx"], converter_kwargs)
+
+        assert _key(audio_recognizer=_UnkeyedRecognizer()) is None
+        assert _key(audio_recognizer=_KeyedRecognizer()) == _key(
+            audio_recognizer=_KeyedRecognizer()
+        )
+        assert _key(audio_recognizer=_KeyedRecognizer()) != _key()
+        assert _key(llm_client=object()) == _key(llm_client=object()) != _key()
+
+        entries = cache.stats()["entries"]
+        markitdown.convert(docx_path, audio_recognizer=_UnkeyedRecognizer())
+        assert cache.stats()["entries"] == entries
+
+        # The cache persists across instances
+        markitdown = MarkItDown(cache=os.path.join(temp_dir, "cache.sqlite"))
+        assert markitdown.convert(docx_path).text_content == expected
+        assert markitdown._cache.stats()["hits"] == 1
+
+        # Least recently used results are evicted beyond the size limit
+        small_cache = ConversionCache(
+            os.path.join(temp_dir, "small.sqlite"), max_size=len(expected) + 10
+        )
+        markitdown = MarkItDown(cache=small_cache)
+        markitdown.convert(docx_path)
+        markitdown.convert(os.path.join(TEST_FILES_DIR, "test_mskanji.csv"))
+        assert small_cache.stats()["entries"] == 1
+        assert small_cache.stats()["size"] <= small_cache.max_size
+        markitdown.convert(docx_path)
+        assert small_cache.stats()["hits"] == 0
+
+        # Streamed results (which have no title) do not replace the title of convert
+        blog_path = os.path.join(TEST_FILES_DIR, "test_blog.html")
+        markitdown = MarkItDown(cache=cache)
+        streamed = "".join(markitdown.convert_iter(blog_path))
+        result = markitdown.convert(blog_path)
+        assert result.title.startswith("Does Model and Inference Parameter Matter")
+        assert result.text_content == streamed
+        assert markitdown.convert(blog_path).title == result.title
+        assert "".join(markitdown.convert_iter(blog_path)) == streamed
+
+        cache.close()
+        small_cache.close()
+        markitdown._cache.close()
+
+
+class _TestFilesHandler(http.server.BaseHTTPRequestHandler):
+    """Serves the test files, with ETags, and records the status of each response."""
+
+    statuses = []
+
+    def do_GET(self):
+        path = os.path.join(TEST_FILES_DIR, os.path.basename(self.path))
+        if not os.path.isfile(path):
+            self._respond(404, {})
+            return
+
+        with open(path, "rb") as fh:
+            content = fh.read()
+        etag = '"%s"' % hashlib.sha256(content).hexdigest()
+        if self.headers.get("If-None-Match") == etag:
+            self._respond(304, {"ETag": etag})
+            return
+
+        content_type = mimetypes.guess_type(path)[0] or "application/octet-stream"
+        self._respond(200, {"ETag": etag, "Content-Type": content_type}, content)
+
+    def _respond(self, status, headers, content=b""):
+        self.statuses.append(status)
+        self.send_response(status)
+        for name, value in headers.items():
+            self.send_header(name, value)
+        self.send_header("Content-Length", str(len(content)))
+        self.end_headers()
+        self.wfile.write(content)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def test_markitdown_convert_urls() -> None:
+    server = http.server.ThreadingHTTPServer(("127.0.0.1", 0), _TestFilesHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    base_url = "http://127.0.0.1:%d/" % server.server_address[1]
+    names = ["test.docx", "test_blog.html", "missing.pdf", "test.pptx", "test.xlsx"]
+    urls = [base_url + name for name in names]
+    try:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            expected = {
+                name: MarkItDown().convert(os.path.join(TEST_FILES_DIR, name))
+                for name in names
+                if name != "missing.pdf"
+            }
+
+            def _check(results):
+                assert [url for url, _ in results] == urls
+                for name, (_, result) in zip(names, results):
+                    if name == "missing.pdf":
+                        assert isinstance(result, requests.HTTPError)
+                    else:
+                        assert result.text_content == expected[name].text_content
+
+            http_cache = HttpCache(os.path.join(temp_dir, "http.sqlite"))
+            markitdown = MarkItDown(http_cache=http_cache)
+
+            # The first run downloads everything
+            _check(list(markitdown.convert_urls(urls, concurrency=3)))
+            assert sorted(_TestFilesHandler.statuses) == [200] * 4 + [404]
+            assert http_cache.stats()["entries"] == 4
+
+            # The connection pool (and its keep-alive connections) is reused by later runs,
+            # unless they need a larger one
+            adapter = markitdown._get_pooled_session(3).get_adapter(base_url)
+            assert markitdown._get_pooled_session(2).get_adapter(base_url) is adapter
+            assert len(adapter.poolmanager.pools) == 1
+
+            # Then unchanged pages are only revalidated
+            _TestFilesHandler.statuses.clear()
+            _check(list(markitdown.convert_urls(urls, concurrency=3, workers=2)))
+            assert sorted(_TestFilesHandler.statuses) == [304] * 4 + [404]
+            assert http_cache.stats()["hits"] == 4
+
+            _TestFilesHandler.statuses.clear()
+            _check(asyncio.run(markitdown.aconvert_urls(urls, concurrency=2)))
+            assert sorted(_TestFilesHandler.statuses) == [304] * 4 + [404]
+            _check(list(markitdown.convert_urls(urls, concurrency=5)))
+
+            # A None in the middle of the URLs is reported, and the URLs after it are converted
+            results = list(markitdown.convert_urls([urls[0], None, urls[1]]))
+            assert [url for url, _ in results] == [urls[0], None, urls[1]]
+            assert isinstance(results[1][1], TypeError)
+            assert results[2][1].text_content == expected[names[1]].text_content
+            results = asyncio.run(markitdown.aconvert_urls([None, urls[0]]))
+            assert isinstance(results[0][1], TypeError)
+            assert results[1][1].text_content == expected[names[0]].text_content
+            assert (
+                markitdown._get_pooled_session(5).get_adapter(base_url) is not adapter
+            )
+            assert len(adapter.poolmanager.pools) == 0  # Closed
+
+            result = markitdown.convert(urls[0])
+            assert result.text_content == expected["test.docx"].text_content
+            http_cache.close()
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def test_markitdown_cli_batch() -> None:
+    with tempfile.TemporaryDirectory() as temp_dir:
+        output_dir = os.path.join(temp_dir, "out")
+        completed = subprocess.run(
+            [
+                sys.executable,
+                "-m",
+                "markitdown",
+                "-j",
+                "2",
+                "--output-dir",
+                output_dir,
+                os.path.join(TEST_FILES_DIR, "test.docx"),
+                os.path.join(TEST_FILES_DIR, "*.pptx"),
+                os.path.join(TEST_FILES_DIR, "test.xlsx"),
+                os.path.join(TEST_FILES_DIR, "missing.pdf"),
+            ],
+            capture_output=True,
+            text=True,
+        )
+
+        # Failures are reported in the summary, and in the exit code
+        assert completed.returncode == 1
+        assert "Converted 3 of 4 files" in completed.stderr
+        assert "missing.pdf" in completed.stderr
+
+        # Outputs mirror the input names, keeping the extension on collisions
+        assert sorted(os.listdir(output_dir)) == [
+            "test.md",
+            "test.pptx.md",
+            "test.xlsx.md",
+        ]
+        with open(os.path.join(output_dir, "test.md"), "rt", encoding="utf-8") as fh:
+            assert "# Abstract" in fh.read()
+        with open(
+            os.path.join(output_dir, "test.pptx.md"), "rt", encoding="utf-8"
+        ) as fh:
+            assert PPTX_TEST_STRINGS[0] in fh.read()
+
+        # Inputs of the same name (from different directories) each get their own output
+        output_dir = os.path.join(temp_dir, "same_names")
+        paths = []
+        for i in range(3):
+            os.makedirs(os.path.join(temp_dir, f"dir{i}"))
+            paths.append(os.path.join(temp_dir, f"dir{i}", "x.txt"))
+            with open(paths[-1], "wt", encoding="utf-8") as fh:
+                fh.write(f"Content {i}\n")
+        completed = subprocess.run(
+            [sys.executable, "-m", "markitdown", "--output-dir", output_dir] + paths,
+            capture_output=True,
+            text=True,
+        )
+        assert completed.returncode == 0
+        assert "Converted 3 of 3 files" in completed.stderr
+        contents = []
+        for name in sorted(os.listdir(output_dir)):
+            with open(os.path.join(output_dir, name), "rt", encoding="utf-8") as fh:
+                contents.append(fh.read().strip())
+        assert sorted(os.listdir(output_dir)) == ["x.md", "x.txt-1.md", "x.txt.md"]
+        assert sorted(contents) == ["Content 0", "Content 1", "Content 2"]
+
+        # A file named "serve" is converted like any other (the server is started with --serve)
+        shutil.copy(
+            os.path.join(TEST_FILES_DIR, "test.docx"), os.path.join(temp_dir, "serve")
+        )
+        completed = subprocess.run(
+            [sys.executable, "-m", "markitdown", "serve"],
+            capture_output=True,
+            text=True,
+            cwd=temp_dir,
+        )
+        assert completed.returncode == 0
+        for test_string in DOCX_TEST_STRINGS:
+            assert test_string in completed.stdout.replace("\\", "")
+        completed = subprocess.run(
+            [sys.executable, "-m", "markitdown", "--serve", "serve"],
+            capture_output=True,
+            text=True,
+            cwd=temp_dir,
+        )
+        assert completed.returncode == 2
+
+
+def test_markitdown_serve() -> None:
+    conversion_server = ConversionServer(workers=1, max_queue=1)
+    server = make_server(conversion_server, port=0)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    base_url = "http://127.0.0.1:%d" % server.server_address[1]
+    try:
+        response = requests.get(base_url + "/health")
+        assert response.json()["workers"] == 1
+
+        # Convert a local path
+        response = requests.post(
+            base_url + "/convert",
+            json={"path": os.path.join(TEST_FILES_DIR, "test.docx")},
+        )
+        assert response.status_code == 200
+        for test_string in DOCX_TEST_STRINGS:
+            assert test_string in response.text.replace("\\", "")
+
+        # Convert uploaded bytes, streamed back one slide at a time
+        with open(os.path.join(TEST_FILES_DIR, "test.pptx"), "rb") as fh:
+            response = requests.post(
+                base_url + "/convert",
+                params={"file_extension": ".pptx"},
+                data=fh.read(),
+                stream=True,
+            )
+        assert response.status_code == 200
+        chunks = [c.decode("utf-8") for c in response.iter_content(chunk_size=None)]
+        text_content = "".join(chunks)
+        for test_string in PPTX_TEST_STRINGS:
+            assert test_string in text_content.replace("\\", "")
+        assert (
+            text_content
+            == MarkItDown()
+            .convert(os.path.join(TEST_FILES_DIR, "test.pptx"))
+            .text_content
+        )
+
+        # Failures
+        response = requests.post(
+            base_url + "/convert",
+            json={"path": os.path.join(TEST_FILES_DIR, "missing.pdf")},
+        )
+        assert response.status_code == 422
+        response = requests.post(base_url + "/convert", json=["not", "an", "object"])
+        assert response.status_code == 400
+
+        # Bodies are bounded, and their length must be valid
+        conversion_server.max_body_size = 1024
+        try:
+            response = requests.post(
+                base_url + "/convert",
+                params={"file_extension": ".txt"},
+                data=b"x" * 1025,
+            )
+            assert response.status_code == 413
+            response = requests.post(
+                base_url + "/convert",
+                params={"file_extension": ".txt"},
+                data=b"x" * 1024,
+            )
+            assert response.status_code == 200
+        finally:
+            conversion_server.max_body_size = _server.DEFAULT_MAX_BODY_SIZE
+        connection = http.client.HTTPConnection("127.0.0.1", server.server_address[1])
+        try:
+            connection.putrequest("POST", "/convert")
+            connection.putheader("Content-Length", "one")
+            connection.endheaders()
+            assert connection.getresponse().status == 400
+        finally:
+            connection.close()
+
+        # A full queue is rejected (once the slots of the requests above are released, which
+        # happens just after their response is sent)
+        for _ in range(50):
+            if conversion_server.status()["active"] == 0:
+                break
+            time.sleep(0.1)
+        assert conversion_server.try_acquire()
+        assert conversion_server.try_acquire()
+        try:
+            response = requests.post(
+                base_url + "/convert",
+                json={"path": os.path.join(TEST_FILES_DIR, "test.docx")},
+            )
+            assert response.status_code == 503
+        finally:
+            conversion_server.release()
+            conversion_server.release()
+
+        # A worker that dies during a conversion ends it, rather than leaving it waiting
+        future = conversion_server._executor.submit(os._exit, 1)
+        kind, _ = conversion_server.next_message(
+            future, conversion_server._manager.Queue()
+        )
+        assert kind == "died"
+        assert conversion_server.pool_restarts == 1
+
+        # A worker that dies while idle breaks the pool, which is reported, then recreated
+        response = requests.post(
+            base_url + "/convert",
+            json={"path": os.path.join(TEST_FILES_DIR, "test.docx")},
+        )
+        assert response.status_code == 200
+        for process in list(conversion_server._executor._processes.values()):
+            process.kill()
+            process.join()
+        for _ in range(50):
+            if requests.get(base_url + "/health").json()["pool"] == "broken":
+                break
+            time.sleep(0.1)
+        assert requests.get(base_url + "/health").json()["status"] == "degraded"
+        response = requests.post(
+            base_url + "/convert",
+            json={"path": os.path.join(TEST_FILES_DIR, "test.docx")},
+        )
+        assert response.status_code == 200
+        status = requests.get(base_url + "/health").json()
+        assert status["pool"] == "ok"
+        assert status["pool_restarts"] == 2
+        assert status["active"] == 0
+
+        # A stale Unix socket is replaced, but any other file is left alone
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            socket_path = os.path.join(tmp_dir, "markitdown.sock")
+            with open(socket_path, "wt") as fh:
+                fh.write("Not a socket")
+            with pytest.raises(ValueError):
+                make_server(conversion_server, socket_path=socket_path)
+            with open(socket_path, "rt") as fh:
+                assert fh.read() == "Not a socket"
+
+            os.remove(socket_path)
+            with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as stale:
+                stale.bind(socket_path)
+            make_server(conversion_server, socket_path=socket_path).server_close()
+    finally:
+        server.shutdown()
+        server.server_close()
+        conversion_server.close()
+
+
+@pytest.mark.skipif(
+    not os.path.isfile(PDF_TEST_FILE),
+    reason="the sample PDFs are not available",
+)
+def test_markitdown_pdf_parallel() -> None:
+    markitdown = MarkItDown()
+    serial = markitdown.convert(PDF_TEST_FILE)
+
+    # Splitting the pages across processes must not change the output
+    result = markitdown.convert(PDF_TEST_FILE, max_workers=2)
+    assert result.text_content == serial.text_content
+
+    markitdown_parallel = MarkItDown(max_workers=3)
+    result = markitdown_parallel.convert(PDF_TEST_FILE)
+    assert result.text_content == serial.text_content
+
+
+@pytest.mark.skipif(
+    not os.path.isfile(PDF_TEST_FILE),
+    reason="the sample PDFs are not available",
+)
+def test_markitdown_pdf_engines() -> None:
+    markitdown = MarkItDown()
+    default = markitdown.convert(PDF_TEST_FILE).text_content
+    assert markitdown.convert(PDF_TEST_FILE, pdf_engine="quality").text_content == (
+        default
+    )
+    assert MarkItDown(pdf_engine="pdfminer").convert(PDF_TEST_FILE).text_content == (
+        default
+    )
+
+    # Every installed engine extracts the text, in order, one page at a time
+    for name, engine in PdfConverter.engines.items():
+        if not engine.is_available():
+            continue
+        pages = list(engine.iter_pages(PDF_TEST_FILE))
+        assert len(pages) == engine.count_pages(PDF_TEST_FILE)
+        result = markitdown.convert(PDF_TEST_FILE, pdf_engine=name)
+        text_content = result.text_content.replace(" ", "")
+        assert "计算机网络的性能" in text_content
+        assert text_content.index("速率") < text_content.index("带宽")
+
+    # The fast profile always finds an engine (pdfminer, at worst)
+    assert markitdown.convert(PDF_TEST_FILE, pdf_engine="fast").text_content
+
+    with pytest.raises(FileConversionException):
+        markitdown.convert(PDF_TEST_FILE, pdf_engine="no_such_engine")
+
+
+def test_markitdown_xlsx_streaming() -> None:
+    markitdown = MarkItDown()
+    xlsx_path = os.path.join(TEST_FILES_DIR, "test.xlsx")
+
+    # The streaming writer (opt-in) produces the same tables as the HTML round trip
+    result = markitdown.convert(xlsx_path, xlsx_streaming=True)
+    assert result.text_content == markitdown.convert(xlsx_path).text_content
+
+    # Sheet selection, and row and column windows
+    sheet = "09060124-b5e7-4717-9d07-3c046eb"
+    for xlsx_streaming in [True, False]:
+        result = markitdown.convert(
+            xlsx_path,
+            xlsx_sheets=[sheet],
+            xlsx_rows=(1, 3),
+            xlsx_columns=(1, 3),
+            xlsx_streaming=xlsx_streaming,
+        )
+        assert result.text_content.splitlines() == [
+            f"## {sheet}",
+            "| ColB | ColC |",
+            "| --- | --- |",
+            "| 6 | 7 |",
+            "| 10 | 11 |",
+        ]
+    result = markitdown.convert(xlsx_path, xlsx_sheets=[1, "Sheet1"])
+    assert result.text_content.index(sheet) < result.text_content.index("Sheet1")
+
+    with pytest.raises(ValueError):
+        XlsxConverter().convert(
+            xlsx_path, file_extension=".xlsx", xlsx_sheets=["No such sheet"]
+        )
+
+    # Tables ending on a chunk boundary (or not) are the same as without streaming
+    import openpyxl
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        for row_count in [_markitdown._XLSX_CHUNK_ROWS - 3, 1200]:
+            workbook = openpyxl.Workbook()
+            for r in range(row_count + 1):
+                workbook.active.append([f"Row {r}", f"Value {r}"])
+            workbook_path = os.path.join(tmp_dir, f"rows_{row_count}.xlsx")
+            workbook.save(workbook_path)
+            results = [
+                XlsxConverter().convert(
+                    workbook_path, file_extension=".xlsx", xlsx_streaming=streaming
+                )
+                for streaming in [True, False]
+            ]
+            assert results[0].text_content == results[1].text_content
+
+    # Streamed cells are formatted by their own type, and pandas' formatting is the default
+    workbook = openpyxl.Workbook()
+    workbook.active.title = "Data"
+    workbook.active.append(["Name", None, "Value"])
+    workbook.active.append(["a", 2.0, 3.5])
+    workbook.active.append(["b", None, True])
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        workbook_path = os.path.join(tmp_dir, "formats.xlsx")
+        workbook.save(workbook_path)
+        result = markitdown.convert(workbook_path, xlsx_streaming=True)
+        assert result.text_content.splitlines() == [
+            "## Data",
+            "| Name |  | Value |",
+            "| --- | --- | --- |",
+            "| a | 2 | 3\\.5 |",
+            "| b |  | True |",
+        ]
+        result = markitdown.convert(workbook_path)
+        assert result.text_content.splitlines()[1:5] == [
+            "| Name | Unnamed: 1 | Value |",
+            "| --- | --- | --- |",
+            "| a | 2\\.0 | 3\\.5 |",
+            "| b | NaN | 1\\.0 |",
+        ]
+
+
+def test_markitdown_pptx_parallel() -> None:
+    markitdown = MarkItDown()
+    pptx_path = os.path.join(TEST_FILES_DIR, "test.pptx")
+    serial = markitdown.convert(pptx_path)
+    for test_string in PPTX_TEST_STRINGS:
+        assert test_string in serial.text_content.replace("\\", "")
+
+    # Small decks are not split across processes
+    result = markitdown.convert(pptx_path, max_workers=2)
+    assert result.text_content == serial.text_content
+
+    # Splitting the slides across processes must not change the output
+    min_slides, cpu_count = (
+        _markitdown._PPTX_PARALLEL_MIN_SLIDES,
+        _markitdown._cpu_count,
+    )
+    _markitdown._PPTX_PARALLEL_MIN_SLIDES = 2
+    _markitdown._cpu_count = lambda: 8
+    try:
+        for max_workers in [2, 8]:
+            result = markitdown.convert(pptx_path, max_workers=max_workers)
+            assert result.text_content == serial.text_content
+    finally:
+        _markitdown._PPTX_PARALLEL_MIN_SLIDES = min_slides
+        _markitdown._cpu_count = cpu_count
+
+
+def test_markitdown_zip() -> None:
+    markitdown = MarkItDown()
+    zip_path = os.path.join(TEST_FILES_DIR, "test_files.zip")
+    serial = markitdown.convert(zip_path)
+
+    # Members are converted in archive order, and nothing is extracted next to the zip file
+    with zipfile.ZipFile(zip_path) as zip_file:
+        names = zip_file.namelist()
+    headings = [
+        line[len("## File: ") :]
+        for line in serial.text_content.splitlines()
+        if line.startswith("## File: ")
+    ]
+    assert headings == names
+    assert not os.path.exists(os.path.join(TEST_FILES_DIR, "extracted_test_files_zip"))
+
+    # Converting the members across processes must not change the output
+    result = markitdown.convert(zip_path, max_workers=2)
+    assert result.text_content == serial.text_content
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        # Nested archives are converted in memory, under the path of the archive
+        inner = io.BytesIO()
+        with zipfile.ZipFile(inner, "w") as zip_file:
+            zip_file.writestr("notes.txt", "Inner notes")
+        outer_path = os.path.join(tmp_dir, "outer.zip")
+        with zipfile.ZipFile(outer_path, "w") as zip_file:
+            zip_file.writestr("readme.txt", "Outer readme")
+            zip_file.writestr("docs/inner.zip", inner.getvalue())
+            zip_file.writestr("empty/", "")
+        result = markitdown.convert(outer_path)
+        assert "## File: readme.txt\n\nOuter readme" in result.text_content
+        assert "## File: docs/inner.zip/notes.txt\n\nInner notes" in result.text_content
+
+        # Beyond the limits (nested members included), the conversion fails
+        result = markitdown.convert(outer_path, zip_max_members=2)
+        assert result.text_content.startswith("[ERROR]")
+        assert "zip_max_members" in result.text_content
+        result = markitdown.convert(outer_path, zip_max_size=20)
+        assert result.text_content.startswith("[ERROR]")
+        assert "zip_max_size" in result.text_content
+
+        # Sizes are counted as members are decompressed, not trusted from the headers
+        bomb_path = os.path.join(tmp_dir, "bomb.zip")
+        with zipfile.ZipFile(bomb_path, "w", zipfile.ZIP_DEFLATED) as zip_file:
+            zip_file.writestr("zeros.txt", b"0" * 1024 * 1024)
+        result = markitdown.convert(bomb_path, zip_max_size=1024)
+        assert "zip_max_size" in result.text_content
+
+
+def _write_docx(path: str, body: str, media: dict = None) -> None:
+    """Write a minimal .docx, with a bullet list (numId 1) and a numbered list (numId 2).
+    Each media file (e.g., {"image1.png": ...}) is linked by a relationship of the same id.
+    """
+    media = media or {}
+    w = 'xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main"'
+    r = 'xmlns:r="http://schemas.openxmlformats.org/officeDocument/2006/relationships"'
+    rels = "http://schemas.openxmlformats.org/officeDocument/2006/relationships"
+    with zipfile.ZipFile(path, "w") as docx:
+        docx.writestr(
+            "[Content_Types].xml",
+            '<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">'
+            '<Default Extension="xml" ContentType="application/xml"/>'
+            '<Default Extension="png" ContentType="image/png"/>'
+            '<Override PartName="/word/document.xml" ContentType="application/'
+            'vnd.openxmlformats-officedocument.wordprocessingml.document.main+xml"/>'
+            "</Types>",
+        )
+        docx.writestr(
+            "_rels/.rels",
+            '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+            f'<Relationship Id="rId1" Type="{rels}/officeDocument" Target="word/document.xml"/>'
+            "</Relationships>",
+        )
+        docx.writestr(
+            "word/_rels/document.xml.rels",
+            '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+            f'<Relationship Id="rId1" Type="{rels}/styles" Target="styles.xml"/>'
+            f'<Relationship Id="rId2" Type="{rels}/numbering" Target="numbering.xml"/>'
+            f'<Relationship Id="rId3" Type="{rels}/hyperlink" Target="https://example.com/a_b" '
+            'TargetMode="External"/>'
+            + "".join(
+                f'<Relationship Id="{name}" Type="{rels}/image" Target="media/{name}"/>'
+                for name in media
+            )
+            + "</Relationships>",
+        )
+        for name, data in media.items():
+            docx.writestr(f"word/media/{name}", data)
+        docx.writestr(
+            "word/styles.xml",
+            f"<w:styles {w}>"
+            '<w:style w:type="paragraph" w:styleId="Heading2"><w:name w:val="heading 2"/></w:style>'
+            '<w:style w:type="paragraph" w:styleId="Title1"><w:name w:val="Heading"/></w:style>'
+            "</w:styles>",
+        )
+        docx.writestr(
+            "word/numbering.xml",
+            f"<w:numbering {w}>"
+            '<w:abstractNum w:abstractNumId="0">'
+            '<w:lvl w:ilvl="0"><w:numFmt w:val="bullet"/></w:lvl>'
+            '<w:lvl w:ilvl="1"><w:numFmt w:val="decimal"/></w:lvl>'
+            "</w:abstractNum>"
+            '<w:abstractNum w:abstractNumId="1"><w:lvl w:ilvl="0"><w:numFmt w:val="decimal"/>'
+            "</w:lvl></w:abstractNum>"
+            '<w:num w:numId="1"><w:abstractNumId w:val="0"/></w:num>'
+            '<w:num w:numId="2"><w:abstractNumId w:val="1"/></w:num>'
+            "</w:numbering>",
+        )
+        docx.writestr(
+            "word/document.xml",
+            f"<w:document {w} {r}><w:body>{body}<w:sectPr/></w:body></w:document>",
+        )
+
+
+def test_markitdown_docx_streaming() -> None:
+    markitdown = MarkItDown()
+
+    # The streaming path gives the same Markdown as mammoth, with and without comments
+    for name in ["test.docx", "test_with_comment.docx"]:
+        docx_path = os.path.join(TEST_FILES_DIR, name)
+        for style_map in [None, "comment-reference => "]:
+            result = markitdown.convert(docx_path, style_map=style_map)
+            expected = markitdown.convert(
+                docx_path, style_map=style_map, docx_streaming=False
+            )
+            assert result.text_content == expected.text_content
+
+    def _p(content, properties=""):
+        return f"<w:p><w:pPr>{properties}</w:pPr>{content}</w:p>"
+
+    def _r(text, properties=""):
+        return f'<w:r><w:rPr>{properties}</w:rPr><w:t xml:space="preserve">{text}</w:t></w:r>'
+
+    def _li(text, num_id, level):
+        numbering = (
+            f'<w:numPr><w:ilvl w:val="{level}"/><w:numId w:val="{num_id}"/></w:numPr>'
+        )
+        return _p(_r(text), numbering)
+
+    def _tc(text, properties=""):
+        return f"<w:tc><w:tcPr>{properties}</w:tcPr>{_p(_r(text))}</w:tc>"
+
+    body = (
+        _p(_r("Title"), '<w:pStyle w:val="Title1"/>')
+        + _p(_r("Sub_title 1."), '<w:pStyle w:val="Heading2"/>')
+        + _p(
+            _r("plain ")
+            + _r("bold ", "<w:b/>")
+            + _r("bold italic", "<w:b/><w:i/>")
+            + _r(" not bold", '<w:b w:val="0"/>')
+            + '<w:hyperlink r:id="rId3">'
+            + _r(" a link")
+            + _r("!", "<w:strike/>")
+            + "</w:hyperlink>"
+            + "<w:r><w:tab/><w:t>x</w:t><w:br/><w:t>y</w:t></w:r>"
+        )
+        + _p("")
+        + _li("one", 1, 0)
+        + _li("one.one", 1, 1)
+        + _li("two &amp; *2*", 1, 0)
+        + _li("first", 2, 0)
+        + _li("second", 2, 0)
+        + _p(_r("between"))
+        + _li("again", 2, 0)
+        + "<w:tbl><w:tblPr/>"
+        + "<w:tr>"
+        + _tc("a")
+        + _tc("b|c", '<w:gridSpan w:val="2"/>')
+        + "</w:tr>"
+        + "<w:tr>"
+        + _tc("1", '<w:vMerge w:val="restart"/>')
+        + _tc("2")
+        + _tc("")
+        + "</w:tr>"
+        + "<w:tr>"
+        + _tc("", "<w:vMerge/>")
+        + _tc("3")
+        + _tc("4")
+        + "</w:tr>"
+        + "</w:tbl>"
+    )
+    # A footnote reference falls back to mammoth
+    footnote = _p(_r("note") + '<w:r><w:footnoteReference w:id="1"/></w:r>')
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        docx_path = os.path.join(tmpdir, "generated.docx")
+        for document_body in [body, body + footnote]:
+            _write_docx(docx_path, document_body)
+            result = markitdown.convert(docx_path)
+            expected = markitdown.convert(docx_path, docx_streaming=False)
+            assert result.text_content == expected.text_content
+
+        _write_docx(docx_path, body)
+        text_content = markitdown.convert(docx_path).text_content
+        assert "# Title" in text_content
+        assert "## Sub\\_title 1\\." in text_content
+        assert "plain **bold *bold italic*** not bold [a link~~!~~]" in text_content
+        assert "* one\n\t1. one.one\n* two \\& \\*2\\*\n1. first" in text_content
+        assert "between\n\n1. again" in text_content
+        assert "| 1 | 2 |  |\n| 3 | 4 |" in text_content
+
+
+def test_markitdown_image_policy() -> None:
+    markitdown = MarkItDown()
+    png = b"\x89PNG\r\n\x1a\n" + b"\x00" * 100
+    name = hashlib.sha256(png).hexdigest() + ".png"
+    drawing = (
+        "<w:r><w:drawing>"
+        '<wp:inline xmlns:wp="http://schemas.openxmlformats.org/drawingml/2006/wordprocessingDrawing">'
+        '<wp:docPr id="1" name="Picture 1" descr="A chart"/>'
+        '<a:graphic xmlns:a="http://schemas.openxmlformats.org/drawingml/2006/main"><a:graphicData>'
+        '<pic:pic xmlns:pic="http://schemas.openxmlformats.org/drawingml/2006/picture">'
+        '<pic:blipFill><a:blip r:embed="image1.png"/></pic:blipFill></pic:pic>'
+        "</a:graphicData></a:graphic></wp:inline></w:drawing></w:r>"
+    )
+    body = (
+        f"<w:p><w:r><w:t>Before </w:t></w:r>{drawing}<w:r><w:t> after</w:t></w:r></w:p>"
+    )
+    html = (
+        f'<html><body><p><img alt="A chart" src="data:image/png;base64,{base64.b64encode(png).decode()}">'
+        '<img alt="Remote" src="https://example.com/remote.png"></p></body></html>'
+    )
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        docx_path = os.path.join(tmpdir, "images.docx")
+        _write_docx(docx_path, body, {"image1.png": png})
+        html_path = os.path.join(tmpdir, "images.html")
+        with open(html_path, "wt") as fh:
+            fh.write(html)
+        image_dir = os.path.join(tmpdir, "assets")
+
+        expected = {
+            "truncate": "![A chart](data:image/png;base64...)",
+            "drop": "",
+            "placeholder": f"![A chart]({name})",
+            "assets": f"![A chart]({image_dir}/{name})",
+        }
+        for policy, image in expected.items():
+            # The streaming path and mammoth agree, and neither inlines the image
+            result = markitdown.convert(
+                docx_path, image_policy=policy, image_dir=image_dir
+            )
+            text_content = result.text_content.replace("\\", "")
+            assert f"Before {image} after".replace("  ", " ") in text_content
+            assert (
+                markitdown.convert(
+                    docx_path,
+                    image_policy=policy,
+                    image_dir=image_dir,
+                    docx_streaming=False,
+                ).text_content
+                == result.text_content
+            )
+
+            # Data URIs in HTML follow the same policy, and other images are kept
+            result = markitdown.convert(
+                html_path, image_policy=policy, image_dir=image_dir
+            )
+            text_content = result.text_content.replace("\\", "")
+            assert image in text_content
+            assert ("example.com/remote.png" in text_content) == (policy != "drop")
+            assert "iVBOR" not in text_content
+
+        # Images are written once, named after their content
+        assert os.listdir(image_dir) == [name]
+        with open(os.path.join(image_dir, name), "rb") as fh:
+            assert fh.read() == png
+
+        # The policy can be set on the instance
+        markitdown = MarkItDown(image_policy="placeholder")
+        assert name in markitdown.convert(docx_path).text_content
+
+        with pytest.raises(ValueError):
+            DocxConverter().convert(
+                docx_path, file_extension=".docx", image_policy="assets"
+            )
+
+
+def test_markitdown_html_parsers() -> None:
+    markitdown = MarkItDown()
+    pages = [
+        ("test_blog.html", None),
+        ("test_wikipedia.html", WIKIPEDIA_TEST_URL),
+        ("test_serp.html", SERP_TEST_URL),
+    ]
+
+    # The fast profile (lxml, when installed) gives the same Markdown on the test pages
+    for name, url in pages:
+        path = os.path.join(TEST_FILES_DIR, name)
+        kwargs = {} if url is None else {"url": url}
+        expected = markitdown.convert(path, **kwargs)
+        result = markitdown.convert(path, html_parser="fast", **kwargs)
+        assert result.text_content == expected.text_content
+        assert result.title == expected.title
+
+    # Only the title and body are parsed, even if the head mentions <body>
+    html = (
+        "<html><head><!-- <body>comment</body> --><title>Title</title>"
+        "<script>document.write('<body>script</body>');</script></head>"
+        "<body><p>Content</p></body></html>"
+    )
+    result = HtmlConverter()._convert(html)
+    assert result.title == "Title"
+    assert result.text_content.strip() == "Content"
+
+    # Converters tried on the same page share the parsed document
+    path = os.path.join(TEST_FILES_DIR, "test_wikipedia.html")
+    documents = _markitdown._HtmlDocuments()
+    kwargs = {"file_extension": ".html", "_html_documents": documents}
+    with open(path, "rt", encoding="utf-8") as fh:
+        html_content = fh.read()
+    WikipediaConverter().convert(path, url=WIKIPEDIA_TEST_URL, **kwargs)
+    soup = documents.get(html_content, "html.parser", True)
+    assert soup is not None
+    result = HtmlConverter().convert(path, **kwargs)
+    assert documents.get(html_content, "html.parser", True) is soup
+    assert (
+        result.text_content
+        == HtmlConverter().convert(path, file_extension=".html").text_content
+    )
+
+    with pytest.raises(ValueError):
+        HtmlConverter().convert(path, file_extension=".html", html_parser="unknown")
+
+    # The options also reach the HTML that DocxConverter gets from mammoth
+    with pytest.raises(ValueError):
+        DocxConverter().convert(
+            os.path.join(TEST_FILES_DIR, "test.docx"),
+            file_extension=".docx",
+            docx_streaming=False,
+            html_parser="unknown",
+        )
+
+
+def test_markitdown_rss() -> None:
+    converter = RSSConverter()
+    items = "".join(
+        f"<item><title>Item {i}</title><description>&lt;p&gt;Text &lt;b&gt;{i}&lt;/b&gt;&lt;/p&gt;</description>"
+        f"<content:encoded><![CDATA[<p>Body_{i}</p>]]></content:encoded></item>"
+        for i in range(1000)
+    )
+    rss = (
+        '<rss version="2.0" xmlns:content="http://purl.org/rss/1.0/modules/content/">'
+        "<channel><title>Feed</title><description>News</description>"
+        f"{items}</channel></rss>"
+    ).encode("utf-8")
+
+    # Items are converted one at a time, and freed once converted (only the items parsed
+    # ahead, from the last chunk read, are kept)
+    reader = converter._read_feed(io.BytesIO(rss), file_extension=".xml")
+    assert reader.title == "Feed"
+    assert reader.header() == "# Feed\nNews\n"
+    sections = iter(reader)
+    assert next(sections) == "\n## Item 0\nText **0**\n\nBody\\_0\n\n"
+    kept = max(len(reader._channel) for _ in sections)
+    assert kept < 250
+    assert len(reader._channel) == 2  # The title and description
+    reader.close()
+
+    result = converter.convert(io.BytesIO(rss), file_extension=".rss")
+    assert result.title == "Feed"
+    assert "## Item 999\nText **999**" in result.text_content
+    sections = list(converter.convert_iter(io.BytesIO(rss), file_extension=".rss"))
+    assert len(sections) == 1001
+    assert "".join(sections) == result.text_content
+
+    # Atom feeds, which must have at least one entry
+    atom = (
+        '<feed xmlns="http://www.w3.org/2005/Atom"><title>Atom</title><subtitle>Sub</subtitle>'
+        "<entry><title>Entry</title><updated>2024-12-09</updated><summary>Summary 1.</summary>"
+        '<content type="html">&lt;em&gt;Content&lt;/em&gt;</content></entry></feed>'
+    )
+    result = converter.convert(io.BytesIO(atom.encode("utf-8")), file_extension=".atom")
+    assert result.title == "Atom"
+    assert result.text_content == (
+        "# Atom\nSub\n\n## Entry\nUpdated on: 2024-12-09\nSummary 1\\.*Content*"
+    )
+    empty = atom[: atom.index("<entry>")] + "</feed>"
+    assert converter.convert(io.BytesIO(empty.encode()), file_extension=".xml") is None
+
+    # Other XML, and malformed feeds, are left to other converters
+    other = b"<root><rss><channel><title>Not a feed</title></channel></rss></root>"
+    assert converter.convert(io.BytesIO(other), file_extension=".xml") is None
+    malformed = rss[: len(rss) // 2]
+    assert converter.convert(io.BytesIO(malformed), file_extension=".xml") is None
+
+    # A channel title and description after the items are read too (but can only be streamed
+    # before the items when they come first)
+    late = (
+        "<rss><channel><item><title>Item</title></item>"
+        "<title>Late</title><description>After the items</description></channel></rss>"
+    ).encode("utf-8")
+    result = converter.convert(io.BytesIO(late), file_extension=".rss")
+    assert result.title == "Late"
+    assert result.text_content == "# Late\nAfter the items\n\n## Item\n"
+    sections = list(converter.convert_iter(io.BytesIO(late), file_extension=".rss"))
+    assert sections == ["", "\n## Item\n"]
+
+
+def test_markitdown_ipynb() -> None:
+    converter = IpynbConverter()
+    image = base64.b64encode(os.urandom(3 * 1024**2)).decode("ascii")
+    notebook = {
+        "cells": [
+            {
+                "cell_type": "markdown",
+                "metadata": {},
+                "source": ["# Plots\n", "Text \u00e9"],
+            },
+            {
+                "cell_type": "code",
+                "execution_count": 1,
+                "metadata": {"widgets": {"state": list(range(1000))}},
+                "outputs": [
+                    {"output_type": "stream", "name": "stdout", "text": ["a\n", "b\n"]},
+                    {
+                        "output_type": "display_data",
+                        "data": {"image/png": image, "text/plain": ["<Figure>"]},
+                        "metadata": {},
+                    },
+                    {
+                        "output_type": "execute_result",
+                        "data": {"text/plain": "x" * 500},
+                    },
+                    {"output_type": "error", "ename": "KeyError", "evalue": "'k'"},
+                ],
+                "source": "plot(-2.5e10)",
+            },
+            {"cell_type": "raw", "metadata": {}, "source": ["raw"]},
+        ],
+        "metadata": {"kernelspec": {"name": "python3"}, "title": "Report"},
+        "nbformat": 4,
+        "nbformat_minor": 5,
+    }
+    content = json.dumps(notebook, indent=1).encode("utf-8")
+
+    # Outputs are skipped (images are scanned past, not parsed), unless asked for
+    result = converter.convert(io.BytesIO(content), file_extension=".ipynb")
+    assert result.title == "Report"
+    assert result.text_content == (
+        "# Plots\nText \u00e9\n\n```python\nplot(-2.5e10)\n```\n\n```\nraw\n```"
+    )
+    result = converter.convert(
+        io.BytesIO(content), file_extension=".ipynb", ipynb_text_outputs=100
+    )
+    assert (
+        "```python\nplot(-2.5e10)\n```\n\nOutput:\n\n```\na\nb\n```"
+        in result.text_content
+    )
+    assert "Output:\n\n```\n<Figure>\n```" in result.text_content
+    assert "```\n" + "x" * 100 + "\n[output truncated]\n```" in result.text_content
+    assert "Output:\n\n```\nKeyError: 'k'\n```" in result.text_content
+    assert image[:100] not in result.text_content
+    sections = list(
+        converter.convert_iter(
+            io.BytesIO(content), file_extension=".ipynb", ipynb_text_outputs=100
+        )
+    )
+    assert len(sections) == 3
+    assert "".join(sections) == result.text_content
+
+    # Values split across chunks, at any boundary
+    notebook["cells"][1]["outputs"][1]["data"]["image/png"] = image[:100]
+    content = json.dumps(notebook, indent=1).encode("utf-8")
+    expected = converter.convert(
+        io.BytesIO(content), file_extension=".ipynb", ipynb_text_outputs=100
+    )
+    for chunk_size in range(1, 12):
+        reader = _markitdown._NotebookReader(io.BytesIO(content), 100)
+        reader._json._chunk_size = chunk_size
+        assert "".join(reader) == expected.text_content
+        assert reader.title == "Report"
+
+    # Syntax errors are raised as they are, like json.loads would
+    with pytest.raises(json.JSONDecodeError):
+        converter.convert(
+            io.BytesIO(content[: len(content) // 2]), file_extension=".ipynb"
+        )
+
+
+def test_markitdown_text_encodings() -> None:
+    markitdown = MarkItDown()
+    text = "Name,City\nJosé,Zürich\n"
+
+    # Byte order marks, and UTF-8, are decoded without charset detection
+    for encoding in ["utf-8", "utf-8-sig", "utf-16", "utf-32"]:
+        result = markitdown.convert(text.encode(encoding), file_extension=".txt")
+        assert result.text_content == text
+
+    # Other encodings are detected around the first byte that is not UTF-8, even far in
+    content = ("ascii line\n" * 100000).encode("ascii") + text.encode("cp1252")
+    result = markitdown.convert(content, file_extension=".txt")
+    assert result.text_content.endswith(text)
+    with open(os.path.join(TEST_FILES_DIR, "test_mskanji.csv"), "rb") as fh:
+        mskanji = fh.read()
+    assert _markitdown._decode_text(mskanji) == mskanji.decode("cp932")
+
+    # Large files are memory-mapped
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        path = os.path.join(tmp_dir, "large.txt")
+        with open(path, "wb") as fh:
+            fh.write(content)
+        with _markitdown._map_binary(path) as mapped:
+            assert isinstance(mapped, bytes)
+        threshold = _markitdown._MMAP_THRESHOLD
+        _markitdown._MMAP_THRESHOLD = 1024
+        try:
+            with _markitdown._map_binary(path) as mapped:
+                assert not isinstance(mapped, bytes)
+            assert markitdown.convert(path).text_content.endswith(text)
+        finally:
+            _markitdown._MMAP_THRESHOLD = threshold
+
+
+def test_markitdown_metrics() -> None:
+    class _FailingConverter(DocumentConverter):
+        def convert(self, local_path, **kwargs):
+            if kwargs.get("file_extension") == ".html":
+                raise ValueError("Failing on purpose")
+            return None
+
+    class _TraceList(ConversionMetrics):
+        def __init__(self):
+            super().__init__()
+            self.traces = []
+
+        def record(self, trace: ConversionTrace) -> None:
+            super().record(trace)
+            self.traces.append(trace)
+
+    metrics = _TraceList()
+    markitdown = MarkItDown(metrics=metrics)
+    markitdown.register_page_converter(_FailingConverter())
+
+    # Every converter attempted is traced, with its outcome, and the winner
+    path = os.path.join(TEST_FILES_DIR, "test_blog.html")
+    result = markitdown.convert(path)
+    trace = metrics.traces[-1]
+    assert trace.source == path
+    assert trace.extensions[0] == ".html"
+    outcomes = [(name, outcome) for name, _, _, outcome in trace.attempts]
+    assert outcomes[0] == ("_FailingConverter", "error")
+    assert ("WikipediaConverter", "declined") in outcomes
+    assert outcomes[-1] == ("HtmlConverter", "accepted")
+    assert trace.converter == "HtmlConverter"
+    assert trace.input_size == os.path.getsize(path)
+    assert trace.output_size == len(result.text_content)
+    assert 0 < trace.normalize_time < trace.total_time
+    assert trace.error is None
+
+    # Sections yielded by convert_iter are traced too, even if not all are read
+    sections = markitdown.convert_iter(os.path.join(TEST_FILES_DIR, "test.pptx"))
+    first = next(sections)
+    sections.close()
+    trace = metrics.traces[-1]
+    assert trace.converter == "PptxConverter"
+    assert trace.output_size == len(first)
+
+    # Failures
+    with pytest.raises(UnsupportedFormatException):
+        markitdown.convert(io.BytesIO(b"\x00\x01"), file_extension=".unknown")
+    assert metrics.traces[-1].source == "<stream>"
+    assert metrics.traces[-1].error == "UnsupportedFormatException"
+    assert metrics.traces[-1].converter is None
+
+    stats = markitdown.stats()
+    assert stats["conversions"] == 3
+    assert stats["failures"] == 1
+    assert stats["output_size"] == len(result.text_content) + len(first)
+    assert stats["converters"]["HtmlConverter"]["accepted"] == 1
+    assert stats["converters"]["_FailingConverter"]["errors"] == 1
+    for converter in stats["converters"].values():
+        assert converter["attempts"] == (
+            converter["accepted"] + converter["declined"] + converter["errors"]
+        )
+    metrics.reset()
+    assert markitdown.stats()["conversions"] == 0
+
+    # The command line prints the aggregated traces with --profile
+    completed = subprocess.run(
+        [sys.executable, "-m", "markitdown", "--profile", path],
+        capture_output=True,
+        text=True,
+    )
+    assert completed.returncode == 0
+    assert "1 conversions (0 failed" in completed.stderr
+    assert "HtmlConverter" in completed.stderr
+
+
+def test_markitdown_markdown_serializer() -> None:
+    from bs4 import BeautifulSoup
+
+    # Same output as the markdownify-based converter, on the test pages and on every tag it converts
+    snippet = (
+        "<body><h1>Title <em>1</em></h1><h7>Deep</h7><p>Text_with *marks* &amp; 1. "
+        '<a href="https://example.com/a b" title="T">link</a> <a href="javascript:x()">js</a> '
+        '<a href="https://example.com/">https://example.com/</a><br>'
+        '<img src="data:image/png;base64,AAAA" alt="img" title="t"></p>'
+        "<ul>\n <li>one <b> bold </b>\n<ul><li>nested <code>c_d</code></li></ul></li>\n"
+        '<li>two</li></ul><ol start="3"><li>three</li><li>four</li></ol>'
+        "<blockquote>quote\nlines</blockquote><pre><code>x = 1  *  2</code></pre>"
+        '<table><thead><tr><th colspan="2">H</th></tr></thead><tbody><tr><td>a <img alt="i">'
+        "</td><td>b<br>c</td></tr></tbody></table><hr><figure><figcaption>Fig</figcaption></figure>"
+        "<del>del</del> <sub>sub</sub> <kbd>kbd</kbd><script>skip()</script><!-- comment --></body>"
+    )
+    documents = [snippet]
+    for name in ["test_blog.html", "test_wikipedia.html", "test_serp.html"]:
+        with open(os.path.join(TEST_FILES_DIR, name), "rt", encoding="utf-8") as fh:
+            documents.append(fh.read())
+    for html in documents:
+        expected = _markitdown._CustomMarkdownify().convert_soup(
+            BeautifulSoup(html, "html.parser")
+        )
+        soup = BeautifulSoup(html, "html.parser")
+        assert _markitdown._MarkdownSerializer().convert_soup(soup) == expected
+
+        # Also when converting a subtree, and the tree is left as it was
+        subtrees = soup.find_all(["li", "td", "table"])[:20]
+        expected_subtrees = BeautifulSoup(html, "html.parser").find_all(
+            ["li", "td", "table"]
+        )
+        for tag, expected_tag in zip(subtrees, expected_subtrees):
+            before = str(tag)
+            assert _markitdown._MarkdownSerializer().convert_soup(
+                tag
+            ) == _markitdown._CustomMarkdownify().convert_soup(expected_tag)
+            assert str(tag) == before
+
+    # Deeply nested HTML does not reach the recursion limit
+    depth = sys.getrecursionlimit() * 2
+    html = "<div>" * depth + "<p>deep <b>text</b></p>" + "</div>" * depth
+    markdown = _markitdown._MarkdownSerializer().convert_soup(
+        BeautifulSoup(html, "html.parser")
+    )
+    assert markdown == "deep **text**\n\n"
+
+
+class _StubRecognizer(AudioRecognizer):
+    """Transcribes a segment as its peak amplitude, and records the peak number of concurrent calls."""
+
+    def __init__(self):
+        self.active = 0
+        self.peak = 0
+        self.lengths = []
+        self.lock = threading.Lock()
+
+    def recognize(self, segment) -> str:
+        with self.lock:
+            self.active += 1
+            self.peak = max(self.peak, self.active)
+            self.lengths.append(len(segment))
+        time.sleep(0.1)
+        with self.lock:
+            self.active -= 1
+        return "" if segment.max == 0 else f"peak{segment.max}"
+
+
+def test_markitdown_audio() -> None:
+    import numpy as np
+
+    # Six 5 s tones of increasing loudness, each followed by 1 s of silence
+    rate = 8000
+    tone = np.sin(2 * np.pi * 440 * np.arange(5 * rate) / rate)
+    samples = np.concatenate(
+        [
+            np.concatenate([tone * 1000 * k, np.zeros(rate)]).astype(np.int16)
+            for k in range(1, 7)
+        ]
+    )
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        wav_path = os.path.join(tmp_dir, "lecture.wav")
+        with wave.open(wav_path, "wb") as wav_file:
+            wav_file.setnchannels(1)
+            wav_file.setsampwidth(2)
+            wav_file.setframerate(rate)
+            wav_file.writeframes(samples.tobytes())
+
+        # Segments are cut in the silences, transcribed concurrently, and joined in order
+        recognizer = _StubRecognizer()
+        result = MarkItDown().convert(
+            wav_path, audio_recognizer=recognizer, audio_segment_length=12
+        )
+        assert result.text_content.endswith(
+            "### Audio Transcript:\npeak2000 peak4000 peak6000"
+        )
+        assert len(recognizer.lengths) == 4
+        assert max(recognizer.lengths) <= 12000
+        assert recognizer.peak > 1
+
+        # Short recordings are transcribed in one call
+        recognizer = _StubRecognizer()
+        with open(wav_path, "rb") as fh:
+            result = MarkItDown().convert_stream(
+                fh,
+                file_extension=".wav",
+                audio_recognizer=recognizer,
+                audio_segment_length=60,
+            )
+        assert result.text_content.endswith("### Audio Transcript:\npeak6000")
+        assert recognizer.lengths == [36000]
+
+
 @pytest.mark.skipif(
     skip_exiftool,
     reason="do not run if exiftool is not installed",
@@ -257,6 +1753,26 @@ def test_markitdown_exiftool() -> None:
         target = f"{key}: {JPG_TEST_EXIFTOOL[key]}"
         assert target in result.text_content
 
+    # The metadata of many files is read in one round trip, in order
+    jpg_path = os.path.join(TEST_FILES_DIR, "test.jpg")
+    exiftool = ExifTool()
+    try:
+        metadata = exiftool.get_metadata(jpg_path)
+        assert metadata["Author"] == JPG_TEST_EXIFTOOL["Author"]
+        missing_path = os.path.join(TEST_FILES_DIR, "missing.jpg")
+        with open(jpg_path, "rb") as fh:
+            stream = io.BytesIO(fh.read())
+        results = exiftool.get_metadata_batch([jpg_path, missing_path, stream])
+        assert results[0]["Author"] == metadata["Author"]
+        assert results[1] is None
+        assert results[2]["Author"] == metadata["Author"]
+
+        # The process is restarted if it dies
+        exiftool._process.kill()
+        assert exiftool.get_metadata(jpg_path)["Author"] == metadata["Author"]
+    finally:
+        exiftool.close()
+
 
 def test_markitdown_deprecation() -> None:
     try:
@@ -292,6 +1808,126 @@ def test_markitdown_deprecation() -> None:
         pass
 
 
+class _ChatCompletionsHandler(http.server.BaseHTTPRequestHandler):
+    """A local OpenAI-compatible chat completions endpoint, which describes an image by the SHA-256
+    of its data URI, and records the images it was sent and the peak number of concurrent calls.
+    """
+
+    images = []
+    active = 0
+    peak = 0
+    lock = threading.Lock()
+
+    def do_POST(self):
+        cls = type(self)
+        with cls.lock:
+            cls.active += 1
+            cls.peak = max(cls.peak, cls.active)
+        try:
+            request = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+            url = request["messages"][0]["content"][1]["image_url"]["url"]
+            cls.images.append(base64.b64decode(url.split(",", 1)[1]))
+            time.sleep(0.2)
+            content = "An image " + hashlib.sha256(url.encode("utf-8")).hexdigest()[:8]
+            body = json.dumps(
+                {
+                    "id": "chatcmpl-test",
+                    "object": "chat.completion",
+                    "created": 0,
+                    "model": request["model"],
+                    "choices": [
+                        {
+                            "index": 0,
+                            "message": {"role": "assistant", "content": content},
+                            "finish_reason": "stop",
+                        }
+                    ],
+                }
+            ).encode("utf-8")
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+        finally:
+            with cls.lock:
+                cls.active -= 1
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.mark.skipif(
+    skip_openai,
+    reason="openai is not installed",
+)
+def test_markitdown_llm_captions() -> None:
+    server = http.server.ThreadingHTTPServer(("127.0.0.1", 0), _ChatCompletionsHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    client = openai.OpenAI(
+        base_url="http://127.0.0.1:%d/v1" % server.server_address[1], api_key="test"
+    )
+    images = _ChatCompletionsHandler.images
+    llm_path = os.path.join(TEST_FILES_DIR, "test_llm.jpg")
+    jpg_path = os.path.join(TEST_FILES_DIR, "test.jpg")
+    try:
+        markitdown = MarkItDown(llm_client=client, llm_model="test-model")
+        result = markitdown.convert(llm_path)
+        assert "# Description:\nAn image " in result.text_content
+        assert len(images) == 1
+
+        # Descriptions are cached by image, model and prompt
+        assert markitdown.convert(llm_path).text_content == result.text_content
+        assert len(images) == 1
+        markitdown.convert(llm_path, llm_prompt="Describe the chart.")
+        assert len(images) == 2
+
+        # Images can be downscaled before upload
+        markitdown.convert(llm_path, llm_max_image_size=256)
+        assert len(images) == 3
+        assert len(images[-1]) < len(images[0])
+        from PIL import Image
+
+        with Image.open(io.BytesIO(images[-1])) as img:
+            assert max(img.size) == 256
+
+        # Batches of images are described concurrently, in order, and identical images once
+        images.clear()
+        _ChatCompletionsHandler.peak = 0
+        markitdown = MarkItDown(llm_client=client, llm_model="test-model")
+        with open(jpg_path, "rb") as fh:
+            jpg_content = fh.read()
+        descriptions = markitdown.describe_images(
+            [llm_path, jpg_path, jpg_content, io.BytesIO(jpg_content)],
+            llm_concurrency=2,
+        )
+        assert len(images) == 2
+        assert _ChatCompletionsHandler.peak == 2
+        assert descriptions[1] == descriptions[2] == descriptions[3]
+        assert descriptions[0] == result.text_content.strip().split("\n")[-1]
+
+        # The images of a ZIP file are described ahead of their conversion
+        images.clear()
+        _ChatCompletionsHandler.peak = 0
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            zip_path = os.path.join(tmp_dir, "figures.zip")
+            with zipfile.ZipFile(zip_path, "w") as zip_file:
+                for i in range(4):
+                    zip_file.writestr(f"figure{i}.jpg", jpg_content + bytes([i]))
+            markitdown = MarkItDown(llm_client=client, llm_model="test-model")
+            result = markitdown.convert(zip_path, llm_concurrency=4)
+        assert len(images) == 4
+        assert _ChatCompletionsHandler.peak > 1
+        for i in range(4):
+            assert f"## File: figure{i}.jpg\n\n" in result.text_content
+        assert result.text_content.count("# Description:\nAn image ") == 4
+        assert markitdown._caption_cache.stats()["entries"] == 4
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
 @pytest.mark.skipif(
     skip_llm,
     reason="do not run llm tests without a key",
@@ -315,6 +1951,29 @@ if __name__ == "__main__":
     """Runs this file's tests from the command line."""
     test_markitdown_remote()
     test_markitdown_local()
+    test_markitdown_startup()
+    test_markitdown_dispatch()
+    test_markitdown_convert_iter()
+    test_markitdown_stream()
+    test_markitdown_cache()
+    test_markitdown_convert_urls()
+    test_markitdown_cli_batch()
+    test_markitdown_serve()
+    test_markitdown_pdf_parallel()
+    test_markitdown_pdf_engines()
+    test_markitdown_xlsx_streaming()
+    test_markitdown_pptx_parallel()
+    test_markitdown_zip()
+    test_markitdown_docx_streaming()
+    test_markitdown_image_policy()
+    test_markitdown_html_parsers()
+    test_markitdown_rss()
+    test_markitdown_ipynb()
+    test_markitdown_text_encodings()
+    test_markitdown_metrics()
+    test_markitdown_markdown_serializer()
+    test_markitdown_audio()
     test_markitdown_exiftool()
     test_markitdown_deprecation()
+    test_markitdown_llm_captions()
     test_markitdown_llm()